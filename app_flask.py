@@ -2,6 +2,8 @@
 슬랙 출석체크 자동화 - Flask 웹 애플리케이션
 더블클릭으로 실행 가능한 독립 실행형 프로그램
 """
+import atexit
+import os
 import sys
 import webbrowser
 import threading
@@ -21,11 +23,22 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Colorama 초기화 (Windows CMD 색상 지원)
 init(autoreset=True)
 
+# 로거 설정 (src 모듈 로그 → 콘솔, 모듈 import 시점 로그도 포함되도록 가장 먼저)
+# 모듈별 레벨: 환경 변수 LOG_LEVELS="parser=DEBUG,sheets_handler=WARNING"
+from src.utils import setup_logger, parse_module_levels
+setup_logger(module_levels=parse_module_levels(os.getenv('LOG_LEVELS', '')))
+
 from src.workspace_manager import WorkspaceManager
 from src.slack_handler import SlackHandler
 from src.sheets_handler import SheetsHandler, AttendanceStatus
 from src.parser import AttendanceParser
+from src.parse_memo import parse_memo
 from src.assignment_parser import AssignmentParser
+from src.roster_index import as_roster_index
+from src.binding_store import BindingStore
+from src.sheets_discovery import warm_up as warm_up_sheets
+from src import write_behind
+from src.sheets_outbox import replay_pending, REPLAY_INTERVAL_MINUTES
 from src.utils import parse_slack_thread_link, column_letter_to_index, get_next_column, column_index_to_letter
 
 # Blueprint import (리팩토링된 라우트)
@@ -34,10 +47,11 @@ from src.routes import (
     assignment_bp,
     workspace_bp,
     schedule_bp,
-    thread_bp
+    thread_bp,
+    onboarding_bp,
+    sheets_bp
 )
 from src.utils.error_handler import register_error_handlers
-import os
 import secrets
 
 # Flask 앱 초기화
@@ -62,6 +76,8 @@ app.register_blueprint(assignment_bp)
 app.register_blueprint(workspace_bp)
 app.register_blueprint(schedule_bp)
 app.register_blueprint(thread_bp)
+app.register_blueprint(onboarding_bp)
+app.register_blueprint(sheets_bp)
 
 # 워크스페이스 매니저 초기화
 workspace_manager = WorkspaceManager()
@@ -119,6 +135,7 @@ def get_scheduler_status():
 # - workspace_routes.py: 워크스페이스 관리 route
 # - schedule_routes.py: 스케줄 관리 route
 # - thread_routes.py: 스레드 검색 route
+# - onboarding_routes.py: 채널 멤버 일괄 매칭(바인딩) route
 
 
 def open_browser():
@@ -233,24 +250,19 @@ def check_attendance_job(workspace, schedule_item):
             print("✗ 출석 스레드를 찾을 수 없습니다.")
             return
 
-        # 3. 댓글 수집
-        replies = slack_handler.get_replies_with_user_info(workspace.slack_channel_id, thread_ts)
+        # 3. 댓글 수집 (파서가 선언한 정책으로 사용자별 필요한 댓글만 사용자 정보 조회)
+        parser = AttendanceParser(workspace.parser_profile)
+        replies = slack_handler.get_replies_with_user_info(
+            workspace.slack_channel_id,
+            thread_ts,
+            reply_policy=parser.REPLY_POLICY,
+            reply_filter=parser.is_candidate_reply
+        )
         if not replies:
             print("✗ 댓글을 가져올 수 없습니다.")
             return
 
-        # 4. 출석 파싱 (동명이인 정보 전달)
-        parser = AttendanceParser()
-        duplicate_names = workspace.duplicate_names if hasattr(workspace, 'duplicate_names') else {}
-        attendance_list = parser.parse_attendance_replies(replies, duplicate_names)
-
-        if not attendance_list:
-            print("✗ 출석한 학생이 없습니다.")
-            return
-
-        print(f"✓ 출석자 수: {len(attendance_list)}명")
-
-        # 5. 구글 시트 연결 (타임아웃 대비 최대 3회 재시도)
+        # 4. 구글 시트 연결 (타임아웃 대비 최대 3회 재시도)
         sheets_handler = SheetsHandler(
             credentials_path=workspace.credentials_path,
             spreadsheet_id=workspace.spreadsheet_id,
@@ -270,12 +282,31 @@ def check_attendance_job(workspace, schedule_item):
             print("✗ 구글 시트 연결 실패 (3회 시도 모두 실패)")
             return
 
-        # 6. 학생 명단 읽기
+        # 5. 학생 명단 읽기 (명단 색인: 영문 슬랙 이름 매칭용 로마자 색인 포함)
         students = sheets_handler.get_student_list(workspace.name_column, workspace.start_row)
         if not students:
             print("✗ 학생 명단을 읽을 수 없습니다.")
             return
 
+        roster = as_roster_index(students)
+        binding_store = BindingStore(workspace.path)
+
+        # 6. 출석 파싱 (동명이인 정보 + 학습된 User ID 바인딩 + 여러 이름 댓글용 명단 전달)
+        duplicate_names = workspace.duplicate_name_index
+        attendance_list = parser.parse_attendance_replies(
+            replies,
+            duplicate_names,
+            name_index=roster.name_index,
+            bindings=binding_store.get_valid_bindings(students),
+            roster=roster
+        )
+
+        if not attendance_list:
+            print("✗ 출석한 학생이 없습니다.")
+            return
+
+        print(f"✓ 출석자 수: {len(attendance_list)}명")
+
         # 7. 출석 매칭
         # 스케줄 아이템에서 열 정보 가져오기
         column_input = check_column
@@ -353,10 +384,13 @@ def check_attendance_job(workspace, schedule_item):
         updates = []
         matched_names = []
         unmatched_names = []
+        aliases = workspace.name_aliases
 
         for attendance in attendance_list:
-            name = attendance['name']
-            sheet_row = attendance.get('sheet_row')  # 동명이인인 경우 직접 지정된 행 번호
+            name = attendance.name
+            sheet_row = attendance.sheet_row  # 동명이인인 경우 직접 지정된 행 번호
+            # 별칭·띄어쓰기 차이는 명단 이름으로
+            resolved = roster.resolve(name, aliases) if sheet_row is None else None
 
             # 동명이인으로 직접 행 번호가 지정된 경우
             if sheet_row is not None:
@@ -367,8 +401,9 @@ def check_attendance_job(workspace, schedule_item):
                     'status': AttendanceStatus.PRESENT
                 })
                 matched_names.append(name)
-            elif name in students:
-                row = students[name]
+            elif resolved is not None:
+                name = resolved
+                row = roster[name]
                 updates.append({
                     'name': name,
                     'row': row,
@@ -379,11 +414,15 @@ def check_attendance_job(workspace, schedule_item):
             else:
                 unmatched_names.append(name)
 
-        # 8. 미출석자 처리
-        absent_names = [name for name in students.keys() if name not in matched_names]
+        # 확실한 매칭은 바인딩으로 학습
+        binding_store.learn(attendance_list, students)
+        binding_store.save()
+
+        # 8. 미출석자 처리 (출석 이름은 집합으로 한 번만 변환해 명단 크기에 선형)
+        absent_names = roster.absent_names(matched_names)
 
         for name in absent_names:
-            row = students[name]
+            row = roster[name]
             updates.append({
                 'name': name,
                 'row': row,
@@ -468,6 +507,15 @@ def setup_scheduler():
     # 오늘 요일 확인 (mon, tue, wed, thu, fri, sat, sun)
     today_day = datetime.now(KST).strftime('%a').lower()  # 'mon', 'tue', etc.
 
+    # 보내지 못한 시트 쓰기 주기 재전송 (아웃박스)
+    scheduler.add_job(
+        func=replay_pending,
+        trigger='interval',
+        minutes=REPLAY_INTERVAL_MINUTES,
+        id='sheets_outbox_replay',
+        replace_existing=True
+    )
+
     workspaces = workspace_manager.get_all_workspaces()
 
     for workspace in workspaces:
@@ -601,6 +649,33 @@ if __name__ == '__main__':
         else:
             print(f"✓ {len(workspaces)}개의 워크스페이스를 찾았습니다")
 
+            # 출석 파서 프로필 미리 컴파일 (같은 내용의 프로필은 한 번만 컴파일되어 공유)
+            compiled_keys = set()
+            for ws in workspaces:
+                profile = ws.parser_profile
+                if profile.key in compiled_keys:
+                    print(f"  - {ws.display_name}: 파서 프로필 {profile.key} (공유)")
+                else:
+                    compiled_keys.add(profile.key)
+                    print(f"  - {ws.display_name}: 파서 프로필 {profile.key} (컴파일 {profile.compile_ms:.2f}ms)")
+
+        # 댓글 파싱 메모 (PARSE_MEMO_FILE 지정 시 이전 실행의 메모를 불러와 종료할 때 저장)
+        memo_file = os.getenv('PARSE_MEMO_FILE')
+        if memo_file:
+            loaded = parse_memo.load(memo_file)
+            atexit.register(parse_memo.save, memo_file)
+            print(f"✓ 파싱 메모 {loaded}개 불러옴 ({memo_file})")
+
+        # Sheets 디스커버리 문서·리소스 미리 준비 (첫 출석 체크의 서비스 생성 지연 제거)
+        threading.Thread(target=warm_up_sheets, name='sheets-warm-up', daemon=True).start()
+
+        # 이전 실행에서 보내지 못한 시트 쓰기 재전송 (아웃박스)
+        threading.Thread(target=partial(replay_pending, min_age=0), name='sheets-outbox-replay',
+                         daemon=True).start()
+
+        # 종료 시 쓰기 버퍼에 남은 출석 셀 기록
+        atexit.register(write_behind.close_all)
+
         print()
         print("=" * 50)
         print("스케줄러 초기화 중...")
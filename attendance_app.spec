@@ -1,7 +1,20 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
 
 block_cipher = None
 
+# googleapiclient 패키지의 디스커버리 문서 (API 수백 개, 수십 MB) 중 Sheets만 포함
+# (앱은 src/discovery/sheets.v4.json을 사용하고, 패키지 문서는 번들 문서가 없을 때의 예비용)
+DISCOVERY_CACHE_DIR = os.path.join('googleapiclient', 'discovery_cache', 'documents')
+KEEP_DISCOVERY_DOCUMENTS = {'sheets.v4.json'}
+
+
+def keep_data(dest):
+    dest = os.path.normpath(dest)
+    if os.path.dirname(dest) != DISCOVERY_CACHE_DIR:
+        return True
+    return os.path.basename(dest) in KEEP_DISCOVERY_DOCUMENTS
+
 a = Analysis(
     ['app_flask.py'],
     pathex=[],
@@ -32,6 +45,8 @@ a = Analysis(
         'google.auth.transport',
         'googleapiclient',
         'googleapiclient.discovery',
+        'googleapiclient.discovery_cache',
+        'requests',
         'google.auth.transport.requests',
         'google_auth_httplib2',
         'httplib2',
@@ -48,6 +63,8 @@ a = Analysis(
     noarchive=False,
 )
 
+a.datas = [entry for entry in a.datas if keep_data(entry[0])]
+
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
 exe = EXE(
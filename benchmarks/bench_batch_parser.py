@@ -0,0 +1,88 @@
+"""
+순차 파싱 vs pandas 일괄 파싱 벤치마크
+
+댓글 수를 늘려 가며 AttendanceParser.parse_attendance_replies와
+BatchAttendanceParser.parse_batch의 시간을 비교하고 교차점을 출력합니다.
+(결과가 같은지도 함께 확인, BatchAttendanceParser.BATCH_MIN_REPLIES 조정용)
+순차 파서는 공유 파싱 메모를 끈 경우(첫 실행)와 켠 경우(같은 스레드 재실행, 운영 기본값)를 함께 측정합니다.
+
+실행: python benchmarks/bench_batch_parser.py
+"""
+import contextlib
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.parser import AttendanceParser
+from src.parse_memo import ParseMemo
+from src.batch_parser import BatchAttendanceParser
+from src.records import Reply
+
+SIZES = [50, 100, 250, 500, 1000, 2000, 5000, 10000, 20000, 50000]
+REPEAT = 3
+
+
+def make_name(uid: int) -> str:
+    """사용자 번호로 겹치지 않는 세 글자 한글 이름 생성"""
+    return ''.join(chr(0xAC00 + (uid * 5 + offset) % 11172) for offset in (0, 3001, 7001))
+
+
+def make_replies(count: int):
+    """출석 댓글 + 잡담 + 키워드만 있는 댓글이 섞인 스레드"""
+    user_count = max(count // 2, 1)
+    profiles = {
+        uid: {'display_name': f'{make_name(uid)}/컴공', 'real_name': make_name(uid)}
+        for uid in range(user_count)
+    }
+    templates = ['{name}/출석했습니다', '{name} 출석', '출석합니다', '질문 있어요', '{name}/']
+
+    replies = []
+    for i in range(count):
+        uid = (i * 7) % user_count
+        text = templates[i % len(templates)].format(name=make_name(uid))
+        replies.append(Reply(text, f'U{uid:08d}', profiles[uid], f'{i}'))
+    return replies
+
+
+def best_time(func, replies):
+    """REPEAT회 중 최단 시간 (파싱 로그 출력은 버림)"""
+    best = float('inf')
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            result = func(replies)
+            best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == '__main__':
+    # 메모 끔: 모든 댓글 분석 (첫 실행과 같음) / 공유 메모: 같은 스레드 재실행 (운영 기본값)
+    sequential = AttendanceParser(memo=ParseMemo(maxsize=0))
+    memoized = AttendanceParser()
+    batch = BatchAttendanceParser()
+    crossover = None
+
+    print(f"{'댓글 수':>8} | {'순차(ms)':>10} | {'순차+메모(ms)':>13} | {'일괄(ms)':>10} | 결과 일치")
+    for size in SIZES:
+        replies = make_replies(size)
+        seq_time, seq_result = best_time(sequential.parse_attendance_replies, replies)
+        memo_time, _ = best_time(memoized.parse_attendance_replies, replies)
+        batch_time, batch_result = best_time(batch.parse_batch, replies)
+
+        same = [(r.name, r.source, r.sheet_row) for r in seq_result] == \
+               [(r.name, r.source, r.sheet_row) for r in batch_result]
+        print(f"{size:>8} | {seq_time * 1000:>10.2f} | {memo_time * 1000:>13.2f} | {batch_time * 1000:>10.2f} | "
+              f"{'O' if same else 'X'}")
+
+        if crossover is None and batch_time < seq_time:
+            crossover = size
+
+    if crossover:
+        print(f"\n교차점: 댓글 약 {crossover}개부터 일괄 파싱이 메모 없는 순차 파싱보다 빠름")
+    else:
+        print("\n측정 범위에서 일괄 파싱이 더 빠른 구간 없음")
@@ -0,0 +1,90 @@
+"""
+파싱 루프 로그 비용 벤치마크
+
+댓글마다 로그를 출력하던 기존 동작(parser 로거 DEBUG)과
+기본 설정(INFO, 댓글별 로그는 레벨 확인만 하고 건너뜀 + 집계)을 비교합니다.
+
+실행: python benchmarks/bench_parse_logging.py [댓글 수] [--console]
+  --console: 로그를 실제 콘솔(stdout)로 출력 (기본은 os.devnull, 콘솔 출력 비용 제외)
+"""
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.parser import AttendanceParser
+from src.assignment_parser import AssignmentParser
+from src.records import Reply
+from src.utils.common import setup_logger
+
+REPEAT = 3
+
+
+def make_name(uid: int) -> str:
+    """사용자 번호로 겹치지 않는 세 글자 한글 이름 생성"""
+    return ''.join(chr(0xAC00 + (uid * 5 + offset) % 11172) for offset in (0, 3001, 7001))
+
+
+def make_replies(count: int):
+    """출석 댓글 + 중복 + 키워드만 있는 댓글이 섞인 스레드"""
+    user_count = max(count // 2, 1)
+    profiles = {
+        uid: {'display_name': f'{make_name(uid)}/컴공', 'real_name': make_name(uid)}
+        for uid in range(user_count)
+    }
+    templates = ['{name}/출석했습니다', '{name} 출석', '출석합니다', '질문 있어요']
+
+    return [
+        Reply(templates[i % len(templates)].format(name=make_name((i * 7) % user_count)),
+              f'U{(i * 7) % user_count:08d}', profiles[(i * 7) % user_count], f'{i}')
+        for i in range(count)
+    ]
+
+
+def best_time(func, replies):
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(replies)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == '__main__':
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    count = int(args[0]) if args else 5000
+    to_console = '--console' in sys.argv
+
+    setup_logger()
+    package_logger = logging.getLogger('src')
+    if not to_console:
+        sink = logging.StreamHandler(open(os.devnull, 'w', encoding='utf-8'))
+        package_logger.handlers = [sink]
+
+    replies = make_replies(count)
+    attendance_parser = AttendanceParser()
+    assignment_parser = AssignmentParser()
+
+    results = {}
+    for label, level in (('댓글별 로그 (DEBUG)', logging.DEBUG), ('집계만 (INFO)', logging.INFO)):
+        package_logger.setLevel(level)
+        for handler in package_logger.handlers:
+            handler.setLevel(level)
+        results[label] = (
+            best_time(attendance_parser.parse_attendance_replies, replies),
+            best_time(assignment_parser.parse_assignment_replies, replies),
+        )
+
+    print(f"\n=== 댓글 {count}개 ({'콘솔' if to_console else 'devnull'} 출력) ===")
+    print(f"{'모드':<20} | {'출석 파싱(ms)':>13} | {'과제 파싱(ms)':>13}")
+    for label, (attendance_time, assignment_time) in results.items():
+        print(f"{label:<20} | {attendance_time * 1000:>13.2f} | {assignment_time * 1000:>13.2f}")
+
+    (debug_att, debug_asg), (info_att, info_asg) = results.values()
+    print(f"\n속도 향상: 출석 {debug_att / info_att:.1f}배, 과제 {debug_asg / info_asg:.1f}배")
+    print(f"출석 파싱 집계: {dict(attendance_parser.stats)}")
@@ -0,0 +1,103 @@
+"""
+댓글 파싱 메모 벤치마크
+
+같은 스레드를 여러 번 처리할 때(출석 체크 → 재실행 → 분석) 운영 기본값인 프로세스 공유 메모(parse_memo)로
+첫 실행(모든 댓글 분석 + 메모 저장)과 재실행(실행마다 새 AttendanceParser, 공유 메모 재사용),
+메모를 끈 경우, 파일로 저장했다가 불러온 메모의 파싱 시간과 공유 메모가 붙잡는 메모리를 비교합니다.
+
+실행: python benchmarks/bench_parse_memo.py [댓글 수]
+"""
+import gc
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.parser import AttendanceParser
+from src.parse_memo import ParseMemo, parse_memo
+from src.records import Reply
+
+REPEAT = 3
+
+
+def make_name(uid: int) -> str:
+    """사용자 번호로 겹치지 않는 세 글자 한글 이름 생성"""
+    return ''.join(chr(0xAC00 + (uid * 5 + offset) % 11172) for offset in (0, 3001, 7001))
+
+
+def make_replies(count: int):
+    """출석 댓글 스레드 (여러 이름 댓글, 같은 텍스트의 댓글, 수정된 댓글 포함)"""
+    user_count = max(count // 2, 1)
+    profiles = {
+        uid: {'display_name': f'{make_name(uid)}/컴공', 'real_name': make_name(uid)}
+        for uid in range(user_count)
+    }
+    templates = ['{name}/출석했습니다', '{name} 출석', '출석합니다', '{name}/{other}/ 출석', '질문 있어요']
+
+    replies = []
+    for i in range(count):
+        uid = (i * 7) % user_count
+        text = templates[i % len(templates)].format(name=make_name(uid), other=make_name((uid + 1) % user_count))
+        edited_ts = f'1700000100.{i:06d}' if i % 10 == 0 else ''
+        replies.append(Reply(text, f'U{uid:08d}', profiles[uid], f'1700000000.{i:06d}', edited_ts))
+    roster = {make_name(uid): uid for uid in range(user_count)}
+    return replies, roster
+
+
+def timed(parser, replies, roster):
+    start = time.perf_counter()
+    parser.parse_attendance_replies(replies, roster=roster)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    logging.disable(logging.INFO)
+
+    replies, roster = make_replies(count)
+
+    # 메모 끔: 메모 조회·저장 비용 없이 모든 댓글 분석
+    off = min(timed(AttendanceParser(memo=ParseMemo(maxsize=0)), replies, roster) for _ in range(REPEAT))
+
+    # 공유 메모 첫 실행: 비어 있는 공유 메모에 분석 결과 저장 (스레드 안에서 같은 텍스트만 재사용)
+    def cold_run():
+        parse_memo.clear()
+        return timed(AttendanceParser(), replies, roster)
+    cold = min(cold_run() for _ in range(REPEAT))
+
+    # 같은 프로세스에서 재실행: 라우트·스케줄러처럼 실행마다 새 파서, 공유 메모 재사용
+    warm = min(timed(AttendanceParser(), replies, roster) for _ in range(REPEAT))
+
+    # 공유 메모가 유지하는 메모리
+    parse_memo.clear()
+    gc.collect()
+    tracemalloc.start()
+    timed(AttendanceParser(), replies, roster)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # 재시작 후: 파일에 저장한 메모를 불러와 사용
+    with tempfile.TemporaryDirectory() as temp_dir:
+        memo_file = Path(temp_dir) / 'parse_memo.json'
+        parse_memo.save(memo_file)
+        start = time.perf_counter()
+        restored = ParseMemo()
+        restored.load(memo_file)
+        load_time = time.perf_counter() - start
+        file_size = memo_file.stat().st_size
+    persisted = min(timed(AttendanceParser(memo=restored), replies, roster) for _ in range(REPEAT))
+
+    print(f"=== 댓글 {count}개 ===")
+    print(f"{'메모 끔':<22} | {off * 1000:8.2f} ms")
+    print(f"{'공유 메모 첫 실행':<22} | {cold * 1000:8.2f} ms | 메모 끔 대비 {off / cold:.2f}배 (스레드 안 같은 텍스트만 재사용)")
+    print(f"{'공유 메모 재실행':<22} | {warm * 1000:8.2f} ms | 메모 끔 대비 {off / warm:.2f}배")
+    print(f"{'저장된 메모 (재시작)':<22} | {persisted * 1000:8.2f} ms | 불러오기 {load_time * 1000:.2f} ms, "
+          f"파일 {file_size / 1024:.1f} KiB")
+    print(f"공유 메모 유지 메모리: {retained / 1024:.0f} KiB ({len(parse_memo)}개, 최대 {parse_memo.maxsize}개)")
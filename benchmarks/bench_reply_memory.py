@@ -0,0 +1,117 @@
+"""
+댓글/출석 레코드 메모리 벤치마크 (tracemalloc)
+
+기존 방식(댓글마다 dict, 출석자마다 text/user_info/timestamp를 복사한 dict)과
+__slots__ 레코드(Reply/AttendanceRecord, User ID 인터닝, 프로필 공유)를 비교합니다.
+
+실행: python benchmarks/bench_reply_memory.py [댓글 수] [사용자 수]
+"""
+import contextlib
+import os
+import sys
+import tracemalloc
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.parser import AttendanceParser
+from src.records import Reply
+
+
+def make_name(uid: int) -> str:
+    """사용자 번호로 겹치지 않는 세 글자 한글 이름 생성"""
+    return ''.join(chr(0xAC00 + (uid * 5 + offset) % 11172) for offset in (0, 3001, 7001))
+
+
+def make_raw_replies(reply_count: int, user_count: int):
+    """conversations.replies 응답을 흉내낸 원본 댓글 (User ID는 매번 새 문자열)"""
+    raw = []
+    for i in range(reply_count):
+        uid = i % user_count
+        raw.append({
+            'user': ''.join(['U', f'{uid:010d}']),
+            'text': f'{make_name(uid)}/출석했습니다',
+            'ts': f'1700000000.{i:06d}',
+        })
+    return raw
+
+
+def make_profiles(user_count: int):
+    """SlackHandler.user_cache와 같은 사용자 정보 캐시"""
+    return {
+        f'U{uid:010d}': {
+            'id': f'U{uid:010d}',
+            'name': f'student{uid}',
+            'real_name': make_name(uid),
+            'display_name': f'{make_name(uid)}/컴공',
+        }
+        for uid in range(user_count)
+    }
+
+
+def legacy_pipeline(raw, profiles):
+    """기존 dict 기반 파이프라인 (댓글 dict + 출석자 dict 복사)"""
+    parser = AttendanceParser()
+    replies = [{
+        'user_id': r['user'],
+        'user_info': profiles.get(r['user']),
+        'text': r['text'],
+        'timestamp': r['ts'],
+    } for r in raw]
+
+    attendance = []
+    seen_names = set()
+    for reply in replies:
+        name = parser.extract_name_from_text(reply['text'])
+        if name and name not in seen_names:
+            seen_names.add(name)
+            attendance.append({
+                'name': name,
+                'text': reply['text'],
+                'user_id': reply['user_id'],
+                'user_info': reply['user_info'],
+                'timestamp': reply['timestamp'],
+                'source': 'text_pattern',
+                'sheet_row': None,
+                'confident': True,
+            })
+    return replies, attendance
+
+
+def slotted_pipeline(raw, profiles):
+    """__slots__ 레코드 파이프라인 (parse_attendance_replies 그대로 사용)"""
+    parser = AttendanceParser()
+    replies = [Reply(r['text'], r['user'], profiles.get(r['user']), r['ts']) for r in raw]
+    attendance = parser.parse_attendance_replies(replies)
+    return replies, attendance
+
+
+def measure(pipeline, raw, profiles):
+    """파이프라인 실행 후 남아 있는 메모리와 최대 메모리 (파싱 로그 출력은 버림)"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        result = pipeline(raw, profiles)
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    retained = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return result, retained, peak
+
+
+if __name__ == '__main__':
+    reply_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    user_count = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+
+    raw = make_raw_replies(reply_count, user_count)
+    profiles = make_profiles(user_count)
+
+    print(f"=== 댓글 {reply_count}개 / 사용자 {user_count}명 ===")
+    for label, pipeline in (('dict', legacy_pipeline), ('slots', slotted_pipeline)):
+        result, retained, peak = measure(pipeline, raw, profiles)
+        print(f"  {label:<6} 출석 {len(result[1]):>5}명 | "
+              f"유지 메모리 {retained / 1024:8.1f} KiB | 최대 {peak / 1024:8.1f} KiB")
+        del result
@@ -0,0 +1,81 @@
+"""
+명단 매칭 벤치마크 (리스트 포함 검사 vs RosterIndex)
+
+미출석자(name not in matched_names 리스트), 과제 제출/미제출 분류(name in submitted 리스트 두 번),
+과제 시트 기록(batch_update_assignment의 name in submitted)을
+기존 리스트 방식과 RosterIndex(집합 한 번 변환)로 비교합니다.
+
+실행: python benchmarks/bench_roster_index.py [명단 크기]
+"""
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.roster_index import RosterIndex
+
+REPEAT = 3
+PRESENT_RATIOS = (0.5, 0.9)
+
+
+def make_name(uid: int) -> str:
+    """사용자 번호로 겹치지 않는 세 글자 한글 이름 생성"""
+    return ''.join(chr(0xAC00 + (uid * 5 + offset) % 11172) for offset in (0, 3001, 7001))
+
+
+def best_time(func):
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def list_attendance(students, matched_names):
+    return [name for name in students.keys() if name not in matched_names]
+
+
+def list_assignment(students, submitted):
+    submitted_list = [name for name in students.keys() if name in submitted]
+    not_submitted_list = [name for name in students.keys() if name not in submitted]
+    marks = [name in submitted for name in students]  # batch_update_assignment
+    return submitted_list, not_submitted_list, marks
+
+
+def index_attendance(students, matched_names):
+    return RosterIndex(students).absent_names(matched_names)
+
+
+def index_assignment(students, submitted):
+    roster = RosterIndex(students)
+    submitted = set(submitted)
+    submitted_list, not_submitted_list = roster.split(submitted)
+    marks = [name in submitted for name in roster]
+    return submitted_list, not_submitted_list, marks
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    students = {make_name(i): i + 4 for i in range(size)}
+    names = list(students)
+
+    print(f"\n=== 명단 {size}명 (RosterIndex 생성 시간 포함) ===")
+    print(f"{'출석률':>6} | {'작업':<10} | {'리스트(ms)':>11} | {'RosterIndex(ms)':>15} | {'배율':>7}")
+
+    for ratio in PRESENT_RATIOS:
+        # 댓글 순서처럼 섞인 출석자 리스트
+        present = names[::-1][:int(size * ratio)]
+
+        for label, list_func, index_func in (
+            ('미출석자', list_attendance, index_attendance),
+            ('과제 분류', list_assignment, index_assignment),
+        ):
+            list_time, list_result = best_time(lambda: list_func(students, present))
+            index_time, index_result = best_time(lambda: index_func(students, present))
+            assert list_result == index_result, label
+            print(f"{ratio:>6.0%} | {label:<10} | {list_time * 1000:>11.2f} | "
+                  f"{index_time * 1000:>15.2f} | {list_time / index_time:>6.0f}x")
@@ -0,0 +1,99 @@
+"""
+Sheets 서비스 생성 벤치마크 (build() vs 번들 디스커버리 문서)
+
+- 새 프로세스: 모듈 import부터 첫 values 리소스까지 (EXE 시작 직후 첫 출석 체크와 같은 조건)
+- 같은 프로세스에서 반복: connect()마다 서비스와 리소스를 만드는 비용
+  - build: build('sheets', 'v4') + spreadsheets().values() (기존 connect)
+  - cached: build_sheets_service() + service_resources() (번들 문서, 전송별 서비스·리소스 캐시)
+
+네트워크 요청은 하지 않습니다 (인증 정보는 익명).
+
+실행: python benchmarks/bench_sheets_startup.py [새 프로세스 반복 수] [connect 반복 수]
+"""
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# 새 프로세스에서 실행할 코드 (import 포함 시간 측정)
+COLD_SCRIPTS = {
+    'build': """
+import time
+start = time.perf_counter()
+from google.auth.credentials import AnonymousCredentials
+from googleapiclient.discovery import build
+service = build('sheets', 'v4', credentials=AnonymousCredentials())
+service.spreadsheets().values()
+print((time.perf_counter() - start) * 1000)
+""",
+    'cached': """
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+from google.auth.credentials import AnonymousCredentials
+from src.sheets_discovery import build_sheets_service, service_resources
+service_resources(build_sheets_service(credentials=AnonymousCredentials()))
+print((time.perf_counter() - start) * 1000)
+""",
+}
+
+
+def cold_start(label: str, repeat: int) -> float:
+    """새 프로세스에서 첫 values 리소스까지 걸린 시간 중앙값 (ms)"""
+    script = COLD_SCRIPTS[label].format(root=str(project_root))
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+        times.append(float(output.stdout.strip().splitlines()[-1]))
+    return statistics.median(times)
+
+
+def warm_connects(repeat: int):
+    """같은 프로세스에서 connect() 상당 작업 반복 시 호출당 시간 (ms)"""
+    from google.auth.credentials import AnonymousCredentials
+    from googleapiclient.discovery import build
+
+    from src.sheets_discovery import build_sheets_service, service_resources
+    from src.sheets_transport import PooledHttp
+
+    credentials = AnonymousCredentials()
+    http = PooledHttp(credentials)
+
+    def build_connect():
+        build('sheets', 'v4', credentials=credentials).spreadsheets().values()
+
+    def cached_connect():
+        service_resources(build_sheets_service(http=http))
+
+    results = {}
+    for label, func in (('build', build_connect), ('cached', cached_connect)):
+        func()  # 첫 호출 (문서 로드) 제외
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        results[label] = (time.perf_counter() - start) / repeat * 1000
+    http.close()
+    return results
+
+
+if __name__ == '__main__':
+    cold_repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    warm_repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    print(f"\n=== 새 프로세스 시작 → 첫 values 리소스 (중앙값, {cold_repeat}회) ===")
+    cold = {label: cold_start(label, cold_repeat) for label in COLD_SCRIPTS}
+    for label, ms in cold.items():
+        print(f"{label:<8} | {ms:>8.1f}ms")
+
+    print(f"\n=== 같은 프로세스에서 connect() 반복 ({warm_repeat}회) ===")
+    warm = warm_connects(warm_repeat)
+    for label, ms in warm.items():
+        print(f"{label:<8} | {ms:>8.3f}ms/회")
+
+    print(f"\n속도 향상: 시작 {cold['build'] / cold['cached']:.1f}배, "
+          f"반복 connect {warm['build'] / warm['cached']:.0f}배")
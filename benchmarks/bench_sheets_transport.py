@@ -0,0 +1,160 @@
+"""
+Sheets API 전송 방식 벤치마크 (httplib2 vs AuthorizedSession 연결 풀)
+
+순차 호출과 동시 호출(스케줄러 작업 여러 개)을 비교합니다.
+서비스 생성(디스커버리 문서 파싱) 비용은 빼고 전송 비용만 비교하도록 서비스는 미리 만들어 둡니다.
+- httplib2: 스레드 안전하지 않으므로 스레드마다 서비스를 따로 만듦
+- session: 인증 파일별 공유 연결 풀과 서비스 하나를 모든 스레드가 사용
+
+실행:
+  python benchmarks/bench_sheets_transport.py <인증 파일> <스프레드시트 ID> [시트 이름] [호출 수] [스레드 수]
+  python benchmarks/bench_sheets_transport.py --local [호출 수] [스레드 수]
+    --local: 로컬 HTTP 서버(응답 지연 20ms)로 측정 (TLS 핸드셰이크가 없어 실제보다 차이가 작게 나옴)
+"""
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import google_auth_httplib2
+import httplib2
+from google.auth.credentials import AnonymousCredentials
+from googleapiclient.discovery import build
+
+from src.sheets_handler import SheetsHandler
+from src.sheets_transport import PooledHttp, TRANSPORT_SESSION, TRANSPORT_HTTPLIB2, close_shared_http
+
+LOCAL_LATENCY = 0.02
+
+
+class _LocalSheetsServer(BaseHTTPRequestHandler):
+    """values.get 응답만 흉내 내는 로컬 서버 (keep-alive)"""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        time.sleep(LOCAL_LATENCY)
+        body = json.dumps({'values': [['홍길동', '김철수', '이영희']]}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def handler_factory(create, transport: str):
+    """
+    전송 방식별 핸들러 공급 함수
+
+    session은 핸들러 하나를 모든 스레드가 공유하고, httplib2는 스레드마다 하나씩 만듭니다.
+    """
+    if transport == TRANSPORT_SESSION:
+        shared = create()
+        return lambda: shared
+
+    local = threading.local()
+
+    def factory():
+        if not hasattr(local, 'handler'):
+            local.handler = create()
+        return local.handler
+
+    return factory
+
+
+def local_handler_factory(endpoint: str, transport: str):
+    """로컬 서버용 핸들러 공급 함수"""
+    def create():
+        if transport == TRANSPORT_SESSION:
+            http = PooledHttp(AnonymousCredentials())
+        else:
+            http = google_auth_httplib2.AuthorizedHttp(AnonymousCredentials(), http=httplib2.Http())
+        handler = SheetsHandler('', 'local', '출석현황')
+        handler.service = build('sheets', 'v4', http=http, client_options={'api_endpoint': endpoint},
+                                static_discovery=True)
+        return handler
+
+    return handler_factory(create, transport)
+
+
+def real_handler_factory(credentials_path: str, spreadsheet_id: str, sheet_name: str, transport: str):
+    """실제 스프레드시트용 핸들러 공급 함수"""
+    def create():
+        handler = SheetsHandler(credentials_path, spreadsheet_id, sheet_name)
+        handler.connect(transport=transport)
+        return handler
+
+    return handler_factory(create, transport)
+
+
+def run(factory, range_name: str, calls: int, threads: int) -> float:
+    """calls회 read_range 호출 시간 (threads=1이면 순차)"""
+    def one_call(_):
+        factory().read_range(range_name)
+
+    start = time.perf_counter()
+    if threads == 1:
+        for i in range(calls):
+            one_call(i)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(one_call, range(calls)))
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    args = [arg for arg in sys.argv[1:] if arg != '--local']
+    local = '--local' in sys.argv
+
+    if local:
+        calls = int(args[0]) if args else 100
+        threads = int(args[1]) if len(args) > 1 else 8
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _LocalSheetsServer)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        endpoint = f'http://127.0.0.1:{server.server_address[1]}'
+        factories = {transport: local_handler_factory(endpoint, transport)
+                     for transport in (TRANSPORT_HTTPLIB2, TRANSPORT_SESSION)}
+        range_name = '출석현황!A5:A'
+        target = f'로컬 서버 (지연 {LOCAL_LATENCY * 1000:.0f}ms)'
+    else:
+        if len(args) < 2:
+            print(__doc__)
+            sys.exit(1)
+        credentials_path, spreadsheet_id = args[0], args[1]
+        sheet_name = args[2] if len(args) > 2 else '출석현황'
+        calls = int(args[3]) if len(args) > 3 else 30
+        threads = int(args[4]) if len(args) > 4 else 4
+        factories = {transport: real_handler_factory(credentials_path, spreadsheet_id, sheet_name, transport)
+                     for transport in (TRANSPORT_HTTPLIB2, TRANSPORT_SESSION)}
+        range_name = f'{sheet_name}!A1:A1'
+        target = f'스프레드시트 {spreadsheet_id}'
+
+    print(f"\n=== {target}, 호출 {calls}회, 동시 {threads}스레드 ===")
+    print(f"{'전송':<10} | {'순차(ms/호출)':>14} | {'동시(ms/호출)':>14}")
+
+    results = {}
+    for transport, factory in factories.items():
+        run(factory, range_name, threads, threads)  # 스레드별 서비스·인증 준비 (측정 제외)
+        sequential = run(factory, range_name, calls, 1)
+        concurrent = run(factory, range_name, calls, threads)
+        results[transport] = (sequential, concurrent)
+        print(f"{transport:<10} | {sequential / calls * 1000:>14.2f} | {concurrent / calls * 1000:>14.2f}")
+
+    (old_seq, old_con), (new_seq, new_con) = results[TRANSPORT_HTTPLIB2], results[TRANSPORT_SESSION]
+    print(f"\n속도 향상: 순차 {old_seq / new_seq:.1f}배, 동시 {old_con / new_con:.1f}배")
+
+    if local:
+        server.shutdown()
+    else:
+        close_shared_http()
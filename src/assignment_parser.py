@@ -2,30 +2,66 @@
 과제 제출 파싱 모듈
 슬랙 댓글에서 과제 제출자 정보를 추출합니다.
 """
-from typing import List, Dict, Set
+import logging
+import sys
+from collections import Counter
+from typing import List, Dict, Optional, Set
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.transliteration import TransliterationIndex
+from src.records import Reply
+
+logger = logging.getLogger(__name__)
 
 
 class AssignmentParser:
     """과제 제출 체크 파서"""
 
-    def parse_assignment_replies(self, replies: List[Dict]) -> List[str]:
+    # 댓글 선택 정책 (SlackHandler.get_replies_with_user_info에 전달)
+    # 제출 여부는 사용자별 댓글 1개로 충분하므로 첫 댓글만 사용
+    REPLY_POLICY = 'first'
+
+    def __init__(self):
+        """AssignmentParser 초기화"""
+        # 마지막 파싱 집계 (댓글별 로그 대신 실행 결과 요약에 포함)
+        self.stats: Counter = Counter()
+
+    def is_candidate_reply(self, text: str) -> bool:
+        """과제 제출 댓글은 내용과 관계없이 모두 대상"""
+        return True
+
+    def parse_assignment_replies(
+        self,
+        replies: List[Reply],
+        name_index: Optional[TransliterationIndex] = None
+    ) -> List[str]:
         """
         과제 제출자 이름 수집
         - 스레드에 댓글 1번 이상 작성한 사람 모두 수집
         - 슬랙 표시 이름(display_name) 사용
 
         Args:
-            replies (List[Dict]): 슬랙 댓글 리스트 (user_info 포함)
+            replies (List[Reply]): 슬랙 댓글 리스트 (user_info 포함)
+            name_index (TransliterationIndex): 명단 이름의 로마자 표기 색인
+                슬랙 이름이 영문("Gildong Hong")일 때 명단 이름("홍길동")으로 변환
 
         Returns:
             List[str]: 제출자 이름 리스트 (중복 제거)
         """
-        print(f"\n[과제 파싱] 과제 제출자 파싱 중...")
+        logger.info("\n[과제 파싱] 과제 제출자 파싱 중... (%s개)", len(replies))
+
+        # 댓글별 로그는 DEBUG에서만 (루프 밖에서 한 번만 레벨 확인)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        stats = Counter(replies=len(replies))
 
         submitted_names: Set[str] = set()
 
         for reply in replies:
-            user_info = reply.get('user_info')
+            user_info = reply.user_info
 
             if user_info:
                 display_name = user_info.get('display_name', '')
@@ -35,15 +71,29 @@ class AssignmentParser:
                     display_name = user_info.get('real_name', '')
 
                 if display_name:
-                    # "홍길동/클스학과" → "홍길동" 추출
-                    name_only = self._extract_name(display_name)
+                    # 영문 슬랙 이름이면 로마자 표기 색인으로 명단 이름 찾기
+                    name_only = name_index.lookup_profile(user_info) if name_index is not None else None
+
+                    if not name_only:
+                        # "홍길동/클스학과" → "홍길동" 추출
+                        name_only = self._extract_name(display_name)
 
                     if name_only:
-                        submitted_names.add(name_only)
-                        print(f"  ✓ {name_only} - 과제 제출 확인")
+                        if name_only in submitted_names:
+                            stats['duplicate_reply'] += 1
+                        else:
+                            submitted_names.add(name_only)
+                            if debug:
+                                logger.debug("  ✓ %s - 과제 제출 확인", name_only)
+                        continue
+
+            stats['no_profile'] += 1
 
         result = list(submitted_names)
-        print(f"\n✓ 과제 파싱 완료: {len(result)}명")
+        stats['submitted'] = len(result)
+        self.stats = stats
+        logger.info("\n✓ 과제 파싱 완료: %s명 (댓글 %s개, 중복 %s개, 이름 없음 %s개)",
+                    len(result), stats['replies'], stats['duplicate_reply'], stats['no_profile'])
 
         return result
 
@@ -107,32 +157,22 @@ class AssignmentParser:
             'submitted_count': submitted_count,
             'not_submitted_count': not_submitted_count,
             'submission_rate': round(submission_rate, 1),
-            'submitted_names': sorted(submitted_list)  # 가나다순 정렬
+            'submitted_names': sorted(submitted_list),  # 가나다순 정렬
+            'parse_stats': dict(self.stats)  # 마지막 파싱 집계 (중복, 이름 없음 등)
         }
 
 
 # 테스트 코드
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     parser = AssignmentParser()
 
     # 테스트 데이터
     test_replies = [
-        {
-            'text': '과제 제출합니다',
-            'user_info': {'display_name': '홍길동/클스학과', 'real_name': '홍길동'}
-        },
-        {
-            'text': '사진 첨부',
-            'user_info': {'display_name': '김철수', 'real_name': '김철수'}
-        },
-        {
-            'text': '제출',
-            'user_info': {'display_name': '이영희 (학생)', 'real_name': '이영희'}
-        },
-        {
-            'text': '과제 완료',
-            'user_info': {'display_name': '홍길동/클스학과', 'real_name': '홍길동'}  # 중복
-        },
+        Reply('과제 제출합니다', user_info={'display_name': '홍길동/클스학과', 'real_name': '홍길동'}),
+        Reply('사진 첨부', user_info={'display_name': '김철수', 'real_name': '김철수'}),
+        Reply('제출', user_info={'display_name': '이영희 (학생)', 'real_name': '이영희'}),
+        Reply('과제 완료', user_info={'display_name': '홍길동/클스학과', 'real_name': '홍길동'}),  # 중복
     ]
 
     print("=== 과제 제출자 파싱 테스트 ===")
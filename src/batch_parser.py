@@ -0,0 +1,382 @@
+"""
+일괄 출석 파싱 모듈
+과거 스레드를 한꺼번에 다시 처리할 때, 댓글을 DataFrame으로 모아 pandas 문자열 연산으로
+이름을 추출하고 동명이인/슬랙 이름 폴백은 명단·프로필 표와의 조인으로 처리합니다.
+결과는 AttendanceParser.parse_attendance_replies와 같습니다.
+
+측정 결과 (benchmarks/bench_batch_parser.py, 댓글 50 ~ 50,000개):
+파이썬 문자열 저장소(object/str dtype)의 pandas 문자열 연산도 요소별 루프이고 DataFrame 준비에만 약 9ms가 들어
+메모 없는 순차 파싱과의 교차점은 댓글 약 2만 개(67ms vs 64ms)입니다. 공유 파싱 메모를 쓰는 재실행은
+메모 크기(1만 개)를 넘는 5만 개에서야 일괄 파싱이 빨랐습니다(149ms vs 137ms).
+실제 출석 스레드는 이보다 훨씬 작으므로 서비스는 순차 파서를 쓰고 BATCH_MIN_REPLIES는 비활성화되어 있습니다.
+"""
+import logging
+import sys
+from collections import Counter
+from typing import Collection, List, Dict, Optional, Tuple, Union
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.parser import AttendanceParser, DuplicateNameIndex
+from src.transliteration import TransliterationIndex
+from src.records import Reply, AttendanceRecord
+
+logger = logging.getLogger(__name__)
+
+
+class BatchAttendanceParser(AttendanceParser):
+    """pandas 벡터 연산 기반 출석 파서 (AttendanceParser 대신 서비스에 주입 가능)"""
+
+    # 이 개수 이상일 때만 parse_attendance_replies가 일괄 파싱 사용 (None이면 항상 순차 파싱)
+    # benchmarks/bench_batch_parser.py 측정 결과, 파이썬 문자열 저장소(object/str dtype)에서는
+    # pandas 문자열 연산도 요소별 루프라 댓글 약 2만 개 미만에서는 순차 파싱이 더 빨랐으므로 기본값은 비활성화.
+    # 과거 스레드 일괄 처리처럼 댓글별 로그가 필요 없을 때는 parse_batch를 직접 호출합니다.
+    BATCH_MIN_REPLIES: Optional[int] = None
+
+    def parse_attendance_replies(
+        self,
+        replies: List[Reply],
+        duplicate_names: Union[Dict, DuplicateNameIndex] = None,
+        name_index: Optional[TransliterationIndex] = None,
+        bindings: Optional[Dict[str, Tuple[str, int]]] = None,
+        roster: Optional[Collection[str]] = None
+    ) -> List[AttendanceRecord]:
+        """
+        댓글 수에 따라 순차 파싱과 일괄 파싱 중 빠른 쪽으로 처리 (인자와 결과는 부모 클래스와 동일)
+        """
+        if self.BATCH_MIN_REPLIES is None or len(replies) < self.BATCH_MIN_REPLIES:
+            return super().parse_attendance_replies(replies, duplicate_names, name_index, bindings, roster)
+        return self.parse_batch(replies, duplicate_names, name_index, bindings, roster)
+
+    def parse_batch(
+        self,
+        replies: List[Reply],
+        duplicate_names: Union[Dict, DuplicateNameIndex] = None,
+        name_index: Optional[TransliterationIndex] = None,
+        bindings: Optional[Dict[str, Tuple[str, int]]] = None,
+        roster: Optional[Collection[str]] = None
+    ) -> List[AttendanceRecord]:
+        """
+        댓글 리스트를 한 번에 파싱 (댓글별 로그 없음)
+
+        Args:
+            replies (List[Reply]): 슬랙 댓글 리스트 (user_info 포함)
+            duplicate_names (Dict | DuplicateNameIndex): 동명이인 매핑 정보
+            name_index (TransliterationIndex): 명단 이름의 로마자 표기 색인
+            bindings (Dict): {User ID: (이름, 행번호)} 바인딩
+            roster (Collection[str]): 학생 명단 이름 (여러 이름 댓글 판별용)
+
+        Returns:
+            List[AttendanceRecord]: 파싱된 출석 정보 리스트 (parse_attendance_replies와 동일)
+        """
+        logger.info("\n[파싱] 출석 댓글 일괄 파싱 중... (%s개)", len(replies))
+
+        if not replies:
+            self._finish_stats(Counter(replies=0), [])
+            return []
+
+        if isinstance(duplicate_names, DuplicateNameIndex):
+            duplicate_index = duplicate_names
+        else:
+            duplicate_index = DuplicateNameIndex(duplicate_names or {})
+
+        if bindings is None:
+            bindings = {}
+
+        multi_name = self.profile.multi_name_replies and roster is not None
+
+        frame = pd.DataFrame({
+            'text': [reply.text for reply in replies],
+            'user_id': [reply.user_id for reply in replies],
+        })
+        frame['profile_name'] = self._profile_names(replies, name_index)
+
+        texts = frame['text']
+        profile = self.profile
+        has_keyword = texts.str.contains(
+            profile.keyword_pattern.pattern, flags=profile.keyword_pattern.flags, regex=True
+        )
+        if not profile.separators:
+            has_separator = pd.Series(False, index=frame.index)
+        elif len(profile.separators) == 1:
+            has_separator = texts.str.contains(profile.separators[0], regex=False)
+        else:
+            has_separator = texts.str.contains(profile.separator_pattern.pattern, regex=True)
+
+        # 1. 텍스트 패턴 이름 추출 (정규식 한 번에 적용)
+        # 여러 이름을 허용하면 extractall 한 번으로 첫 이름과 명단 이름을 함께 추출
+        if multi_name:
+            names, roster_hits = self._extract_all_names(texts, roster, duplicate_index)
+        else:
+            extracted = texts.str.extract(self.pattern.pattern, flags=self.pattern.flags, expand=True)
+            names = self._normalize_series(self._first_group(extracted))
+            roster_hits = None
+        frame['name'] = names
+        has_name = names.notna() & (names != '')
+
+        # 2. 바인딩 조인 (User ID → 이름, 행)
+        has_user = frame['user_id'].notna() & (frame['user_id'] != '')
+        bound_name = frame['user_id'].map({uid: binding[0] for uid, binding in bindings.items()})
+        has_binding = has_user & bound_name.notna()
+
+        # "본인이름/" 확인은 바인딩된 사용자의 구분자('/') 댓글에만 필요
+        name_in_text = pd.Series(False, index=frame.index)
+        check = has_binding & has_separator & ~has_keyword
+        if check.any():
+            name_in_text[check] = [
+                name in text for name, text in zip(bound_name[check], texts[check])
+            ]
+        is_bound = has_binding & (has_keyword | name_in_text)
+
+        # 3. 처리 단위(item) 표: 한 이름 댓글은 댓글 하나, 여러 이름 댓글은 명단 이름마다 하나
+        # (바인딩 댓글은 구분자가 있을 때만 여러 이름 댓글로 취급 - 순차 파서와 동일)
+        if roster_hits is not None:
+            hit_counts = roster_hits['reply'].value_counts().reindex(frame.index, fill_value=0)
+            is_multi = (hit_counts >= 2) & (~is_bound | has_separator)
+            multi_hits = roster_hits[roster_hits['reply'].isin(frame.index[is_multi])]
+        else:
+            hit_counts = pd.Series(0, index=frame.index)
+            is_multi = pd.Series(False, index=frame.index)
+            multi_hits = self._empty_hits()
+
+        single = ~is_multi
+        multi_reply = multi_hits['reply'].to_numpy(dtype=int)
+        items = pd.concat([
+            pd.DataFrame({
+                'reply': frame.index[single],
+                'position': 0,
+                'name': names[single].to_numpy(),
+                'bound': is_bound[single].to_numpy(),
+                'keyword': has_keyword[single].to_numpy(),
+            }),
+            pd.DataFrame({
+                'reply': multi_reply,
+                'position': multi_hits['position'].to_numpy(),
+                'name': multi_hits['name'].to_numpy(),
+                # 여러 이름 댓글에서는 작성자의 바인딩 이름만 바인딩으로 매칭
+                'bound': (multi_hits['name'].to_numpy() == bound_name.to_numpy()[multi_reply]),
+                'keyword': True,
+            }),
+        ], ignore_index=True).sort_values(['reply', 'position'], kind='stable', ignore_index=True)
+        items['user_id'] = frame['user_id'].to_numpy()[items['reply'].to_numpy(dtype=int)]
+        items['profile_name'] = frame['profile_name'].to_numpy()[items['reply'].to_numpy(dtype=int)]
+
+        item_names = items['name']
+        item_bound = items['bound'].astype(bool)
+        item_has_name = item_names.notna() & (item_names != '')
+
+        # 4. 동명이인 조인 ((User ID, 그룹 이름) → 최종 이름, 행)
+        in_group = ~item_bound & item_has_name & item_names.isin(duplicate_index.names)
+        duplicates = pd.DataFrame(
+            duplicate_index.rows(), columns=['user_id', 'group', 'final_name', 'dup_row'], dtype=object
+        )
+        resolved = (
+            items.loc[in_group, ['user_id', 'name', 'profile_name']]
+            .reset_index()
+            .merge(duplicates, left_on=['user_id', 'name'], right_on=['user_id', 'group'], how='inner')
+        )
+
+        # 5. 후보 표 구성 (kind: 중복 제거 기준 - binding / duplicate / name)
+        plain = ~item_bound & item_has_name & ~in_group
+        fallback = ~item_bound & ~item_has_name & items['keyword'].astype(bool) & (items['profile_name'] != '')
+        bound_ids = items['user_id'][item_bound]
+
+        candidates = pd.concat([
+            pd.DataFrame({
+                'index': items.index[item_bound],
+                'kind': 'binding',
+                'name': [bindings[uid][0] for uid in bound_ids],
+                'user_id': bound_ids.to_numpy(),
+                'source': 'binding',
+                'sheet_row': pd.Series([bindings[uid][1] for uid in bound_ids], dtype=object),
+                'confident': True,
+            }),
+            pd.DataFrame({
+                'index': resolved['index'],
+                'kind': 'duplicate',
+                'name': resolved['final_name'],
+                'user_id': resolved['user_id'],
+                'source': 'text_pattern',
+                'sheet_row': resolved['dup_row'],
+                'confident': resolved['dup_row'].notna() | (resolved['final_name'] == resolved['profile_name']),
+            }),
+            pd.DataFrame({
+                'index': items.index[plain],
+                'kind': 'name',
+                'name': item_names[plain].to_numpy(),
+                'user_id': items['user_id'][plain].to_numpy(),
+                'source': 'text_pattern',
+                'sheet_row': None,
+                'confident': (item_names[plain] == items['profile_name'][plain]).to_numpy(),
+            }),
+            pd.DataFrame({
+                'index': items.index[fallback],
+                'kind': 'name',
+                'name': items['profile_name'][fallback].to_numpy(),
+                'user_id': items['user_id'][fallback].to_numpy(),
+                'source': 'slack_name',
+                'sheet_row': None,
+                'confident': True,
+            }),
+        ], ignore_index=True).sort_values('index', kind='stable', ignore_index=True)
+
+        # 6. 중복 제거
+        selected = self._deduplicate(candidates)
+        reply_of = items['reply'].to_numpy(dtype=int)
+
+        attendance_list = [
+            AttendanceRecord(
+                name,
+                replies[reply_of[index]],
+                source,
+                None if pd.isna(sheet_row) else sheet_row,
+                bool(confident)
+            )
+            for index, name, source, sheet_row, confident in zip(
+                selected['index'], selected['name'], selected['source'],
+                selected['sheet_row'], selected['confident']
+            )
+        ]
+
+        # 동명이인 매칭 실패 항목 중 이미 처리된 User ID의 항목은 순차 파서처럼 중복으로 집계
+        first_seen = {}
+        for index, kind, user_id in zip(selected['index'], selected['kind'], selected['user_id']):
+            if kind != 'name':
+                first_seen.setdefault(user_id, index)
+        unresolved = items.index[in_group].difference(pd.Index(resolved['index']))
+        repeated = sum(
+            1 for index, user_id in zip(unresolved, items['user_id'][unresolved])
+            if first_seen.get(user_id, index) < index
+        )
+
+        self._finish_stats(Counter(
+            replies=len(replies),
+            multi_name=int((hit_counts[is_multi] - 1).sum()),
+            matched=len(attendance_list),
+            duplicate_reply=len(candidates) - len(selected) + repeated,
+            duplicate_name_matched=int((selected['kind'] == 'duplicate').sum()),
+            duplicate_name_unmatched=len(unresolved) - repeated,
+        ), attendance_list)
+
+        return attendance_list
+
+    def _extract_all_names(
+        self,
+        texts: pd.Series,
+        roster: Collection[str],
+        duplicate_index: DuplicateNameIndex
+    ) -> Tuple[pd.Series, pd.DataFrame]:
+        """
+        extractall 한 번으로 댓글별 첫 이름과 명단 이름 목록 추출 (순차 파서의 analyze_text와 같은 규칙)
+
+        Returns:
+            Tuple[pd.Series, pd.DataFrame]: (댓글별 첫 이름, 명단 이름 표 [reply, position, name])
+        """
+        matches = texts.str.extractall(self.pattern.pattern, flags=self.pattern.flags)
+        if matches.empty:
+            return pd.Series(None, index=texts.index, dtype=object), self._empty_hits()
+
+        all_names = self._normalize_series(self._first_group(matches))
+        all_names.index = all_names.index.set_names(['reply', 'position'])
+
+        first_names = all_names.xs(0, level='position').reindex(texts.index)
+
+        lookup = set(roster) | duplicate_index.names
+        hits = all_names[all_names.notna() & all_names.isin(lookup)]
+        hits = hits.rename('name').reset_index().drop_duplicates(['reply', 'name'])
+
+        return first_names, hits
+
+    @staticmethod
+    def _empty_hits() -> pd.DataFrame:
+        """명단 이름이 없을 때의 빈 명단 이름 표"""
+        return pd.DataFrame({
+            'reply': pd.Series(dtype='int64'),
+            'position': pd.Series(dtype='int64'),
+            'name': pd.Series(dtype=object),
+        })
+
+    @staticmethod
+    def _first_group(extracted: pd.DataFrame) -> pd.Series:
+        """프로필 형식마다 캡처 그룹이 하나씩이므로, 매칭된 형식의 그룹(행별 첫 non-null)이 이름"""
+        if extracted.shape[1] == 1:
+            return extracted.iloc[:, 0]
+        return extracted.bfill(axis=1).iloc[:, 0]
+
+    def _profile_names(self, replies: List[Reply], name_index: Optional[TransliterationIndex]) -> List[str]:
+        """
+        댓글별 프로필 이름 (프로필은 사용자별로 공유되므로 프로필 객체당 한 번만 계산)
+        """
+        cache: Dict[int, str] = {}
+        result = []
+
+        for reply in replies:
+            user_info = reply.user_info
+            key = id(user_info)
+            if key not in cache:
+                cache[key] = self._profile_name(user_info, name_index)
+            result.append(cache[key])
+
+        return result
+
+    @staticmethod
+    def _normalize_series(names: pd.Series) -> pd.Series:
+        """normalize_name의 벡터 버전 (NaN은 그대로)"""
+        if not names.notna().any():
+            return names  # 추출된 이름이 없으면 문자열 연산 불가 (float NaN 열)
+
+        names = names.str.strip()
+        has_slash = names.str.contains('/', regex=False, na=False)
+        has_underscore = ~has_slash & names.str.contains('_', regex=False, na=False)
+
+        # 구분자가 있는 행에만 분리 적용 (기본 패턴에서는 거의 없음)
+        if has_slash.any():
+            names[has_slash] = names[has_slash].str.split('/', n=1).str[0].str.strip()
+        if has_underscore.any():
+            names[has_underscore] = names[has_underscore].str.split('_', n=1).str[0].str.strip()
+        return names
+
+    @staticmethod
+    def _deduplicate(candidates: pd.DataFrame) -> pd.DataFrame:
+        """
+        순차 파서의 seen_names / seen_user_ids 규칙으로 중복 제거
+
+        - 일반 이름·슬랙 이름(name): 이름 기준 첫 댓글
+        - 동명이인(duplicate): User ID 기준 첫 댓글
+        - 바인딩(binding): 이름과 User ID를 함께 사용하므로, 바인딩 후보가 있으면 후보만 순서대로 확인
+        """
+        kind = candidates['kind']
+
+        if not (kind == 'binding').any():
+            by_user = kind == 'duplicate'
+            keep = pd.Series(False, index=candidates.index)
+            keep[by_user] = ~candidates.loc[by_user, 'user_id'].duplicated()
+            keep[~by_user] = ~candidates.loc[~by_user, 'name'].duplicated()
+            return candidates[keep]
+
+        seen_names = set()
+        seen_user_ids = set()
+        keep = []
+
+        for row_kind, name, user_id in zip(kind, candidates['name'], candidates['user_id']):
+            if row_kind == 'binding':
+                accepted = name not in seen_names and user_id not in seen_user_ids
+                if accepted:
+                    seen_names.add(name)
+                    seen_user_ids.add(user_id)
+            elif row_kind == 'duplicate':
+                accepted = user_id not in seen_user_ids
+                if accepted:
+                    seen_user_ids.add(user_id)
+            else:
+                accepted = name not in seen_names
+                if accepted:
+                    seen_names.add(name)
+            keep.append(accepted)
+
+        return candidates[keep]
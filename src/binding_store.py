@@ -0,0 +1,204 @@
+"""
+사용자 바인딩 저장소 모듈
+확실하게 매칭된 (Slack User ID → 시트 행) 정보를 워크스페이스별로 저장하고,
+다음 실행부터 User ID만으로 바로 출석자를 찾을 수 있게 합니다.
+
+- 스케줄러·라우트·온보딩이 저장소를 각자 만들어 저장하므로, 저장 시 파일별 잠금 안에서
+  파일을 다시 읽고 이 저장소의 변경(추가·갱신·삭제)만 합쳐서 기록 (다른 실행의 바인딩을 덮지 않음)
+- 임시 파일에 쓴 뒤 교체하므로 저장 도중 종료되어도 기존 파일이 잘리지 않음
+"""
+import logging
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.records import AttendanceRecord
+from src.roster_index import RosterIndex
+
+logger = logging.getLogger(__name__)
+
+# 바인딩 파일별 잠금 (읽기-합치기-저장을 한 번에 하나씩)
+_file_locks: Dict[str, threading.Lock] = {}
+_file_locks_lock = threading.Lock()
+
+
+def _file_lock(path: Path) -> threading.Lock:
+    """바인딩 파일별 잠금 (없으면 생성)"""
+    key = str(Path(path).resolve())
+    with _file_locks_lock:
+        lock = _file_locks.get(key)
+        if lock is None:
+            lock = _file_locks[key] = threading.Lock()
+        return lock
+
+
+class BindingStore:
+    """워크스페이스별 User ID → 시트 행 바인딩 저장소 (bindings.json)"""
+
+    FILE_NAME = 'bindings.json'
+
+    def __init__(self, workspace_path: Path):
+        """
+        Args:
+            workspace_path: 워크스페이스 폴더 경로
+        """
+        self.file = Path(workspace_path) / self.FILE_NAME
+        with _file_lock(self.file):
+            self._bindings: Dict[str, Dict] = self._load()
+        # 저장하지 않은 변경: {User ID: 새 바인딩} / {User ID: 삭제한 바인딩}
+        self._changed: Dict[str, Dict] = {}
+        self._removed: Dict[str, Dict] = {}
+
+    @property
+    def _dirty(self) -> bool:
+        return bool(self._changed or self._removed)
+
+    def _load(self) -> Dict[str, Dict]:
+        """bindings.json 로드 (없거나 손상되었으면 빈 딕셔너리, 파일 잠금 안에서 호출)"""
+        if not self.file.exists():
+            return {}
+
+        try:
+            with open(self.file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data.get('bindings', {})
+        except (OSError, ValueError) as e:
+            logger.warning("⚠ 바인딩 파일 읽기 실패 (%s): %s", self.file.name, e)
+            return {}
+
+    def __len__(self) -> int:
+        return len(self._bindings)
+
+    def get(self, user_id: str) -> Optional[Dict]:
+        """User ID의 바인딩 정보 (없으면 None)"""
+        return self._bindings.get(user_id)
+
+    def get_valid_bindings(self, students: Dict[str, int]) -> Dict[str, Tuple[str, int]]:
+        """
+        현재 명단 기준으로 유효한 바인딩만 반환
+
+        바인딩된 행의 이름이 바뀌었거나 행이 사라졌으면 해당 바인딩은 폐기합니다.
+        명단 색인이면 시트의 모든 행(동명이인의 앞쪽 행 포함)의 이름으로 확인하므로,
+        동명이인 설정으로 배운 앞쪽 행 바인딩도 유지됩니다.
+
+        Args:
+            students: {이름: 행번호} 딕셔너리 (get_student_list의 RosterIndex 권장)
+
+        Returns:
+            Dict[str, Tuple[str, int]]: {User ID: (이름, 행번호)}
+        """
+        # 명단 색인이면 모든 행의 행 → 이름 색인을 그대로 사용 (명단이 같으면 다시 만들지 않음)
+        if isinstance(students, RosterIndex):
+            name_at = students.name_at
+        else:
+            name_at = {row: name for name, row in students.items()}.get
+        valid = {}
+
+        for user_id, binding in list(self._bindings.items()):
+            name = binding.get('name')
+            row = binding.get('sheet_row')
+
+            if name_at(row) == name:
+                valid[user_id] = (name, row)
+            else:
+                # 명단 변경으로 무효화
+                del self._bindings[user_id]
+                self._changed.pop(user_id, None)
+                self._removed[user_id] = binding
+
+        return valid
+
+    def learn(self, attendance_list: List[AttendanceRecord], students: Dict[str, int]) -> int:
+        """
+        이번 실행에서 확실하게 매칭된 출석자를 바인딩으로 기록
+
+        Args:
+            attendance_list: 파싱된 출석 레코드 리스트 (confident 표시 포함)
+            students: {이름: 행번호} 딕셔너리
+
+        Returns:
+            int: 새로 추가되거나 변경된 바인딩 수
+        """
+        learned = 0
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        for attendance in attendance_list:
+            user_id = attendance.user_id
+            if not user_id or not attendance.confident:
+                continue
+
+            name = attendance.name
+            row = attendance.sheet_row
+            if row is None:
+                row = students.get(name)
+            if row is None:
+                continue
+
+            if self.bind(user_id, name, row, updated_at=now):
+                learned += 1
+
+        return learned
+
+    def bind(self, user_id: str, name: str, sheet_row: int, updated_at: Optional[str] = None) -> bool:
+        """
+        바인딩 하나를 추가하거나 갱신
+
+        Args:
+            user_id: Slack User ID
+            name: 명단 이름
+            sheet_row: 행 번호 (0-based)
+            updated_at: 기록 시각 (None이면 현재 시각)
+
+        Returns:
+            bool: 새로 추가되거나 변경되었으면 True
+        """
+        current = self._bindings.get(user_id)
+        if current and current.get('name') == name and current.get('sheet_row') == sheet_row:
+            return False
+
+        binding = {
+            'name': name,
+            'sheet_row': sheet_row,
+            'updated_at': updated_at or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        self._bindings[user_id] = binding
+        self._changed[user_id] = binding
+        self._removed.pop(user_id, None)
+        return True
+
+    def save(self) -> bool:
+        """
+        변경사항이 있으면 bindings.json 저장
+
+        파일 잠금 안에서 파일을 다시 읽어 이 저장소의 변경만 합친 뒤, 임시 파일에 써서 교체합니다.
+        삭제는 파일의 바인딩이 삭제할 때와 같을 때만 반영합니다 (그사이 다른 실행이 다시 배운 바인딩은 유지).
+
+        Returns:
+            bool: 저장 성공 여부 (변경사항이 없어도 True)
+        """
+        if not self._dirty:
+            return True
+
+        temp_path = self.file.with_name(self.file.name + '.tmp')
+        with _file_lock(self.file):
+            bindings = self._load()
+            for user_id, removed in self._removed.items():
+                if bindings.get(user_id) == removed:
+                    del bindings[user_id]
+            bindings.update(self._changed)
+
+            try:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'bindings': bindings}, f, ensure_ascii=False, indent=2)
+                os.replace(temp_path, self.file)
+            except OSError as e:
+                logger.error("✗ 바인딩 저장 실패: %s", e)
+                return False
+
+        self._bindings = bindings
+        self._changed.clear()
+        self._removed.clear()
+        return True
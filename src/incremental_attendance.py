@@ -0,0 +1,285 @@
+"""
+증분 출석 반영 모듈
+한 스레드의 댓글 상태(ts → edited.ts)와 댓글별 출석 행을 기억해 두고,
+새 댓글·수정된 댓글(edited)·삭제된 댓글(message_deleted, tombstone)만 다시 파싱해
+출석 여부가 바뀐 셀만 정정합니다. 스레드 전체를 다시 계산하지 않습니다.
+
+- sync(): conversations.replies 결과(스냅샷)와 이전 상태를 비교
+- changed_user_ids(): sync 전에 사용자 정보를 조회해야 하는 작성자 (잠금 밖에서 미리 조회하기 위해)
+- 한 행을 여러 댓글이 출석 처리할 수 있으므로 행마다 출석 처리한 댓글 ts 집합을 보관
+"""
+import logging
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.parser import AttendanceParser, DuplicateNameIndex
+from src.records import Reply, AttendanceRecord
+from src.roster_index import as_roster_index
+from src.sheets_handler import AttendanceStatus
+from src.slack_handler import SlackHandler
+from src.transliteration import TransliterationIndex
+
+logger = logging.getLogger(__name__)
+
+# 댓글 삭제로 간주하는 메시지 subtype
+DELETED_SUBTYPES = frozenset(('message_deleted', 'tombstone'))
+
+
+def _edited_ts(message: Dict) -> str:
+    """슬랙 메시지의 edited.ts (수정되지 않았으면 빈 문자열)"""
+    return (message.get('edited') or {}).get('ts', '')
+
+
+class IncrementalAttendance:
+    """
+    스레드 하나의 증분 출석 상태
+
+    파서·명단·동명이인·바인딩은 생성 시점 값으로 고정됩니다.
+    명단이나 설정, 바인딩이 바뀌면 새 객체를 만들어 전체 동기화해야 합니다.
+    (이 상태의 매칭 결과에서 배운 바인딩은 결과가 같으므로 bindings만 바꿔 넣어도 됨)
+    """
+
+    def __init__(
+        self,
+        parser: AttendanceParser,
+        students: Dict[str, int],
+        column_index: int,
+        duplicate_names: Union[Dict, DuplicateNameIndex] = None,
+        name_index: Optional[TransliterationIndex] = None,
+        bindings: Optional[Dict[str, Tuple[str, int]]] = None,
+        mark_absent: bool = True,
+        aliases: Optional[Dict[str, str]] = None
+    ):
+        """
+        Args:
+            parser: 출석 파서 (워크스페이스 프로필)
+            students: {이름: 행번호} 딕셔너리
+            column_index: 출석 열 인덱스 (0-based)
+            duplicate_names: 동명이인 정보
+            name_index: 영문 이름 매칭용 로마자 색인 (None이면 명단으로 생성)
+            bindings: User ID → (이름, 행) 바인딩
+            mark_absent: 출석이 취소된 행을 X로 표시 (False면 셀 비우기)
+            aliases: 명단 이름 별칭 (compile_aliases 결과)
+        """
+        self.parser = parser
+        self.students = as_roster_index(students)
+        self.column_index = column_index
+        self.duplicate_index = (
+            duplicate_names if isinstance(duplicate_names, DuplicateNameIndex)
+            else DuplicateNameIndex(duplicate_names or {})
+        )
+        self.name_index = name_index or TransliterationIndex(students.keys())
+        self.bindings = bindings or {}
+        self.mark_absent = mark_absent
+        self.aliases = aliases or {}
+
+        # 파싱에 사용된 댓글 버전 {ts: edited.ts}
+        self._versions: Dict[str, str] = {}
+        # 댓글별 출석 레코드 / 출석 처리한 행
+        self._records: Dict[str, List[AttendanceRecord]] = {}
+        self._claims: Dict[str, Tuple[int, ...]] = {}
+        # 행별 출석 처리한 댓글 ts, 행 이름
+        self._claimants: Dict[int, Set[str]] = {}
+        self._row_names: Dict[int, str] = {row: name for name, row in students.items()}
+        # 댓글별 명단에 없는 이름
+        self._unmatched: Dict[str, List[str]] = {}
+
+        self.synced = False
+
+    @property
+    def present_rows(self) -> Set[int]:
+        """현재 출석 처리된 행"""
+        return {row for row, claimants in self._claimants.items() if claimants}
+
+    def matched_names(self) -> List[str]:
+        """출석 처리된 행의 이름 (행 순서)"""
+        return [self._row_names[row] for row in sorted(self.present_rows)]
+
+    def absent_names(self) -> List[str]:
+        """출석 처리되지 않은 명단 이름"""
+        present = self.present_rows
+        return [name for name, row in self.students.items() if row not in present]
+
+    def unmatched_names(self) -> List[str]:
+        """명단에 없는 이름 (댓글 순서, 중복 제외)"""
+        return list(dict.fromkeys(
+            name for ts in sorted(self._unmatched, key=float) for name in self._unmatched[ts]
+        ))
+
+    def records(self) -> List[AttendanceRecord]:
+        """현재 상태의 출석 레코드 전체 (댓글 순서)"""
+        return [record for ts in sorted(self._records, key=float) for record in self._records[ts]]
+
+    def changed_user_ids(self, messages: List[Dict]) -> Set[str]:
+        """
+        sync(messages)에서 다시 파싱할 댓글(새 댓글·수정된 댓글)의 작성자 User ID
+
+        Args:
+            messages: 원본 댓글 리스트 (sync와 같음)
+
+        Returns:
+            Set[str]: 사용자 정보가 필요한 User ID
+        """
+        current = self._select(messages)
+        return {current[ts]['user'] for ts in self._changed(current) if current[ts].get('user')}
+
+    def sync(
+        self,
+        messages: List[Dict],
+        user_lookup: Callable[[str], Optional[Dict]]
+    ) -> Tuple[List[Dict], List[AttendanceRecord]]:
+        """
+        스레드 스냅샷(conversations.replies 결과)과 이전 상태 비교 후 반영
+
+        댓글 선택 정책(사용자별 중복 제외 등)은 스냅샷 전체에 다시 적용하므로
+        첫 댓글이 삭제되면 같은 사용자의 다음 댓글이 새로 선택됩니다.
+
+        Args:
+            messages: 원본 댓글 리스트 (스레드 원본 메시지 제외)
+            user_lookup: User ID → 사용자 정보 (바뀐 댓글만 호출)
+
+        Returns:
+            Tuple[셀 정정 리스트, 새로 파싱된 출석 레코드]
+        """
+        current = self._select(messages)
+        removed = [ts for ts in self._versions if ts not in current]
+        changed = self._changed(current)
+
+        affected: Set[int] = set()
+        before = self.present_rows if self.synced else set()
+
+        for ts in removed:
+            affected.update(self._release(ts))
+            del self._versions[ts]
+
+        new_records = []
+        for ts in changed:
+            affected.update(self._release(ts))
+            message = current[ts]
+            user_id = message.get('user')
+            reply = Reply(
+                message.get('text', ''),
+                user_id,
+                user_lookup(user_id) if user_id else None,
+                ts,
+                _edited_ts(message)
+            )
+            records = self.parser.parse_reply(
+                reply,
+                self.duplicate_index,
+                name_index=self.name_index,
+                bindings=self.bindings,
+                roster=self.students
+            )
+            affected.update(self._claim(ts, records))
+            self._versions[ts] = reply.edited_ts
+            new_records.extend(records)
+
+        after = self.present_rows
+        if self.synced:
+            corrections = self._corrections(affected, before, after)
+        else:
+            # 첫 동기화: 출석자 전체 + 미출석자 X (run_attendance_check와 같은 결과)
+            corrections = self._corrections(set(self._row_names) if self.mark_absent else after, before, after)
+            self.synced = True
+
+        if removed or changed:
+            logger.info(
+                "[증분 출석] 새/수정 댓글 %s개, 삭제 %s개 → 셀 정정 %s개",
+                len(changed), len(removed), len(corrections)
+            )
+
+        return corrections, new_records
+
+    def _select(self, messages: List[Dict]) -> Dict[str, Dict]:
+        """스냅샷에서 삭제된 댓글을 빼고 댓글 선택 정책 적용 ({ts: 메시지}, 댓글 순서)"""
+        ordered = sorted(
+            (message for message in messages
+             if message.get('ts') and message.get('subtype') not in DELETED_SUBTYPES),
+            key=lambda message: float(message['ts'])
+        )
+        selected = SlackHandler.select_replies(ordered, self.parser.REPLY_POLICY, self.parser.is_candidate_reply)
+        return {message['ts']: message for message in selected}
+
+    def _changed(self, current: Dict[str, Dict]) -> List[str]:
+        """처음 보거나 수정된(edited.ts가 바뀐) 댓글 ts"""
+        return [
+            ts for ts, message in current.items()
+            if ts not in self._versions or self._versions[ts] != _edited_ts(message)
+        ]
+
+    def _claim(self, ts: str, records: List[AttendanceRecord]) -> Set[int]:
+        """댓글 하나의 출석 레코드 등록, 출석 처리한 행 반환"""
+        rows = []
+        unmatched = []
+
+        for record in records:
+            name = record.name
+            if record.sheet_row is not None:
+                row = record.sheet_row
+            else:
+                # 별칭·정규화 키로 명단 이름 찾기 ("홍 길동" → "홍길동")
+                name = self.students.resolve(name, self.aliases)
+                if name is None:
+                    unmatched.append(record.name)
+                    continue
+                row = self.students[name]
+            rows.append(row)
+            self._claimants.setdefault(row, set()).add(ts)
+            self._row_names.setdefault(row, name)
+
+        self._records[ts] = records
+        self._claims[ts] = tuple(rows)
+        if unmatched:
+            self._unmatched[ts] = unmatched
+
+        return set(rows)
+
+    def _release(self, ts: str) -> Set[int]:
+        """댓글 하나의 출석 레코드 제거, 영향받은 행 반환"""
+        self._records.pop(ts, None)
+        self._unmatched.pop(ts, None)
+        rows = self._claims.pop(ts, ())
+
+        for row in rows:
+            claimants = self._claimants.get(row)
+            if claimants is not None:
+                claimants.discard(ts)
+
+        return set(rows)
+
+    def _corrections(self, rows: Set[int], before: Set[int], after: Set[int]) -> List[Dict]:
+        """
+        출석 여부가 바뀐 행만 셀 업데이트로 변환
+
+        Args:
+            rows: 확인할 행
+            before: 반영 전 출석 행
+            after: 반영 후 출석 행
+
+        Returns:
+            List[Dict]: batch_update_attendance 업데이트 리스트
+        """
+        absent_status = AttendanceStatus.ABSENT if self.mark_absent else ''
+        updates = []
+
+        for row in sorted(rows):
+            is_present = row in after
+            if self.synced and is_present == (row in before):
+                continue
+            if not self.synced and not is_present and not self.mark_absent:
+                continue
+
+            updates.append({
+                'name': self._row_names.get(row, ''),
+                'row': row,
+                'column': self.column_index,
+                'status': AttendanceStatus.PRESENT if is_present else absent_status
+            })
+
+        return updates
@@ -0,0 +1,200 @@
+"""
+댓글 파싱 결과 메모 모듈
+정규식 분석 결과는 댓글 텍스트와 파서 프로필로만 정해지므로, (텍스트 해시, 프로필 해시)를 키로
+LRU로 보관해 같은 텍스트("출석합니다" 등)나 같은 스레드를 반복 처리할 때 재사용합니다.
+(슬랙 ts는 채널 안에서만 고유하므로 키로 쓰지 않음)
+
+- 기본은 프로세스 공유 메모(parse_memo): 스케줄러·라우트의 재실행이 같은 스레드의 분석 결과를 재사용
+- 크기 제한 LRU (기본 DEFAULT_MAXSIZE개, 항목당 약 450B → 약 4.5MB, PARSE_MEMO_SIZE로 변경, 0이면 끔)
+- PARSE_MEMO_FILE을 지정하면 JSON 파일에 저장했다가 다음 실행 시 불러옴
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 메모 키: (댓글 텍스트 해시, 파서 프로필 해시)
+MemoKey = Tuple[str, str]
+
+
+def text_key(text: str) -> str:
+    """댓글 텍스트 해시 (메모 키, 텍스트 자체를 보관하지 않도록)"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ParsedText:
+    """댓글 텍스트 하나의 정규식 분석 결과 (명단·바인딩과 무관한 부분만)"""
+
+    __slots__ = ('first_name', 'names', 'has_keyword', 'has_separator')
+
+    def __init__(
+        self,
+        first_name: Optional[str],
+        names: Tuple[str, ...],
+        has_keyword: bool,
+        has_separator: bool
+    ):
+        """
+        Args:
+            first_name: 첫 번째 매치의 이름 (extract_name_from_text 결과)
+            names: 추출된 모든 이름 (등장 순서, 중복 제외)
+            has_keyword: 출석 키워드 포함 여부
+            has_separator: 이름 뒤 구분자 포함 여부
+        """
+        self.first_name = first_name
+        self.names = names
+        self.has_keyword = has_keyword
+        self.has_separator = has_separator
+
+    def to_list(self) -> list:
+        """저장용 리스트 변환"""
+        return [self.first_name, list(self.names), self.has_keyword, self.has_separator]
+
+    @classmethod
+    def from_list(cls, data: list) -> 'ParsedText':
+        """to_list 결과에서 복원"""
+        first_name, names, has_keyword, has_separator = data
+        return cls(first_name, tuple(names), bool(has_keyword), bool(has_separator))
+
+
+class ParseMemo:
+    """(텍스트 해시, 프로필 해시) → ParsedText 크기 제한 LRU (스레드 안전)"""
+
+    DEFAULT_MAXSIZE = 10000
+    FILE_VERSION = 2
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """
+        Args:
+            maxsize: 최대 보관 댓글 수 (0이면 메모 사용 안 함)
+        """
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[MemoKey, ParsedText]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: MemoKey) -> Optional[ParsedText]:
+        """
+        메모 조회 (조회된 항목은 최근 사용으로 이동)
+
+        Args:
+            key: (텍스트 해시, 프로필 해시)
+
+        Returns:
+            Optional[ParsedText]: 저장된 분석 결과 (없으면 None)
+        """
+        with self._lock:
+            parsed = self._entries.get(key)
+            if parsed is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return parsed
+
+    def put(self, key: MemoKey, parsed: ParsedText):
+        """
+        메모 저장 (가득 차면 가장 오래 사용하지 않은 항목 제거)
+
+        Args:
+            key: (텍스트 해시, 프로필 해시)
+            parsed: 분석 결과
+        """
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = parsed
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """메모와 집계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict:
+        """
+        메모 사용 현황
+
+        Returns:
+            Dict: {'size', 'maxsize', 'hits', 'misses'}
+        """
+        return {'size': len(self._entries), 'maxsize': self.maxsize, 'hits': self.hits, 'misses': self.misses}
+
+    def save(self, path: Path) -> bool:
+        """
+        메모를 JSON 파일로 저장 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            path: 저장 경로
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        path = Path(path)
+        with self._lock:
+            entries = [list(key) + parsed.to_list() for key, parsed in self._entries.items()]
+
+        temp_path = path.with_name(path.name + '.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.FILE_VERSION, 'entries': entries}, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+            logger.debug("파싱 메모 저장: %s개 (%s)", len(entries), path)
+            return True
+        except OSError as e:
+            logger.error("✗ 파싱 메모 저장 실패: %s", e)
+            return False
+
+    def load(self, path: Path) -> int:
+        """
+        JSON 파일에서 메모 불러오기 (없거나 손상되었으면 무시)
+
+        Args:
+            path: 저장 경로
+
+        Returns:
+            int: 불러온 항목 수
+        """
+        path = Path(path)
+        if not path.exists():
+            return 0
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != self.FILE_VERSION:
+                logger.warning("⚠ 파싱 메모 파일 버전이 달라 무시합니다: %s", path.name)
+                return 0
+            entries = [
+                (tuple(entry[:2]), ParsedText.from_list(entry[2:]))
+                for entry in data.get('entries', [])
+            ]
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning("⚠ 파싱 메모 파일 읽기 실패 (%s): %s", path.name, e)
+            return 0
+
+        # 저장된 순서가 LRU 순서 (뒤쪽이 최근)
+        for key, parsed in entries[-self.maxsize:] if self.maxsize > 0 else []:
+            self.put(key, parsed)
+
+        return min(len(entries), max(self.maxsize, 0))
+
+
+# 프로세스 전체에서 공유하는 파싱 메모 (AttendanceParser 기본 메모, 스케줄러 작업과 웹 요청이 공유)
+parse_memo = ParseMemo(maxsize=int(os.environ.get('PARSE_MEMO_SIZE', ParseMemo.DEFAULT_MAXSIZE)))
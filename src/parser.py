@@ -2,35 +2,59 @@
 출석 댓글 파싱 모듈
 슬랙 댓글에서 출석 정보를 추출합니다.
 """
+import logging
 import re
-from typing import List, Dict, Optional, Set
+import sys
+from collections import Counter
+from typing import Collection, List, Dict, Optional, Set, Tuple, Union
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.transliteration import TransliterationIndex
+from src.records import Reply, AttendanceRecord
+from src.parser_profile import ParserProfile, compile_profile
+from src.parse_memo import ParseMemo, ParsedText, parse_memo, text_key
+
+logger = logging.getLogger(__name__)
 
 
 class AttendanceParser:
     """출석 댓글을 파싱하는 클래스"""
 
-    # 출석 키워드 패턴
-    ATTENDANCE_KEYWORDS = [
-        '출석',
-        '출석했습니다',
-        '출석해요',
-        '출석합니다',
-        '입실',
-        '입실했습니다',
-    ]
+    # 댓글 선택 정책 (SlackHandler.get_replies_with_user_info에 전달)
+    # 같은 사용자가 같은 내용을 여러 번 단 댓글은 결과가 같으므로 한 번만 파싱
+    REPLY_POLICY = 'distinct'
 
-    def __init__(self):
-        """AttendanceParser 초기화"""
-        # 정규표현식 패턴 컴파일
-        # 패턴: "이름/" 또는 "이름 출석" 또는 "이름/출석" 형태 (유연하게)
-        # - "홍길동/" → 인정
-        # - "홍길동 출석" → 인정
-        # - "홍길동/출석" → 인정
-        # - "홍길동출석" → 인정
-        self.pattern = re.compile(
-            r'([가-힣a-zA-Z]+)\s*(?:[/]|(?:' + '|'.join(self.ATTENDANCE_KEYWORDS) + '))',
-            re.IGNORECASE
-        )
+    # 파싱 집계 항목 (get_attendance_summary의 parse_stats)
+    # (multi_name: 여러 이름 댓글에서 첫 이름 외에 추가로 추출된 이름 수)
+    STAT_KEYS = ('replies', 'multi_name', 'matched', 'duplicate_reply', 'duplicate_name_matched',
+                 'duplicate_name_unmatched', 'ignored')
+
+    def __init__(self, profile: Optional[ParserProfile] = None, memo: Optional[ParseMemo] = None):
+        """
+        AttendanceParser 초기화
+
+        Args:
+            profile (ParserProfile): 컴파일된 파서 프로필 (WorkspaceConfig.parser_profile)
+                None이면 기본 프로필 - "이름/" 또는 "이름 출석" 또는 "이름/출석" 형태 (유연하게)
+                - "홍길동/" → 인정
+                - "홍길동 출석" → 인정
+                - "홍길동/출석" → 인정
+                - "홍길동출석" → 인정
+            memo (ParseMemo): 댓글 분석 결과 메모 (None이면 프로세스 공유 메모 parse_memo)
+        """
+        # 정규식은 프로필 해시 기준으로 한 번만 컴파일되어 실행 간에 공유됨
+        self.profile = profile or compile_profile()
+        self.pattern = self.profile.pattern
+
+        # 같은 텍스트의 분석 결과는 재사용
+        self.memo = memo if memo is not None else parse_memo
+
+        # 마지막 파싱 집계 (댓글별 로그 대신 실행 결과 요약에 포함)
+        self.stats: Counter = Counter()
 
     def extract_name_from_text(self, text: str) -> Optional[str]:
         """
@@ -42,16 +66,86 @@ class AttendanceParser:
         Returns:
             Optional[str]: 추출된 이름 (없으면 None)
         """
-        # 패턴 매칭
-        match = self.pattern.search(text)
+        # 패턴 매칭 (프로필의 형식별 패턴 중 먼저 매칭된 것)
+        name = self.profile.extract_raw_name(text)
 
-        if match:
-            name = match.group(1).strip()
+        if name:
             return self.normalize_name(name)
 
         return None
 
-    def normalize_name(self, name: str) -> str:
+    def extract_names_from_text(
+        self,
+        text: str,
+        roster: Collection[str],
+        duplicate_index: Optional['DuplicateNameIndex'] = None
+    ) -> List[str]:
+        """
+        댓글 텍스트에서 명단에 있는 이름을 모두 추출 (한 번의 스캔, 텍스트 길이에 선형)
+
+        예: "홍길동/김철수/이영희 출석" → ["홍길동", "김철수", "이영희"]
+
+        Args:
+            text (str): 댓글 텍스트
+            roster (Collection[str]): 학생 명단 이름 (students 딕셔너리도 가능)
+            duplicate_index (DuplicateNameIndex): 동명이인 색인 (그룹 이름도 명단 이름으로 취급)
+
+        Returns:
+            List[str]: 명단에 있는 이름 (등장 순서, 중복 제외)
+        """
+        group_names = duplicate_index.names if duplicate_index else ()
+        return [name for name in self.analyze_text(text).names if name in roster or name in group_names]
+
+    def analyze_text(self, text: str) -> ParsedText:
+        """
+        댓글 텍스트를 한 번 스캔해 파싱에 필요한 정보를 모두 추출 (finditer 한 번 + 키워드/구분자 검사)
+
+        명단·바인딩과 무관한 결과라 텍스트와 파서 프로필이 같은 댓글이면 재사용할 수 있습니다.
+
+        Args:
+            text (str): 댓글 텍스트
+
+        Returns:
+            ParsedText: 첫 이름(extract_name_from_text와 동일), 모든 이름, 키워드/구분자 포함 여부
+        """
+        first = None
+        names = {}  # 등장 순서 유지 + 중복 제외
+
+        for position, raw_name in enumerate(self.profile.iter_raw_names(text)):
+            if not raw_name:
+                continue
+            name = self.normalize_name(raw_name)
+            if position == 0:
+                first = name
+            if name:
+                names[name] = None
+
+        return ParsedText(
+            first,
+            tuple(names),
+            self.profile.contains_keyword(text),
+            self.profile.contains_separator(text)
+        )
+
+    def _analyze_reply(self, reply: Reply) -> ParsedText:
+        """
+        댓글 분석 (같은 텍스트·프로필의 분석 결과가 메모에 있으면 재사용)
+
+        Args:
+            reply (Reply): 슬랙 댓글
+
+        Returns:
+            ParsedText: 분석 결과
+        """
+        key = (text_key(reply.text), self.profile.key)
+        parsed = self.memo.get(key)
+        if parsed is None:
+            parsed = self.analyze_text(reply.text)
+            self.memo.put(key, parsed)
+        return parsed
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
         """
         이름 정규화 (공백 제거, / 또는 _ 앞의 이름만 추출)
 
@@ -73,83 +167,197 @@ class AttendanceParser:
 
         return name
 
-    def parse_attendance_replies(self, replies: List[Dict], duplicate_names: Dict = None) -> List[Dict]:
+    def parse_attendance_replies(
+        self,
+        replies: List[Reply],
+        duplicate_names: Union[Dict, 'DuplicateNameIndex'] = None,
+        name_index: Optional[TransliterationIndex] = None,
+        bindings: Optional[Dict[str, Tuple[str, int]]] = None,
+        roster: Optional[Collection[str]] = None
+    ) -> List[AttendanceRecord]:
         """
         댓글 리스트에서 출석 정보 파싱
 
         Args:
-            replies (List[Dict]): 슬랙 댓글 리스트 (user_info 포함)
-            duplicate_names (Dict): 동명이인 매핑 정보
+            replies (List[Reply]): 슬랙 댓글 리스트 (user_info 포함)
+            duplicate_names (Dict | DuplicateNameIndex): 동명이인 매핑 정보 (미리 컴파일된 색인 권장)
                 예: {"홍길동": [{"user_id": "U123", "display_name": "홍길동_컴공", "sheet_row": 5}, ...]}
+            name_index (TransliterationIndex): 명단 이름의 로마자 표기 색인
+                슬랙 이름이 영문("Gildong Hong")일 때 명단 이름("홍길동")으로 변환
+            bindings (Dict): 이전 실행에서 학습한 {User ID: (이름, 행번호)} 바인딩
+                바인딩된 사용자는 추출한 이름과 무관하게 User ID로 바로 매칭
+            roster (Collection[str]): 학생 명단 이름 (students 딕셔너리도 가능)
+                지정하면 "홍길동/김철수/이영희 출석"처럼 명단 이름이 2개 이상인 댓글은 모두 출석 처리
+                (프로필의 multi_name_replies가 false이면 첫 이름만)
 
         Returns:
-            List[Dict]: 파싱된 출석 정보 리스트
+            List[AttendanceRecord]: 파싱된 출석 정보 리스트
+                (confident: 텍스트와 슬랙 프로필이 일치하는 등 바인딩으로 학습해도 되는 매칭 여부)
+        """
+        logger.info("\n[파싱] 출석 댓글 파싱 중... (%s개)", len(replies))
+
+        # 댓글별 로그는 DEBUG에서만 (루프 밖에서 한 번만 레벨 확인)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        stats = Counter(replies=len(replies))
+
+        # 동명이인 설정은 실행당 한 번만 색인으로 컴파일 (이미 컴파일된 색인은 그대로 사용)
+        if isinstance(duplicate_names, DuplicateNameIndex):
+            duplicate_index = duplicate_names
+        else:
+            duplicate_index = DuplicateNameIndex(duplicate_names or {})
+
+        if bindings is None:
+            bindings = {}
+
+        attendance_list = self._collect_attendance(
+            replies, duplicate_index, name_index, bindings, roster, stats, debug
+        )
+
+        self._finish_stats(stats, attendance_list)
+
+        return attendance_list
+
+    def parse_reply(
+        self,
+        reply: Reply,
+        duplicate_names: Union[Dict, 'DuplicateNameIndex'] = None,
+        name_index: Optional[TransliterationIndex] = None,
+        bindings: Optional[Dict[str, Tuple[str, int]]] = None,
+        roster: Optional[Collection[str]] = None
+    ) -> List[AttendanceRecord]:
+        """
+        댓글 하나만 파싱 (증분 처리용: 다른 댓글과의 중복 제거, 로그, 집계 없음)
+
+        인자는 parse_attendance_replies와 같습니다.
+
+        Returns:
+            List[AttendanceRecord]: 이 댓글이 출석 처리하는 레코드 (여러 이름 댓글이면 여러 개)
+        """
+        if not isinstance(duplicate_names, DuplicateNameIndex):
+            duplicate_names = DuplicateNameIndex(duplicate_names or {})
+
+        return self._collect_attendance(
+            [reply], duplicate_names, name_index, bindings or {}, roster, Counter(), False
+        )
+
+    def _collect_attendance(
+        self,
+        replies: List[Reply],
+        duplicate_index: 'DuplicateNameIndex',
+        name_index: Optional[TransliterationIndex],
+        bindings: Dict[str, Tuple[str, int]],
+        roster: Optional[Collection[str]],
+        stats: Counter,
+        debug: bool
+    ) -> List[AttendanceRecord]:
         """
-        print(f"\n[파싱] 출석 댓글 파싱 중...")
+        parse_attendance_replies의 파싱 루프 (중복 제거 포함, 집계는 stats에 누적)
 
-        if duplicate_names is None:
-            duplicate_names = {}
+        Returns:
+            List[AttendanceRecord]: 파싱된 출석 정보 리스트
+        """
+        # 여러 이름 댓글: 이름 추출을 search 대신 finditer 한 번으로 (첫 이름은 동일)
+        multi_name = self.profile.multi_name_replies and roster is not None
 
         attendance_list = []
         seen_names = set()  # 일반 이름 기준 중복 제거
         seen_user_ids = set()  # 동명이인용 User ID 기준 중복 제거
 
         for reply in replies:
-            text = reply.get('text', '')
-            user_info = reply.get('user_info')
-            user_id = reply.get('user_id')
-
-            # 텍스트에서 이름 추출
-            name = self.extract_name_from_text(text)
+            text = reply.text
+            user_info = reply.user_info
+            user_id = reply.user_id
+
+            # 댓글 분석 (finditer 한 번, 같은 텍스트·프로필이면 이전 실행의 결과 재사용)
+            parsed = self._analyze_reply(reply)
+            name = parsed.first_name
+
+            # 바인딩된 사용자: 출석 키워드가 있거나 "본인이름/" 형태이면 User ID로 바로 매칭
+            binding = bindings.get(user_id) if user_id else None
+            bound = binding is not None and (
+                parsed.has_keyword or (parsed.has_separator and binding[0] in text)
+            )
+
+            # 여러 이름 댓글: 명단에 있는 이름만 (바인딩 댓글은 여러 이름을 구분자로 나열한 경우만)
+            roster_names = ()
+            if multi_name and (not bound or parsed.has_separator):
+                roster_names = [
+                    found for found in parsed.names if found in roster or found in duplicate_index.names
+                ]
+
+            if len(roster_names) >= 2:
+                # 여러 이름 댓글: 이름마다 같은 중복 규칙 적용
+                stats['multi_name'] += len(roster_names) - 1
+                self._parse_multi_name_reply(
+                    reply, roster_names, binding, duplicate_index, name_index,
+                    seen_names, seen_user_ids, attendance_list, stats, debug
+                )
+                continue
+
+            if bound:
+                bound_name, bound_row = binding
+
+                if bound_name in seen_names or user_id in seen_user_ids:
+                    stats['duplicate_reply'] += 1
+                    if debug:
+                        logger.debug("  ⚠ %s - 중복 (이미 출석 처리됨)", bound_name)
+                    continue
+
+                # 학습된 User ID 바인딩으로 매칭
+                attendance_list.append(AttendanceRecord(bound_name, reply, 'binding', bound_row, True))
+                seen_names.add(bound_name)
+                seen_user_ids.add(user_id)
+                stats['matched'] += 1
+                if debug:
+                    logger.debug("  ✓ %s - 출석 확인 (User ID 바인딩)", bound_name)
+                continue
 
             if name:
                 # 동명이인 처리: 댓글에서 추출한 이름이 duplicate_names에 있는지 확인
                 final_name = name
                 sheet_row = None
 
-                if name in duplicate_names:
+                if name in duplicate_index.names:
                     # 동명이인: User ID 중복 체크
                     if user_id in seen_user_ids:
-                        print(f"  ⚠ User ID {user_id} - 중복 (이미 출석 처리됨)")
+                        stats['duplicate_reply'] += 1
+                        if debug:
+                            logger.debug("  ⚠ User ID %s - 중복 (이미 출석 처리됨)", user_id)
                         continue
 
-                    # User ID로 정확한 이름과 행 번호 찾기
-                    matched = False
-                    print(f"  [디버그] '{name}' 동명이인 그룹 발견, User ID: {user_id}")
-                    for person in duplicate_names[name]:
-                        print(f"    - 비교: {person.get('user_id')} vs {user_id}")
-                        if person.get('user_id') == user_id:
-                            raw_display_name = person.get('display_name', name)
-                            final_name = self.normalize_name(raw_display_name)
-                            sheet_row = person.get('sheet_row')
-                            matched = True
-                            print(f"  ✓ {final_name} (동명이인 매칭: {name} → {final_name}, 행: {sheet_row})")
-                            break
-
-                    if not matched:
-                        print(f"  ⚠ {name} - 동명이인 그룹에 있지만 User ID {user_id} 매칭 실패")
-                        print(f"     등록된 User ID들: {[p.get('user_id') for p in duplicate_names[name]]}")
+                    # User ID로 정확한 이름과 행 번호 찾기 (O(1) 조회)
+                    resolved = duplicate_index.resolve(name, user_id)
+
+                    if resolved is None:
+                        stats['duplicate_name_unmatched'] += 1
+                        if debug:
+                            logger.debug("  ⚠ %s - 동명이인 그룹에 있지만 User ID %s 매칭 실패", name, user_id)
                         continue  # 매칭 실패 시 스킵
 
+                    final_name, sheet_row = resolved
+                    stats['duplicate_name_matched'] += 1
+                    if debug:
+                        logger.debug("  ✓ %s (동명이인 매칭: %s → %s, 행: %s)", final_name, name, final_name, sheet_row)
+
                     seen_user_ids.add(user_id)  # 동명이인은 User ID로 중복 체크
                 else:
                     # 일반 이름: 이름 중복 체크
                     if name in seen_names:
-                        print(f"  ⚠ {name} - 중복 (이미 출석 처리됨)")
+                        stats['duplicate_reply'] += 1
+                        if debug:
+                            logger.debug("  ⚠ %s - 중복 (이미 출석 처리됨)", name)
                         continue
 
-                    print(f"  ✓ {final_name} - 출석 확인")
+                    if debug:
+                        logger.debug("  ✓ %s - 출석 확인", final_name)
                     seen_names.add(name)  # 일반 이름은 이름으로 중복 체크
 
-                attendance_list.append({
-                    'name': final_name,
-                    'text': text,
-                    'user_id': user_id,
-                    'user_info': user_info,
-                    'timestamp': reply.get('timestamp'),
-                    'source': 'text_pattern',  # 텍스트 패턴으로 추출
-                    'sheet_row': sheet_row  # 동명이인인 경우 직접 지정된 행 번호
-                })
+                stats['matched'] += 1
+
+                # 텍스트 패턴으로 추출 (sheet_row: 동명이인인 경우 직접 지정된 행 번호)
+                # 동명이인 매핑 또는 본인 슬랙 이름과 일치할 때만 확실한 매칭
+                confident = sheet_row is not None or final_name == self._profile_name(user_info, name_index)
+                attendance_list.append(AttendanceRecord(final_name, reply, 'text_pattern', sheet_row, confident))
             else:
                 # 패턴 매칭 실패 시 실명으로 시도
                 if user_info:
@@ -157,77 +365,244 @@ class AttendanceParser:
                     display_name = user_info.get('display_name', '')
 
                     # 실명 또는 표시 이름이 있고, 출석 키워드가 포함된 경우
-                    if self._contains_attendance_keyword(text):
+                    if parsed.has_keyword:
                         raw_fallback_name = display_name or real_name
                         # / 또는 _ 앞의 이름만 추출
                         fallback_name = self.normalize_name(raw_fallback_name) if raw_fallback_name else ''
 
+                        # 영문 슬랙 이름이면 로마자 표기 색인으로 명단 이름 찾기
+                        if name_index is not None:
+                            fallback_name = name_index.lookup_profile(user_info) or fallback_name
+
                         if fallback_name and fallback_name not in seen_names:
-                            attendance_list.append({
-                                'name': fallback_name,
-                                'text': text,
-                                'user_id': user_id,
-                                'user_info': user_info,
-                                'timestamp': reply.get('timestamp'),
-                                'source': 'slack_name',  # 슬랙 이름으로 추출
-                                'sheet_row': None
-                            })
+                            # 슬랙 이름으로 추출
+                            attendance_list.append(AttendanceRecord(fallback_name, reply, 'slack_name', None, True))
                             seen_names.add(fallback_name)
                             # seen_user_ids.add(user_id)  # [주석처리] 추후 필요 시 활성화
-                            print(f"  ✓ {fallback_name} - 출석 확인 (슬랙 이름 사용: {raw_fallback_name})")
-
-        print(f"\n✓ 출석 파싱 완료: {len(attendance_list)}명")
+                            stats['matched'] += 1
+                            if debug:
+                                logger.debug("  ✓ %s - 출석 확인 (슬랙 이름 사용: %s)", fallback_name, raw_fallback_name)
+                        elif fallback_name:
+                            stats['duplicate_reply'] += 1
 
         return attendance_list
 
-    def _contains_attendance_keyword(self, text: str) -> bool:
+    def _parse_multi_name_reply(
+        self,
+        reply: Reply,
+        names: List[str],
+        binding: Optional[Tuple[str, int]],
+        duplicate_index: 'DuplicateNameIndex',
+        name_index: Optional[TransliterationIndex],
+        seen_names: Set[str],
+        seen_user_ids: Set[str],
+        attendance_list: List[AttendanceRecord],
+        stats: Counter,
+        debug: bool
+    ):
+        """
+        여러 이름 댓글 처리 ("홍길동/김철수/이영희 출석")
+
+        이름마다 한 댓글과 같은 규칙으로 중복을 제거합니다.
+        - 작성자의 바인딩 이름: User ID 바인딩 매칭
+        - 동명이인 그룹 이름: 작성자 User ID로만 판별 (다른 사람 몫은 매칭 실패)
+        - 일반 이름: 이름 기준 중복 제거 (작성자 본인 이름일 때만 확실한 매칭)
+        """
+        user_id = reply.user_id
+        profile_name = self._profile_name(reply.user_info, name_index)
+
+        for name in names:
+            if binding is not None and name == binding[0]:
+                if name in seen_names or user_id in seen_user_ids:
+                    stats['duplicate_reply'] += 1
+                    continue
+                attendance_list.append(AttendanceRecord(name, reply, 'binding', binding[1], True))
+                seen_names.add(name)
+                seen_user_ids.add(user_id)
+            elif name in duplicate_index.names:
+                if user_id in seen_user_ids:
+                    stats['duplicate_reply'] += 1
+                    continue
+                resolved = duplicate_index.resolve(name, user_id)
+                if resolved is None:
+                    stats['duplicate_name_unmatched'] += 1
+                    continue
+                final_name, sheet_row = resolved
+                confident = sheet_row is not None or final_name == profile_name
+                attendance_list.append(AttendanceRecord(final_name, reply, 'text_pattern', sheet_row, confident))
+                seen_user_ids.add(user_id)
+                stats['duplicate_name_matched'] += 1
+            else:
+                if name in seen_names:
+                    stats['duplicate_reply'] += 1
+                    continue
+                attendance_list.append(AttendanceRecord(name, reply, 'text_pattern', None, name == profile_name))
+                seen_names.add(name)
+
+            stats['matched'] += 1
+            if debug:
+                logger.debug("  ✓ %s - 출석 확인 (여러 이름 댓글)", attendance_list[-1].name)
+
+    def _finish_stats(self, stats: Counter, attendance_list: List[AttendanceRecord]):
+        """
+        파싱 집계 마무리 및 요약 로그 (댓글별 로그 대신 한 줄)
+
+        Args:
+            stats (Counter): replies, multi_name, matched, duplicate_reply, duplicate_name_matched,
+                duplicate_name_unmatched
+            attendance_list (List[AttendanceRecord]): 파싱 결과
+        """
+        # 여러 이름 댓글의 추가 이름도 한 댓글처럼 matched/중복/매칭 실패 중 하나로 집계됨
+        stats['ignored'] = (stats['replies'] + stats['multi_name'] - stats['matched']
+                            - stats['duplicate_reply'] - stats['duplicate_name_unmatched'])
+        self.stats = Counter({key: stats[key] for key in self.STAT_KEYS})
+
+        logger.info(
+            "\n✓ 출석 파싱 완료: %s명 (댓글 %s개, 중복 %s개, 동명이인 매칭 실패 %s개, 출석 아님 %s개)",
+            len(attendance_list), stats['replies'], stats['duplicate_reply'],
+            stats['duplicate_name_unmatched'], stats['ignored']
+        )
+        if stats['duplicate_name_unmatched']:
+            # 동명이인 설정 누락 가능성 (상세 목록은 parser 로그 레벨을 DEBUG로)
+            logger.warning("  ⚠ 동명이인 그룹 이름을 썼지만 User ID가 등록되지 않은 댓글: %s개",
+                           stats['duplicate_name_unmatched'])
+
+    def is_candidate_reply(self, text: str) -> bool:
         """
-        텍스트에 출석 키워드가 포함되어 있는지 확인
+        출석 댓글이 될 수 있는지 확인 (사용자 정보 수집 전 필터)
+
+        출석 패턴과 슬랙 이름 폴백 모두 구분자('/') 또는 출석 키워드가 있어야 하므로,
+        둘 다 없는 댓글은 사용자 정보를 조회하지 않고 건너뜁니다.
+        (프로필에 학번 형식처럼 구분자 없는 형식이 있으면 정규식으로 한 번 더 확인)
 
         Args:
-            text (str): 텍스트
+            text (str): 댓글 텍스트
 
         Returns:
-            bool: 포함 여부
+            bool: 파싱 대상이면 True
         """
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in self.ATTENDANCE_KEYWORDS)
+        return self.profile.is_candidate(text)
 
-    def get_attendance_summary(self, attendance_list: List[Dict]) -> Dict:
+    def _profile_name(self, user_info: Optional[Dict], name_index: Optional[TransliterationIndex]) -> str:
+        """
+        슬랙 프로필에서 이름 추출 (출석 파싱의 슬랙 이름 폴백과 같은 규칙)
+
+        Args:
+            user_info (Optional[Dict]): 슬랙 사용자 정보
+            name_index (Optional[TransliterationIndex]): 로마자 표기 색인
+
+        Returns:
+            str: 프로필 이름 (없으면 빈 문자열)
+        """
+        if not user_info:
+            return ''
+
+        if name_index is not None:
+            romanized = name_index.lookup_profile(user_info)
+            if romanized:
+                return romanized
+
+        raw_name = user_info.get('display_name', '') or user_info.get('real_name', '')
+        return self.normalize_name(raw_name) if raw_name else ''
+
+    def get_attendance_summary(self, attendance_list: List[AttendanceRecord]) -> Dict:
         """
         출석 요약 정보 생성
 
         Args:
-            attendance_list (List[Dict]): 출석 리스트
+            attendance_list (List[AttendanceRecord]): 출석 리스트
 
         Returns:
             Dict: 요약 정보
         """
-        names = [item['name'] for item in attendance_list]
+        names = [item.name for item in attendance_list]
 
         return {
             'total_count': len(names),
             'names': sorted(names),  # 가나다순 정렬
             'by_source': {
-                'text_pattern': len([x for x in attendance_list if x['source'] == 'text_pattern']),
-                'slack_name': len([x for x in attendance_list if x['source'] == 'slack_name']),
-            }
+                'text_pattern': len([x for x in attendance_list if x.source == 'text_pattern']),
+                'slack_name': len([x for x in attendance_list if x.source == 'slack_name']),
+                'binding': len([x for x in attendance_list if x.source == 'binding']),
+            },
+            'parse_stats': dict(self.stats)  # 마지막 파싱 집계 (중복, 매칭 실패 등)
         }
 
 
+class DuplicateNameIndex:
+    """
+    동명이인 설정(duplicate_names)을 컴파일한 색인
+
+    {(그룹 이름, User ID): (최종 이름, 행 번호)} 맵과 동명이인 그룹 이름 집합으로
+    그룹 순회 없이 O(1)로 동명이인을 판별합니다.
+    (한 User ID가 여러 그룹에 있어도 그룹마다 따로 기록)
+    """
+
+    def __init__(self, duplicate_names: Dict):
+        """
+        Args:
+            duplicate_names (Dict): 동명이인 매핑 정보
+                예: {"홍길동": [{"user_id": "U123", "display_name": "홍길동_컴공", "sheet_row": 5}, ...]}
+        """
+        self.names: Set[str] = set(duplicate_names.keys())
+        self.by_group_user: Dict[Tuple[str, str], Tuple[str, Optional[int]]] = {}
+
+        for group_name, persons in duplicate_names.items():
+            for person in persons:
+                user_id = person.get('user_id')
+                # 그룹 안에서 먼저 등록된 항목 우선 (기존 순회 방식과 동일)
+                if not user_id or (group_name, user_id) in self.by_group_user:
+                    continue
+
+                raw_display_name = person.get('display_name', group_name)
+                self.by_group_user[(group_name, user_id)] = (
+                    AttendanceParser.normalize_name(raw_display_name),
+                    person.get('sheet_row')
+                )
+
+    def __len__(self) -> int:
+        return len(self.by_group_user)
+
+    def rows(self) -> List[Tuple[str, str, str, Optional[int]]]:
+        """
+        색인을 표 형태로 반환 (일괄 파서의 조인용)
+
+        Returns:
+            List[Tuple]: [(User ID, 동명이인 그룹 이름, 최종 이름, 행 번호), ...]
+        """
+        return [
+            (user_id, group_name, final_name, sheet_row)
+            for (group_name, user_id), (final_name, sheet_row) in self.by_group_user.items()
+        ]
+
+    def resolve(self, name: str, user_id: Optional[str]) -> Optional[Tuple[str, Optional[int]]]:
+        """
+        동명이인 그룹 이름과 User ID로 (최종 이름, 행 번호) 찾기
+
+        Args:
+            name (str): 댓글에서 추출한 이름 (동명이인 그룹 이름)
+            user_id (Optional[str]): 댓글 작성자 User ID
+
+        Returns:
+            Optional[Tuple[str, Optional[int]]]: (최종 이름, 행 번호), 그룹에 없는 User ID면 None
+        """
+        return self.by_group_user.get((name, user_id))
+
+
 # 테스트 코드
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     parser = AttendanceParser()
 
     # 테스트 데이터
     test_replies = [
-        {'text': '김철수/출석했습니다', 'user_info': {'real_name': '김철수'}},
-        {'text': '이영희 출석', 'user_info': {'real_name': '이영희'}},
-        {'text': '박민수/입실했습니다', 'user_info': {'real_name': '박민수'}},
-        {'text': '최지우 출석해요', 'user_info': {'real_name': '최지우'}},
-        {'text': '출석했습니다', 'user_info': {'real_name': '홍길동', 'display_name': '홍길동'}},
-        {'text': '안녕하세요', 'user_info': {'real_name': '미출석자'}},  # 출석 아님
-        {'text': '김철수/출석했습니다', 'user_info': {'real_name': '김철수'}},  # 중복
+        Reply('김철수/출석했습니다', user_info={'real_name': '김철수'}),
+        Reply('이영희 출석', user_info={'real_name': '이영희'}),
+        Reply('박민수/입실했습니다', user_info={'real_name': '박민수'}),
+        Reply('최지우 출석해요', user_info={'real_name': '최지우'}),
+        Reply('출석했습니다', user_info={'real_name': '홍길동', 'display_name': '홍길동'}),
+        Reply('안녕하세요', user_info={'real_name': '미출석자'}),  # 출석 아님
+        Reply('김철수/출석했습니다', user_info={'real_name': '김철수'}),  # 중복
     ]
 
     print("=== 출석 파싱 테스트 ===")
@@ -235,10 +610,22 @@ if __name__ == '__main__':
 
     print("\n=== 출석자 목록 ===")
     for item in attendance_list:
-        print(f"  - {item['name']} ({item['source']})")
+        print(f"  - {item.name} ({item.source})")
 
     print("\n=== 요약 ===")
     summary = parser.get_attendance_summary(attendance_list)
     print(f"  총 출석: {summary['total_count']}명")
     print(f"  텍스트 패턴: {summary['by_source']['text_pattern']}명")
     print(f"  슬랙 이름: {summary['by_source']['slack_name']}명")
+
+    print("\n=== 동명이인 색인 테스트 ===")
+    # 한 사람이 두 동명이인 그룹에 모두 있는 경우 (그룹마다 따로 찾아져야 함)
+    duplicate_index = DuplicateNameIndex({
+        '김민준': [{'user_id': 'U1', 'display_name': '김민준_컴공', 'sheet_row': 5},
+                  {'user_id': 'U2', 'display_name': '김민준_경영', 'sheet_row': 6}],
+        '민준': [{'user_id': 'U1', 'display_name': '민준A', 'sheet_row': 9}],
+    })
+    assert duplicate_index.resolve('김민준', 'U1') == ('김민준', 5)
+    assert duplicate_index.resolve('민준', 'U1') == ('민준A', 9)
+    assert duplicate_index.resolve('민준', 'U2') is None
+    print("  그룹별 조회 OK")
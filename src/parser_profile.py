@@ -0,0 +1,256 @@
+"""
+출석 파서 프로필 모듈
+워크스페이스마다 다른 출석 댓글 형식("이름/출석", "[이름] 입실", 학번 앞 붙이기 등)을
+config.json의 parser_profile로 정의하고, 정규식으로 한 번만 컴파일해 재사용합니다.
+
+config.json 예시:
+    "parser_profile": {
+        "keywords": ["출석", "입실"],       # 출석 키워드 (생략 시 기본 키워드)
+        "separators": ["/"],                # 이름 뒤 구분자 (생략 시 "/")
+        "bracket_names": true,              # "[홍길동] 입실" 형식 허용
+        "student_number_prefix": true,      # "20231234 홍길동" 형식 허용 (학번 뒤 이름)
+        "patterns": [],                     # 추가 정규식 (캡처 그룹 1개 = 이름)
+        "multi_name_replies": true          # "홍길동/김철수/이영희 출석" 여러 이름 댓글 인정 (기본 true)
+    }
+"""
+import hashlib
+import json
+import logging
+import re
+import time
+from typing import Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기본 출석 키워드 ("이름/출석" 형식)
+DEFAULT_KEYWORDS: Tuple[str, ...] = (
+    '출석',
+    '출석했습니다',
+    '출석해요',
+    '출석합니다',
+    '입실',
+    '입실했습니다',
+)
+
+# 기본 이름 뒤 구분자
+DEFAULT_SEPARATORS: Tuple[str, ...] = ('/',)
+
+# 이름 캡처 그룹 (한글/영문)
+NAME_PATTERN = r'([가-힣a-zA-Z]+)'
+
+# 컴파일된 프로필 캐시: {프로필 해시: ParserProfile}
+# 같은 내용의 프로필을 쓰는 워크스페이스, 스케줄러와 라우트가 모두 같은 객체를 공유합니다.
+_profile_cache: Dict[str, 'ParserProfile'] = {}
+
+
+class ParserProfile:
+    """
+    컴파일된 출석 파서 프로필
+
+    이름 추출 정규식(형식별 패턴을 하나의 교대(|) 패턴으로 결합)과
+    키워드 검사 정규식(키워드 전체를 하나의 교대 패턴으로 결합)을 보관합니다.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        keywords: Tuple[str, ...],
+        separators: Tuple[str, ...],
+        bracket_names: bool = False,
+        student_number_prefix: bool = False,
+        patterns: Tuple[str, ...] = (),
+        multi_name_replies: bool = True
+    ):
+        """
+        Args:
+            key (str): 프로필 해시 (캐시 키)
+            keywords (Tuple[str, ...]): 출석 키워드
+            separators (Tuple[str, ...]): 이름 뒤 구분자
+            bracket_names (bool): "[이름] 키워드" 형식 허용
+            student_number_prefix (bool): "학번 이름" 형식 허용
+            patterns (Tuple[str, ...]): 추가 정규식 (캡처 그룹 1개)
+            multi_name_replies (bool): 한 댓글의 여러 이름(명단에 있는 이름만) 출석 인정
+        """
+        start = time.perf_counter()
+
+        self.key = key
+        self.keywords = keywords
+        self.separators = separators
+        self.bracket_names = bracket_names
+        self.student_number_prefix = student_number_prefix
+        self.patterns = patterns
+        self.multi_name_replies = multi_name_replies
+
+        keyword_alternation = '|'.join(re.escape(keyword) for keyword in keywords)
+        separator_alternation = '|'.join(re.escape(separator) for separator in separators)
+
+        # 키워드 검사: 긴 키워드부터 시도하는 단일 교대 패턴 (키워드마다 문자열 검색하지 않음)
+        self.keyword_pattern = re.compile(
+            '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)),
+            re.IGNORECASE
+        )
+        self.separator_pattern = re.compile(separator_alternation)
+
+        # 이름 뒤에 와야 하는 구분자 또는 키워드
+        tail = '(?:' + '|'.join(filter(None, (separator_alternation, keyword_alternation))) + ')'
+
+        # 형식별 패턴 (앞쪽 패턴 우선, 기본 "이름/" · "이름 출석" 패턴은 항상 마지막)
+        alternatives = list(patterns)
+        if student_number_prefix:
+            # "20231234 홍길동", "20231234-홍길동/" (키워드 자체를 이름으로 잡지 않음)
+            alternatives.append(
+                r'\d{4,10}\s*[-_./]?\s*(?!(?:' + keyword_alternation + r')(?![가-힣a-zA-Z]))' + NAME_PATTERN
+            )
+        if bracket_names:
+            # "[홍길동] 입실", "[홍길동]/출석"
+            alternatives.append(r'\[\s*' + NAME_PATTERN + r'\s*\]\s*' + tail)
+        alternatives.append(NAME_PATTERN + r'\s*' + tail)
+
+        self.pattern = re.compile('|'.join(alternatives), re.IGNORECASE)
+
+        # 구분자·키워드 없이도 출석으로 인정되는 형식이 있으면 후보 필터에서 정규식 확인 필요
+        self.pattern_only_forms = bool(patterns) or student_number_prefix
+
+        self.compile_ms = (time.perf_counter() - start) * 1000
+
+    def extract_raw_name(self, text: str) -> Optional[str]:
+        """
+        텍스트에서 정규화 전 이름 추출
+
+        Args:
+            text (str): 댓글 텍스트
+
+        Returns:
+            Optional[str]: 매칭된 형식의 이름 그룹 (없으면 None)
+        """
+        match = self.pattern.search(text)
+        if match is None or match.lastindex is None:
+            return None
+        # 형식마다 캡처 그룹이 하나뿐이므로 마지막으로 매칭된 그룹이 이름
+        return match.group(match.lastindex)
+
+    def iter_raw_names(self, text: str) -> Iterator[Optional[str]]:
+        """
+        텍스트의 모든 이름을 등장 순서대로 추출 (finditer 한 번, 텍스트 길이에 선형)
+
+        첫 번째 결과는 extract_raw_name과 같습니다.
+        예: "홍길동/김철수/이영희 출석" → 홍길동, 김철수, 이영희
+
+        Args:
+            text (str): 댓글 텍스트
+
+        Yields:
+            Optional[str]: 정규화 전 이름 (이름 그룹이 매칭되지 않은 매치는 None)
+        """
+        for match in self.pattern.finditer(text):
+            yield match.group(match.lastindex) if match.lastindex is not None else None
+
+    def contains_keyword(self, text: str) -> bool:
+        """출석 키워드 포함 여부"""
+        return self.keyword_pattern.search(text) is not None
+
+    def contains_separator(self, text: str) -> bool:
+        """이름 뒤 구분자 포함 여부"""
+        if not self.separators:
+            return False
+        if len(self.separators) == 1:
+            return self.separators[0] in text
+        return self.separator_pattern.search(text) is not None
+
+    def is_candidate(self, text: str) -> bool:
+        """
+        출석 댓글이 될 수 있는지 확인 (사용자 정보 수집 전 필터)
+
+        Args:
+            text (str): 댓글 텍스트
+
+        Returns:
+            bool: 구분자나 키워드가 있거나, 구분자 없는 형식(학번 등)에 매칭되면 True
+        """
+        if self.contains_separator(text) or self.contains_keyword(text):
+            return True
+        return self.pattern_only_forms and self.pattern.search(text) is not None
+
+
+def _normalize_profile_config(config: Dict) -> Dict:
+    """
+    config.json의 parser_profile을 검증하고 해시 가능한 형태로 정리
+
+    Args:
+        config (Dict): parser_profile 설정
+
+    Returns:
+        Dict: ParserProfile 생성 인자
+
+    Raises:
+        ValueError: 설정 형식이 잘못된 경우
+    """
+    if not isinstance(config, dict):
+        raise ValueError("parser_profile은 객체(dict)여야 합니다.")
+
+    def string_list(field: str, default: Tuple[str, ...]) -> Tuple[str, ...]:
+        value = config.get(field)
+        if value is None:
+            return default
+        if not isinstance(value, list) or not all(isinstance(item, str) and item for item in value):
+            raise ValueError(f"parser_profile.{field}는 비어 있지 않은 문자열 목록이어야 합니다.")
+        return tuple(value)
+
+    keywords = string_list('keywords', DEFAULT_KEYWORDS)
+    separators = string_list('separators', DEFAULT_SEPARATORS)
+    patterns = string_list('patterns', ())
+
+    if not keywords:
+        raise ValueError("parser_profile.keywords는 하나 이상 필요합니다.")
+
+    for pattern in patterns:
+        try:
+            groups = re.compile(pattern).groups
+        except re.error as e:
+            raise ValueError(f"parser_profile.patterns 정규식 오류 ({pattern}): {e}")
+        if groups != 1:
+            raise ValueError(f"parser_profile.patterns는 이름 캡처 그룹이 정확히 1개여야 합니다: {pattern}")
+
+    unknown = set(config) - {'keywords', 'separators', 'bracket_names', 'student_number_prefix', 'patterns',
+                             'multi_name_replies'}
+    if unknown:
+        logger.warning("⚠ parser_profile의 알 수 없는 항목 무시: %s", ', '.join(sorted(unknown)))
+
+    return {
+        'keywords': keywords,
+        'separators': separators,
+        'bracket_names': bool(config.get('bracket_names', False)),
+        'student_number_prefix': bool(config.get('student_number_prefix', False)),
+        'patterns': patterns,
+        'multi_name_replies': bool(config.get('multi_name_replies', True)),
+    }
+
+
+def compile_profile(config: Optional[Dict] = None) -> ParserProfile:
+    """
+    parser_profile 설정을 컴파일 (프로필 해시 기준으로 캐시)
+
+    Args:
+        config (Optional[Dict]): parser_profile 설정 (None이면 기본 "이름/출석" 프로필)
+
+    Returns:
+        ParserProfile: 컴파일된 프로필 (같은 내용이면 같은 객체)
+
+    Raises:
+        ValueError: 설정 형식이나 정규식이 잘못된 경우
+    """
+    normalized = _normalize_profile_config(config or {})
+    serialized = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+    key = hashlib.sha1(serialized.encode('utf-8')).hexdigest()[:12]
+
+    profile = _profile_cache.get(key)
+    if profile is None:
+        try:
+            profile = ParserProfile(key, **normalized)
+        except re.error as e:
+            raise ValueError(f"parser_profile 정규식 결합 오류: {e}")
+        _profile_cache[key] = profile
+        logger.debug("파서 프로필 컴파일: %s (%.2fms)", key, profile.compile_ms)
+
+    return profile
+
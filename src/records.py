@@ -0,0 +1,117 @@
+"""
+댓글/출석 레코드 모듈
+댓글 하나, 출석자 한 명을 __slots__ 객체로 표현해 댓글 수천 개 스레드에서도
+레코드당 메모리를 작게 유지합니다.
+
+- User ID는 sys.intern으로 같은 문자열 객체를 공유
+- 사용자 정보(user_info)는 SlackHandler.user_cache의 딕셔너리를 참조로 공유
+- 출석 레코드는 원본 댓글을 참조하므로 text/user_info/timestamp를 복사하지 않음
+"""
+import sys
+from typing import Dict, Optional
+
+
+def intern_user_id(user_id: Optional[str]) -> Optional[str]:
+    """User ID 문자열 인터닝 (None은 그대로)"""
+    return sys.intern(user_id) if user_id else user_id
+
+
+class Reply:
+    """사용자 정보가 붙은 슬랙 댓글 하나"""
+
+    __slots__ = ('user_id', 'user_info', 'text', 'timestamp', 'edited_ts')
+
+    def __init__(
+        self,
+        text: str = '',
+        user_id: Optional[str] = None,
+        user_info: Optional[Dict] = None,
+        timestamp: str = '',
+        edited_ts: str = ''
+    ):
+        """
+        Args:
+            text: 댓글 텍스트
+            user_id: Slack User ID (인터닝됨)
+            user_info: 사용자 정보 (캐시된 딕셔너리를 그대로 참조)
+            timestamp: 댓글 타임스탬프
+            edited_ts: 마지막 수정 타임스탬프 (edited.ts, 수정되지 않았으면 빈 문자열)
+        """
+        self.text = text
+        self.user_id = intern_user_id(user_id)
+        self.user_info = user_info
+        self.timestamp = timestamp
+        self.edited_ts = edited_ts
+
+    def __repr__(self) -> str:
+        return f"Reply(user_id={self.user_id!r}, text={self.text[:30]!r}, timestamp={self.timestamp!r})"
+
+    def to_dict(self) -> Dict:
+        """JSON 응답/로그용 딕셔너리 변환"""
+        return {
+            'user_id': self.user_id,
+            'user_info': self.user_info,
+            'text': self.text,
+            'timestamp': self.timestamp,
+            'edited_ts': self.edited_ts,
+        }
+
+
+class AttendanceRecord:
+    """파싱된 출석자 한 명 (원본 댓글 참조)"""
+
+    __slots__ = ('name', 'reply', 'source', 'sheet_row', 'confident')
+
+    def __init__(
+        self,
+        name: str,
+        reply: Reply,
+        source: str,
+        sheet_row: Optional[int] = None,
+        confident: bool = False
+    ):
+        """
+        Args:
+            name: 최종 출석자 이름 (명단 이름)
+            reply: 출석 근거가 된 댓글
+            source: 추출 방식 ('text_pattern', 'slack_name', 'binding')
+            sheet_row: 직접 지정된 행 번호 (동명이인/바인딩), 없으면 None
+            confident: 바인딩으로 학습해도 되는 확실한 매칭 여부
+        """
+        self.name = name
+        self.reply = reply
+        self.source = source
+        self.sheet_row = sheet_row
+        self.confident = confident
+
+    @property
+    def text(self) -> str:
+        return self.reply.text
+
+    @property
+    def user_id(self) -> Optional[str]:
+        return self.reply.user_id
+
+    @property
+    def user_info(self) -> Optional[Dict]:
+        return self.reply.user_info
+
+    @property
+    def timestamp(self) -> str:
+        return self.reply.timestamp
+
+    def __repr__(self) -> str:
+        return f"AttendanceRecord(name={self.name!r}, source={self.source!r}, sheet_row={self.sheet_row!r})"
+
+    def to_dict(self) -> Dict:
+        """JSON 응답/로그용 딕셔너리 변환"""
+        return {
+            'name': self.name,
+            'text': self.text,
+            'user_id': self.user_id,
+            'user_info': self.user_info,
+            'timestamp': self.timestamp,
+            'source': self.source,
+            'sheet_row': self.sheet_row,
+            'confident': self.confident,
+        }
@@ -0,0 +1,266 @@
+"""
+학생 명단 색인 모듈
+시트에서 읽은 {이름: 행번호} 명단을 이름·정규화 키·행 번호 해시 색인으로 보관해
+출석/과제 매칭에서 리스트 순회 없이 O(1)로 조회합니다.
+
+- RosterIndex는 {이름: 행번호} 딕셔너리처럼 쓸 수 있음 (Mapping, 기존 students 인자 자리에 그대로 전달)
+- 출석·과제 서비스와 스케줄러 출석 체크가 같은 방식으로 미출석/미제출 명단을 계산
+- 명단 열 내용의 해시(fingerprint)로 색인을 캐시해, 명단이 그대로면 시트 읽기 외의 재구성 비용 없음
+- 캐시된 색인은 명단 내용이 같은 모든 워크스페이스가 공유하므로 생성 후 바뀌지 않음
+  (지연 생성하는 로마자 색인·파생 구조도 명단 내용만으로 만들어짐)
+- 워크스페이스별 별칭(config.json의 name_aliases)은 색인에 넣지 않고 compile_aliases 결과를 resolve에 넘김
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.transliteration import TransliterationIndex
+
+# 명단 색인 캐시 최대 개수 (워크스페이스 × 명단 시트)
+ROSTER_CACHE_SIZE = 32
+
+# 명단 색인 캐시: {명단 해시: RosterIndex} (LRU, 스케줄러와 라우트가 공유)
+_roster_cache: 'OrderedDict[str, RosterIndex]' = OrderedDict()
+_roster_cache_lock = threading.Lock()
+
+
+def normalize_key(name: str) -> str:
+    """비교용 이름 키 (공백 제거, 소문자)"""
+    return ''.join(name.split()).lower()
+
+
+def compile_aliases(aliases: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """
+    별칭 설정 → 조회용 해시 색인
+
+    Args:
+        aliases: {별칭: 명단 이름} (예: {"Gildong": "홍길동", "홍길동_컴공": "홍길동"})
+
+    Returns:
+        Dict[str, str]: {별칭의 정규화 키: 명단 이름}
+    """
+    compiled = {}
+    for alias, name in (aliases or {}).items():
+        key = normalize_key(alias)
+        if key and name:
+            compiled[key] = name
+    return compiled
+
+
+class RosterIndex(Mapping):
+    """학생 명단 색인 (이름 → 행, 행 → 이름, 정규화 키 → 이름, 읽기 전용)"""
+
+    def __init__(
+        self,
+        students: Dict[str, int],
+        fingerprint: Optional[str] = None,
+        names_by_row: Optional[Dict[int, str]] = None
+    ):
+        """
+        Args:
+            students: {이름: 행번호} 딕셔너리 (같은 이름은 마지막 행)
+            fingerprint: 명단 열 내용 해시 (RosterFingerprint, 없으면 캐시하지 않는 색인)
+            names_by_row: 시트의 모든 행 {행번호: 이름} (동명이인의 앞쪽 행 포함, 없으면 students로 생성)
+        """
+        self.fingerprint = fingerprint
+        self._rows: Dict[str, int] = dict(students)
+        self._names_by_row: Dict[int, str] = (
+            dict(names_by_row) if names_by_row is not None
+            else {row: name for name, row in self._rows.items()}
+        )
+
+        # 정규화 키가 겹치는 서로 다른 이름은 모호하므로 None
+        self._keys: Dict[str, Optional[str]] = {}
+        for name in self._rows:
+            key = normalize_key(name)
+            if key:
+                existing = self._keys.get(key, name)
+                self._keys[key] = name if existing == name else None
+
+        self._name_index: Optional[TransliterationIndex] = None
+        # 명단에서 파생된 구조 캐시 (명단이 바뀌면 색인째 교체되므로 따로 무효화하지 않음)
+        self._derived: Dict[str, Any] = {}
+        # 지연 생성 잠금 (여러 워크스페이스·스레드가 같은 색인을 공유)
+        self._lazy_lock = threading.Lock()
+
+    # Mapping 인터페이스 (자주 쓰는 메서드는 내부 딕셔너리에 직접 위임)
+    def __getitem__(self, name: str) -> int:
+        return self._rows[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, name) -> bool:
+        return name in self._rows
+
+    def __repr__(self) -> str:
+        return f"RosterIndex({len(self._rows)}명)"
+
+    def get(self, name: str, default=None):
+        return self._rows.get(name, default)
+
+    def keys(self):
+        return self._rows.keys()
+
+    def values(self):
+        return self._rows.values()
+
+    def items(self):
+        return self._rows.items()
+
+    @property
+    def name_index(self) -> TransliterationIndex:
+        """영문 슬랙 이름 매칭용 로마자 색인 (처음 사용할 때 생성)"""
+        if self._name_index is None:
+            with self._lazy_lock:
+                if self._name_index is None:
+                    self._name_index = TransliterationIndex(self._rows.keys())
+        return self._name_index
+
+    def derived(self, key: str, factory: Callable[['RosterIndex'], Any]) -> Any:
+        """
+        명단에서 파생된 구조를 한 번만 생성해 재사용 (예: 온보딩 유사도 매칭기)
+
+        색인은 명단 내용이 같은 워크스페이스끼리 공유되므로, factory는 명단만으로 구조를 만들어야 하고
+        만든 구조는 이후 바뀌지 않아야 합니다.
+
+        Args:
+            key: 구조 이름
+            factory: 명단 색인을 받아 구조를 만드는 함수
+
+        Returns:
+            Any: 캐시된 구조
+        """
+        value = self._derived.get(key)
+        if value is None:
+            with self._lazy_lock:
+                value = self._derived.get(key)
+                if value is None:
+                    value = self._derived[key] = factory(self)
+        return value
+
+    def name_at(self, row: int) -> Optional[str]:
+        """행 번호의 명단 이름 (없으면 None, 동명이인의 앞쪽 행도 시트의 이름 반환)"""
+        return self._names_by_row.get(row)
+
+    def resolve(self, name: str, aliases: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """
+        이름을 명단 이름으로 변환 (정확 → 별칭 → 정규화 키 순, 예: "홍 길동", "john kim")
+
+        Args:
+            name: 댓글/프로필에서 얻은 이름
+            aliases: 워크스페이스 별칭 (compile_aliases 결과)
+
+        Returns:
+            Optional[str]: 명단 이름 (없거나 모호하면 None)
+        """
+        if name in self._rows:
+            return name
+        key = normalize_key(name)
+        if aliases:
+            alias = aliases.get(key)
+            if alias in self._rows:
+                return alias
+        return self._keys.get(key)
+
+    def canonical(self, names: Iterable[str], aliases: Optional[Dict[str, str]] = None) -> Set[str]:
+        """
+        이름들을 명단 이름으로 변환한 집합 (명단에서 찾지 못한 이름은 그대로)
+
+        Args:
+            names: 댓글/프로필에서 얻은 이름들
+            aliases: 워크스페이스 별칭 (compile_aliases 결과)
+        """
+        rows = self._rows
+        return {name if name in rows else (self.resolve(name, aliases) or name) for name in names}
+
+    def split(self, present: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """
+        명단을 출석(제출)/미출석(미제출)으로 나누기 (명단 순서 유지)
+
+        Args:
+            present: 출석(제출) 이름들 (리스트여도 집합으로 한 번만 변환)
+
+        Returns:
+            Tuple[출석 이름 리스트, 미출석 이름 리스트]
+        """
+        present = present if isinstance(present, (set, frozenset)) else set(present)
+        present_names = []
+        absent_names = []
+        for name in self._rows:
+            (present_names if name in present else absent_names).append(name)
+        return present_names, absent_names
+
+    def absent_names(self, present: Iterable[str]) -> List[str]:
+        """명단에서 present에 없는 이름 (명단 순서)"""
+        return self.split(present)[1]
+
+
+def as_roster_index(students: Dict[str, int]) -> RosterIndex:
+    """get_student_list 결과를 명단 색인으로 (이미 색인이면 그대로, 캐시된 파생 구조 유지)"""
+    return students if isinstance(students, RosterIndex) else RosterIndex(students)
+
+
+class RosterFingerprint:
+    """
+    명단 열 내용 해시를 행 단위로 누적 (나눠 읽어도 한 번에 읽은 것과 같은 값)
+
+    빈 행은 다음 이름이 나올 때 반영하므로 끝부분의 빈 행 수(읽기 단위마다 다름)는 해시에 영향이 없습니다.
+    """
+
+    def __init__(self, start_row: int):
+        """
+        Args:
+            start_row: 시작 행 인덱스 (0-based)
+        """
+        self._digest = hashlib.sha1(str(start_row).encode('utf-8'))
+        self._pending_blanks = 0
+
+    def add(self, cell: str):
+        """셀 값 하나 추가 (빈 셀은 빈 문자열)"""
+        if not cell:
+            self._pending_blanks += 1
+            return
+        self._digest.update(b'\x1e' * (self._pending_blanks + 1))
+        self._digest.update(cell.encode('utf-8'))
+        self._pending_blanks = 0
+
+    def add_blanks(self, count: int):
+        """빈 셀 count개 추가 (응답에서 생략된 구간 끝 빈 행)"""
+        self._pending_blanks += count
+
+    def hexdigest(self) -> str:
+        """해시 (sha1 앞 16자리)"""
+        return self._digest.hexdigest()[:16]
+
+
+def get_cached_roster(fingerprint: str) -> Optional[RosterIndex]:
+    """명단 해시로 캐시된 색인 조회 (없으면 None)"""
+    with _roster_cache_lock:
+        roster = _roster_cache.get(fingerprint)
+        if roster is not None:
+            _roster_cache.move_to_end(fingerprint)
+        return roster
+
+
+def cache_roster(roster: RosterIndex) -> RosterIndex:
+    """
+    명단 색인을 해시 기준으로 캐시 (같은 해시가 이미 있으면 기존 색인 반환)
+
+    Args:
+        roster: fingerprint가 있는 명단 색인
+
+    Returns:
+        RosterIndex: 캐시된 색인
+    """
+    with _roster_cache_lock:
+        cached = _roster_cache.setdefault(roster.fingerprint, roster)
+        _roster_cache.move_to_end(roster.fingerprint)
+        while len(_roster_cache) > ROSTER_CACHE_SIZE:
+            _roster_cache.popitem(last=False)
+        return cached
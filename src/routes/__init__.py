@@ -5,6 +5,8 @@ from .assignment_routes import assignment_bp
 from .workspace_routes import workspace_bp
 from .schedule_routes import schedule_bp
 from .thread_routes import thread_bp
+from .onboarding_routes import onboarding_bp
+from .sheets_routes import sheets_bp
 
 __all__ = [
     'attendance_bp',
@@ -12,4 +14,6 @@ __all__ = [
     'workspace_bp',
     'schedule_bp',
     'thread_bp',
+    'onboarding_bp',
+    'sheets_bp',
 ]
@@ -91,7 +91,7 @@ def run_assignment_check():
     if column_index is None:
         return jsonify({
             'success': False,
-            'error': '올바른 열 형식이 아닙니다. (A-Z만 가능)'
+            'error': '올바른 열 형식이 아닙니다. (예: K, AB)'
         }), 400
 
     # 5. Handler 생성
@@ -126,7 +126,8 @@ def run_assignment_check():
             name_column=workspace.name_column,
             start_row=workspace.start_row,
             assignment_sheet_name=workspace.assignment_sheet_name,
-            mark_absent=mark_absent
+            mark_absent=mark_absent,
+            aliases=workspace.name_aliases
         )
     except ValueError as e:
         return jsonify({
@@ -155,7 +156,8 @@ def run_assignment_check():
             'submitted_count': len(submitted_list),
             'not_submitted_count': len(not_submitted_list),
             'column': column_input,
-            'success_count': success_count
+            'success_count': success_count,
+            'parse_stats': dict(service.parser.stats)  # 댓글 집계 (중복, 이름 없음 등)
         }
     })
 
@@ -1,5 +1,6 @@
 """출석 체크 라우트"""
 
+import logging
 from flask import Blueprint, request, jsonify
 import sys
 from pathlib import Path
@@ -9,19 +10,45 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.services.attendance_service import AttendanceService
+from src.services.assignment_service import AssignmentService
+from src.services.combined_service import CombinedCheckService
+from src.parser import AttendanceParser
 from src.utils.error_handler import safe_error_response
 from src.utils.workspace_helper import validate_workspace_name
 from src.workspace_manager import WorkspaceManager
 from src.slack_handler import SlackHandler
 from src.sheets_handler import SheetsHandler
+from src.binding_store import BindingStore
 from src.utils import parse_slack_thread_link, column_letter_to_index
 
+logger = logging.getLogger(__name__)
+
 attendance_bp = Blueprint('attendance', __name__)
 
 # 워크스페이스 매니저 (싱글톤)
 workspace_manager = WorkspaceManager()
 
 
+def _dm_recipient(workspace, send_dm: bool, thread_user):
+    """출석 결과 DM 수신자 (notification_user_id 우선, 없으면 봇이 아닌 thread_user)"""
+    if not send_dm:
+        return None
+
+    notification_user_id = workspace._config.get('notification_user_id', '')
+    if notification_user_id:
+        logger.info("notification_user_id 사용: %s", notification_user_id)
+        return notification_user_id
+
+    if thread_user:
+        # thread_user가 봇 ID가 아닌 경우만 사용
+        if not (thread_user.startswith('B') or thread_user.startswith('U0SLACKBOT')):
+            logger.info("thread_user 사용: %s", thread_user)
+            return thread_user
+        logger.info("thread_user가 봇이므로 DM 전송 안 함: %s", thread_user)
+
+    return None
+
+
 @attendance_bp.route('/api/run-attendance', methods=['POST'])
 @safe_error_response
 def run_attendance():
@@ -91,7 +118,7 @@ def run_attendance():
     if column_index is None:
         return jsonify({
             'success': False,
-            'error': '올바른 열 형식이 아닙니다. (A-Z만 가능)'
+            'error': '올바른 열 형식이 아닙니다. (예: K, AB)'
         }), 400
 
     # 4. Handler 생성
@@ -115,11 +142,12 @@ def run_attendance():
             'error': '구글 시트 연결에 실패했습니다.'
         }), 500
 
-    # 5. Service 생성 및 실행
-    service = AttendanceService(slack_handler, sheets_handler)
+    # 5. Service 생성 및 실행 (워크스페이스 파서 프로필은 캐시된 컴파일 결과 재사용)
+    service = AttendanceService(slack_handler, sheets_handler, parser=AttendanceParser(workspace.parser_profile))
 
     try:
-        duplicate_names = workspace.duplicate_names if hasattr(workspace, 'duplicate_names') else {}
+        # 동명이인 설정은 config.json이 바뀔 때만 다시 컴파일
+        duplicate_names = workspace.duplicate_name_index
 
         matched_names, absent_names, unmatched_names, success_count, summary = service.run_attendance_check(
             channel_id=workspace.slack_channel_id,
@@ -128,7 +156,9 @@ def run_attendance():
             name_column=workspace.name_column,
             start_row=workspace.start_row,
             mark_absent=mark_absent,
-            duplicate_names=duplicate_names
+            duplicate_names=duplicate_names,
+            binding_store=BindingStore(workspace.path),
+            aliases=workspace.name_aliases
         )
     except ValueError as e:
         return jsonify({
@@ -137,25 +167,10 @@ def run_attendance():
         }), 400
 
     # 6. 알림 전송
-    # notification_user_id를 우선 사용, 없으면 thread_user 사용
-    dm_recipient = None
-    if send_dm:
-        notification_user_id = workspace._config.get('notification_user_id', '')
-        if notification_user_id:
-            dm_recipient = notification_user_id
-            print(f"[INFO] notification_user_id 사용: {dm_recipient}")
-        elif thread_user:
-            # thread_user가 봇 ID가 아닌 경우만 사용
-            if not (thread_user.startswith('B') or thread_user.startswith('U0SLACKBOT')):
-                dm_recipient = thread_user
-                print(f"[INFO] thread_user 사용: {dm_recipient}")
-            else:
-                print(f"[INFO] thread_user가 봇이므로 DM 전송 안 함: {thread_user}")
-
     notifications = service.send_notifications(
         channel_id=workspace.slack_channel_id,
         thread_ts=thread_ts,
-        thread_user=dm_recipient,
+        thread_user=_dm_recipient(workspace, send_dm, thread_user),
         matched_names=matched_names,
         absent_names=absent_names,
         total_students=len(matched_names) + len(absent_names),
@@ -176,6 +191,307 @@ def run_attendance():
             'unmatched_names': unmatched_names,
             'success_count': success_count,
             'column': column_input,
-            'notifications': notifications
+            'notifications': notifications,
+            'parse_stats': summary.get('parse_stats', {})  # 댓글 집계 (중복, 매칭 실패 등)
+        }
+    })
+
+
+@attendance_bp.route('/api/run-attendance-incremental', methods=['POST'])
+@safe_error_response
+def run_attendance_incremental():
+    """
+    증분 출석 반영 (수정·삭제된 댓글의 출석만 정정)
+
+    같은 스레드·열을 다시 실행하면 이전 실행 이후 새로 달리거나 수정(edited)·삭제된 댓글만
+    다시 파싱하고, 출석 여부가 바뀐 셀만 업데이트합니다. 알림은 보내지 않습니다.
+
+    Request Body:
+        workspace (str): 워크스페이스 이름
+        thread_ts (str): Thread TS 또는 Slack URL
+        column (str, optional): 출석 열 (기본값: K)
+        mark_absent (bool, optional): 출석이 취소된 학생 X 표시 여부 (기본값: True, False면 셀 비우기)
+        write_behind (bool, optional): 정정 셀을 쓰기 버퍼에 넣고 바로 응답 (기본값: False, 몇 초 안에 모아서 기록)
+
+    Returns:
+        JSON: {
+            success: True/False,
+            result: {
+                full_sync: bool,
+                corrections: List[{name, row, status}],
+                success_count: int,
+                buffered: bool,
+                present: int,
+                absent: int,
+                unmatched_names: List[str],
+                column: str
+            }
+        }
+    """
+    data = request.json
+
+    workspace_name = data.get('workspace')
+    thread_input = data.get('thread_ts')
+    column_input = data.get('column', 'K').strip().upper()
+    mark_absent = data.get('mark_absent', True)
+    write_behind = bool(data.get('write_behind', False))
+
+    if not validate_workspace_name(workspace_name):
+        return jsonify({
+            'success': False,
+            'error': '유효하지 않은 워크스페이스 이름입니다.'
+        }), 400
+
+    workspace = workspace_manager.get_workspace(workspace_name)
+    if not workspace:
+        return jsonify({
+            'success': False,
+            'error': f'{workspace_name} 워크스페이스를 찾을 수 없습니다.'
+        }), 404
+
+    thread_ts = parse_slack_thread_link(thread_input)
+    if not thread_ts:
+        return jsonify({
+            'success': False,
+            'error': 'Thread TS 형식이 올바르지 않습니다.'
+        }), 400
+
+    column_index = column_letter_to_index(column_input)
+    if column_index is None:
+        return jsonify({
+            'success': False,
+            'error': '올바른 열 형식이 아닙니다. (예: K, AB)'
+        }), 400
+
+    slack_handler = SlackHandler(workspace.slack_bot_token)
+    sheets_handler = SheetsHandler(
+        credentials_path=workspace.credentials_path,
+        spreadsheet_id=workspace.spreadsheet_id,
+        sheet_name=workspace.sheet_name
+    )
+
+    if not sheets_handler.connect():
+        return jsonify({
+            'success': False,
+            'error': '구글 시트 연결에 실패했습니다.'
+        }), 500
+
+    service = AttendanceService(slack_handler, sheets_handler, parser=AttendanceParser(workspace.parser_profile))
+
+    try:
+        result = service.run_incremental_check(
+            channel_id=workspace.slack_channel_id,
+            thread_ts=thread_ts,
+            column_index=column_index,
+            name_column=workspace.name_column,
+            start_row=workspace.start_row,
+            mark_absent=mark_absent,
+            duplicate_names=workspace.duplicate_name_index,
+            binding_store=BindingStore(workspace.path),
+            write_behind=write_behind,
+            aliases=workspace.name_aliases
+        )
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+    return jsonify({
+        'success': True,
+        'result': {
+            'full_sync': result['full_sync'],
+            'corrections': result['corrections'],
+            'success_count': result['success_count'],
+            'buffered': result['buffered'],
+            'present': len(result['matched_names']),
+            'absent': len(result['absent_names']),
+            'unmatched_names': result['unmatched_names'],
+            'column': column_input
+        }
+    })
+
+
+@attendance_bp.route('/api/run-combined', methods=['POST'])
+@safe_error_response
+def run_combined():
+    """
+    출석 + 과제 동시 체크 (같은 수업의 출석 스레드와 과제 스레드를 한 번에 처리)
+
+    두 스레드 댓글과 명단을 동시에 가져오고, 사용자 정보 조회를 공유하며,
+    출석 시트와 과제 시트 기록을 batchUpdate 한 번으로 보냅니다.
+
+    Request Body:
+        workspace (str): 워크스페이스 이름
+        thread_ts (str): 출석 Thread TS 또는 Slack URL
+        assignment_thread_ts (str): 과제 Thread TS 또는 Slack URL
+        column (str, optional): 출석 열 (기본값: K)
+        assignment_column (str, optional): 과제 열 (기본값: D)
+        mark_absent (bool, optional): 미출석자·미제출자 X 표시 여부 (기본값: True)
+        shared_roster (bool, optional): 과제 시트 명단이 출석 시트와 같은 행이면 True (기본값: False)
+        send_thread_reply (bool, optional): 출석 스레드 댓글 작성 여부 (기본값: True)
+        send_dm (bool, optional): DM 전송 여부 (기본값: True)
+        thread_user (str, optional): 스레드 작성자 User ID (DM 수신자)
+
+    Returns:
+        JSON: {
+            success: True/False,
+            result: {
+                attendance: {total_students, present, absent, matched_names, absent_names,
+                             unmatched_names, success_count, column, notifications, parse_stats},
+                assignment: {total_students, submitted, not_submitted, submitted_count,
+                             not_submitted_count, success_count, column, parse_stats},
+                shared_roster: bool
+            }
+        }
+    """
+    data = request.json
+
+    workspace_name = data.get('workspace')
+    thread_input = data.get('thread_ts')
+    assignment_thread_input = data.get('assignment_thread_ts')
+    column_input = data.get('column', 'K').strip().upper()
+    assignment_column_input = data.get('assignment_column', 'D').strip().upper()
+    mark_absent = data.get('mark_absent', True)
+    shared_roster = bool(data.get('shared_roster', False))
+    send_thread_reply = data.get('send_thread_reply', True)
+    send_dm = data.get('send_dm', True)
+    thread_user = data.get('thread_user')
+
+    if not validate_workspace_name(workspace_name):
+        return jsonify({
+            'success': False,
+            'error': '유효하지 않은 워크스페이스 이름입니다.'
+        }), 400
+
+    workspace = workspace_manager.get_workspace(workspace_name)
+    if not workspace:
+        return jsonify({
+            'success': False,
+            'error': f'{workspace_name} 워크스페이스를 찾을 수 없습니다.'
+        }), 404
+
+    assignment_channel_id = workspace.assignment_channel_id
+    if not assignment_channel_id:
+        return jsonify({
+            'success': False,
+            'error': '과제 채널 ID가 설정되지 않았습니다. config.json에 assignment_channel_id를 추가하세요.'
+        }), 400
+
+    thread_ts = parse_slack_thread_link(thread_input)
+    assignment_thread_ts = parse_slack_thread_link(assignment_thread_input)
+    if not thread_ts or not assignment_thread_ts:
+        return jsonify({
+            'success': False,
+            'error': 'Thread TS 형식이 올바르지 않습니다.'
+        }), 400
+
+    column_index = column_letter_to_index(column_input)
+    assignment_column_index = column_letter_to_index(assignment_column_input)
+    if column_index is None or assignment_column_index is None:
+        return jsonify({
+            'success': False,
+            'error': '올바른 열 형식이 아닙니다. (예: K, AB)'
+        }), 400
+
+    slack_handler = SlackHandler(workspace.slack_bot_token)
+
+    if not slack_handler.test_connection():
+        return jsonify({
+            'success': False,
+            'error': '슬랙 연결에 실패했습니다.'
+        }), 500
+
+    sheets_handler = SheetsHandler(
+        credentials_path=workspace.credentials_path,
+        spreadsheet_id=workspace.spreadsheet_id,
+        sheet_name=workspace.sheet_name
+    )
+
+    if not sheets_handler.connect() or not sheets_handler.test_connection():
+        return jsonify({
+            'success': False,
+            'error': '구글 시트 연결에 실패했습니다.'
+        }), 500
+
+    service = CombinedCheckService(slack_handler, sheets_handler,
+                                   attendance_parser=AttendanceParser(workspace.parser_profile))
+
+    try:
+        result = service.run_combined_check(
+            channel_id=workspace.slack_channel_id,
+            thread_ts=thread_ts,
+            column_index=column_index,
+            assignment_channel_id=assignment_channel_id,
+            assignment_thread_ts=assignment_thread_ts,
+            assignment_column_index=assignment_column_index,
+            assignment_sheet_name=workspace.assignment_sheet_name,
+            name_column=workspace.name_column,
+            start_row=workspace.start_row,
+            mark_absent=mark_absent,
+            shared_roster=shared_roster,
+            duplicate_names=workspace.duplicate_name_index,
+            binding_store=BindingStore(workspace.path),
+            aliases=workspace.name_aliases
+        )
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+    attendance = result['attendance']
+    assignment = result['assignment']
+    total_students = len(attendance['matched_names']) + len(attendance['absent_names'])
+    assignment_total = len(assignment['submitted']) + len(assignment['not_submitted'])
+
+    notifications = service.attendance.send_notifications(
+        channel_id=workspace.slack_channel_id,
+        thread_ts=thread_ts,
+        thread_user=_dm_recipient(workspace, send_dm, thread_user),
+        matched_names=attendance['matched_names'],
+        absent_names=attendance['absent_names'],
+        total_students=total_students,
+        column_name=column_input,
+        send_thread_reply=send_thread_reply,
+        send_dm=send_dm
+    )
+
+    AssignmentService(slack_handler, sheets_handler).save_history(
+        workspace_path=workspace.path,
+        thread_ts=assignment_thread_ts,
+        thread_link=assignment_thread_input,
+        column_name=assignment_column_input,
+        submitted_list=assignment['submitted'],
+        not_submitted_list=assignment['not_submitted'],
+        total_students=assignment_total
+    )
+
+    return jsonify({
+        'success': True,
+        'result': {
+            'attendance': {
+                'total_students': total_students,
+                'present': len(attendance['matched_names']),
+                'absent': len(attendance['absent_names']),
+                'matched_names': attendance['matched_names'],
+                'absent_names': attendance['absent_names'][:20],  # 최대 20명만
+                'unmatched_names': attendance['unmatched_names'],
+                'success_count': attendance['success_count'],
+                'column': column_input,
+                'notifications': notifications,
+                'parse_stats': attendance['summary'].get('parse_stats', {})
+            },
+            'assignment': {
+                'total_students': assignment_total,
+                'submitted': assignment['submitted'],
+                'not_submitted': assignment['not_submitted'],
+                'submitted_count': len(assignment['submitted']),
+                'not_submitted_count': len(assignment['not_submitted']),
+                'success_count': assignment['success_count'],
+                'column': assignment_column_input,
+                'parse_stats': assignment['parse_stats']
+            },
+            'shared_roster': result['shared_roster']
         }
     })
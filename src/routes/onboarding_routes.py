@@ -0,0 +1,169 @@
+"""채널 멤버 일괄 매칭(온보딩) 라우트"""
+
+from flask import Blueprint, request, jsonify
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.services.onboarding_service import OnboardingService
+from src.utils.error_handler import safe_error_response
+from src.utils.workspace_helper import validate_workspace_name
+from src.workspace_manager import WorkspaceManager
+from src.slack_handler import SlackHandler
+from src.sheets_handler import SheetsHandler
+from src.binding_store import BindingStore
+
+onboarding_bp = Blueprint('onboarding', __name__)
+
+# 워크스페이스 매니저 (싱글톤)
+workspace_manager = WorkspaceManager()
+
+
+def _create_service(workspace):
+    """
+    핸들러 연결 후 온보딩 서비스 생성
+
+    Returns:
+        Tuple[Optional[OnboardingService], Optional[str]]: (서비스, 에러 메시지)
+    """
+    slack_handler = SlackHandler(workspace.slack_bot_token)
+
+    if not slack_handler.test_connection():
+        return None, '슬랙 연결에 실패했습니다.'
+
+    sheets_handler = SheetsHandler(
+        credentials_path=workspace.credentials_path,
+        spreadsheet_id=workspace.spreadsheet_id,
+        sheet_name=workspace.sheet_name
+    )
+
+    if not sheets_handler.connect() or not sheets_handler.test_connection():
+        return None, '구글 시트 연결에 실패했습니다.'
+
+    return OnboardingService(slack_handler, sheets_handler), None
+
+
+@onboarding_bp.route('/api/onboarding/<workspace_name>', methods=['GET'])
+@safe_error_response
+def suggest_bindings(workspace_name):
+    """
+    채널 멤버 ↔ 학생 명단 바인딩 제안 표 조회
+
+    Returns:
+        JSON: {
+            success: True/False,
+            result: {
+                suggestions: [{user_id, slack_name, name, sheet_row, confidence, method, conflict, bound}],
+                unmatched_members: [{user_id, slack_name}],
+                unclaimed_students: List[str],
+                total_members: int,
+                total_students: int
+            }
+        }
+    """
+    if not validate_workspace_name(workspace_name):
+        return jsonify({
+            'success': False,
+            'error': '유효하지 않은 워크스페이스 이름입니다.'
+        }), 400
+
+    workspace = workspace_manager.get_workspace(workspace_name)
+    if not workspace:
+        return jsonify({
+            'success': False,
+            'error': '워크스페이스를 찾을 수 없습니다.'
+        }), 404
+
+    service, error = _create_service(workspace)
+    if not service:
+        return jsonify({
+            'success': False,
+            'error': error
+        }), 500
+
+    try:
+        result = service.suggest_bindings(
+            channel_id=workspace.slack_channel_id,
+            name_column=workspace.name_column,
+            start_row=workspace.start_row,
+            binding_store=BindingStore(workspace.path)
+        )
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+    return jsonify({
+        'success': True,
+        'result': result
+    })
+
+
+@onboarding_bp.route('/api/onboarding/<workspace_name>', methods=['POST'])
+@safe_error_response
+def apply_bindings(workspace_name):
+    """
+    바인딩 저장
+
+    Request Body:
+        bindings (List[Dict], optional): 관리자가 확정한 [{user_id, name, sheet_row}]
+            없으면 채널 전체를 매칭해 신뢰도 기준을 넘는 제안을 자동 저장
+        min_confidence (float, optional): 자동 저장 최소 신뢰도 (기본값: 0.9)
+
+    Returns:
+        JSON: {success: True/False, applied: int, total_bindings: int}
+    """
+    data = request.json or {}
+
+    if not validate_workspace_name(workspace_name):
+        return jsonify({
+            'success': False,
+            'error': '유효하지 않은 워크스페이스 이름입니다.'
+        }), 400
+
+    workspace = workspace_manager.get_workspace(workspace_name)
+    if not workspace:
+        return jsonify({
+            'success': False,
+            'error': '워크스페이스를 찾을 수 없습니다.'
+        }), 404
+
+    binding_store = BindingStore(workspace.path)
+    min_confidence = float(data.get('min_confidence', OnboardingService.DEFAULT_MIN_CONFIDENCE))
+    bindings = data.get('bindings')
+
+    if bindings is not None:
+        # 확정된 목록은 핸들러 연결 없이 바로 저장
+        service = OnboardingService(None, None)
+    else:
+        service, error = _create_service(workspace)
+        if not service:
+            return jsonify({
+                'success': False,
+                'error': error
+            }), 500
+
+        try:
+            bindings = service.suggest_bindings(
+                channel_id=workspace.slack_channel_id,
+                name_column=workspace.name_column,
+                start_row=workspace.start_row,
+                binding_store=binding_store
+            )['suggestions']
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
+    applied = service.apply_bindings(binding_store, bindings, min_confidence=min_confidence)
+
+    return jsonify({
+        'success': True,
+        'applied': applied,
+        'total_bindings': len(binding_store)
+    })
@@ -0,0 +1,24 @@
+"""Google Sheets API 상태 라우트"""
+
+from flask import Blueprint, jsonify
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.sheets_quota import quota_accountant
+from src.utils.error_handler import safe_error_response
+
+sheets_bp = Blueprint('sheets', __name__)
+
+
+@sheets_bp.route('/api/sheets/quota', methods=['GET'])
+@safe_error_response
+def get_sheets_quota():
+    """Sheets API 분당 할당량 사용량 조회 (프로젝트·서비스 계정·스프레드시트별)"""
+    return jsonify({
+        'success': True,
+        'quota': quota_accountant.headroom()
+    })
@@ -1,5 +1,6 @@
 """워크스페이스 관리 라우트"""
 
+import logging
 from flask import Blueprint, request, jsonify
 import sys
 import json
@@ -15,7 +16,9 @@ from src.slack_handler import SlackHandler
 from src.sheets_handler import SheetsHandler
 from src.utils.workspace_helper import validate_workspace_name, safe_path_join
 from src.utils.error_handler import safe_error_response
-from src.utils import column_index_to_letter
+from src.utils import column_index_to_letter, column_letter_to_index
+
+logger = logging.getLogger(__name__)
 
 workspace_bp = Blueprint('workspace', __name__)
 
@@ -263,15 +266,15 @@ def edit_workspace(workspace_name):
     config['notification_user_id'] = notification_user_id
 
     # 파일 저장
-    print(f"[DEBUG] 저장할 config: {config}")
-    print(f"[DEBUG] 파일 경로: {config_file_path}")
+    logger.debug("저장할 config: %s", config)
+    logger.debug("파일 경로: %s", config_file_path)
 
     try:
         with open(config_file_path, 'w', encoding='utf-8') as f:
             json.dump(config, f, ensure_ascii=False, indent=2)
-        print(f"[DEBUG] 파일 저장 완료")
+        logger.debug("파일 저장 완료")
     except Exception as e:
-        print(f"[ERROR] 파일 저장 실패: {e}")
+        logger.error("파일 저장 실패: %s", e)
         return jsonify({
             'success': False,
             'error': f'파일 저장 실패: {str(e)}'
@@ -280,7 +283,7 @@ def edit_workspace(workspace_name):
     # 저장 확인
     with open(config_file_path, 'r', encoding='utf-8') as f:
         saved_config = json.load(f)
-    print(f"[DEBUG] 저장 후 읽은 config: {saved_config}")
+    logger.debug("저장 후 읽은 config: %s", saved_config)
 
     # 워크스페이스 매니저 리로드
     workspace_manager.reload()
@@ -439,23 +442,19 @@ def get_sheet_columns(workspace_name):
         start_column = auto_schedule.get('start_column', 'H')
         end_column = auto_schedule.get('end_column', 'Z')
 
-        # start_row 행의 헤더 읽기 (보통 start_row에 헤더가 있음)
+        # start_row 행의 헤더 읽기 (보통 start_row에 헤더가 있음, 행 전체라 Z열 너머도 포함)
         sheet_name = workspace.sheet_name
         header_row = workspace.start_row  # 예: 4행
-        header_range = f"{sheet_name}!A{header_row}:Z{header_row}"
+        header_range = f"{sheet_name}!{header_row}:{header_row}"
         header_values = sheets_handler.read_range(header_range)
 
-        # 열 문자를 인덱스로 변환하는 함수
-        def column_letter_to_index(letter):
-            """A=0, B=1, ..., Z=25, AA=26, ..."""
-            letter = letter.upper()
-            result = 0
-            for char in letter:
-                result = result * 26 + (ord(char) - ord('A') + 1)
-            return result - 1
-
         start_idx = column_letter_to_index(start_column)
         end_idx = column_letter_to_index(end_column)
+        if start_idx is None or end_idx is None:
+            return jsonify({
+                'success': False,
+                'error': f'자동 열 범위가 올바르지 않습니다: {start_column} ~ {end_column}'
+            }), 400
 
         # 열 정보 생성 (start_column부터 end_column까지만)
         columns = []
@@ -518,7 +517,7 @@ def get_assignment_sheet_columns(workspace_name):
         # 과제 시트 정보 가져오기
         sheet_name = workspace.assignment_sheet_name
         header_row = workspace.assignment_start_row  # 과제 시트의 시작 행
-        header_range = f"{sheet_name}!A{header_row}:Z{header_row}"
+        header_range = f"{sheet_name}!{header_row}:{header_row}"  # 행 전체
         header_values = sheets_handler.read_range(header_range)
 
         # 열 정보 생성 (모든 열)
@@ -2,8 +2,10 @@
 
 from .attendance_service import AttendanceService
 from .assignment_service import AssignmentService
+from .onboarding_service import OnboardingService
 
 __all__ = [
     'AttendanceService',
     'AssignmentService',
+    'OnboardingService',
 ]
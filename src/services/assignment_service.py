@@ -1,5 +1,6 @@
 """과제 체크 서비스"""
 
+import logging
 from typing import List, Tuple, Dict, Optional
 import sys
 import json
@@ -14,6 +15,9 @@ sys.path.insert(0, str(project_root))
 from src.slack_handler import SlackHandler
 from src.sheets_handler import SheetsHandler
 from src.assignment_parser import AssignmentParser
+from src.roster_index import as_roster_index
+
+logger = logging.getLogger(__name__)
 
 KST = pytz.timezone('Asia/Seoul')
 
@@ -45,7 +49,8 @@ class AssignmentService:
         name_column: int,
         start_row: int,
         assignment_sheet_name: str,
-        mark_absent: bool = True
+        mark_absent: bool = True,
+        aliases: Optional[Dict[str, str]] = None
     ) -> Tuple[List[str], List[str], int]:
         """
         과제 집계 실행
@@ -58,6 +63,7 @@ class AssignmentService:
             start_row: 학생 명단 시작 행
             assignment_sheet_name: 과제 시트 이름
             mark_absent: 미제출자 X 표시 여부
+            aliases: 명단 이름 별칭 (WorkspaceConfig.name_aliases)
 
         Returns:
             Tuple[제출자 리스트, 미제출자 리스트, 업데이트 성공 개수]
@@ -66,36 +72,40 @@ class AssignmentService:
             ValueError: 댓글 수집 실패, 학생 명단 읽기 실패 등
         """
         # 0. 채널에 자동 참여 시도
-        print(f"\n[과제체크] 채널 참여 확인 중...")
+        logger.info("\n[과제체크] 채널 참여 확인 중...")
         self.slack.join_channel(assignment_channel_id)
 
-        # 1. 슬랙 댓글 수집
+        # 1. 슬랙 댓글 수집 (파서가 선언한 정책으로 사용자별 필요한 댓글만 사용자 정보 조회)
         replies = self.slack.get_replies_with_user_info(
             assignment_channel_id,
-            thread_ts
+            thread_ts,
+            reply_policy=self.parser.REPLY_POLICY,
+            reply_filter=self.parser.is_candidate_reply
         )
 
         if not replies:
             raise ValueError('댓글을 가져올 수 없습니다.')
 
-        # 2. 과제 제출자 파싱
-        submitted = self.parser.parse_assignment_replies(replies)
-
-        # 3. 학생 명단 읽기
+        # 2. 학생 명단 읽기 (명단 색인: 영문 슬랙 이름 매칭용 로마자 색인 포함)
         students = self.sheets.get_student_list(name_column, start_row)
 
         if not students:
             raise ValueError('학생 명단을 읽을 수 없습니다.')
 
-        # 4. 제출 여부 매칭
-        submitted_list = [name for name in students.keys() if name in submitted]
-        not_submitted_list = [name for name in students.keys() if name not in submitted]
+        roster = as_roster_index(students)
+
+        # 3. 과제 제출자 파싱 (제출자는 집합으로 보관해 매칭·시트 기록에서 O(1) 조회, 별칭·띄어쓰기 차이는 명단 이름으로)
+        submitted = roster.canonical(self.parser.parse_assignment_replies(replies, name_index=roster.name_index),
+                                     aliases)
+
+        # 4. 제출 여부 매칭 (명단 순서 유지)
+        submitted_list, not_submitted_list = roster.split(submitted)
 
         # 5. 시트 업데이트
         success_count = self.sheets.batch_update_assignment(
             sheet_name=assignment_sheet_name,
             column=column_index,
-            students=students,
+            students=roster,
             submitted=submitted,
             mark_absent=mark_absent
         )
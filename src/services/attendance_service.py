@@ -1,6 +1,9 @@
 """출석 체크 서비스"""
 
-from typing import List, Tuple, Dict, Optional
+import logging
+import threading
+from collections import OrderedDict
+from typing import List, Tuple, Dict, Optional, Union
 import sys
 from pathlib import Path
 
@@ -10,7 +13,57 @@ sys.path.insert(0, str(project_root))
 
 from src.slack_handler import SlackHandler
 from src.sheets_handler import SheetsHandler, AttendanceStatus
-from src.parser import AttendanceParser
+from src.parser import AttendanceParser, DuplicateNameIndex
+from src.binding_store import BindingStore
+from src.records import AttendanceRecord
+from src.roster_index import as_roster_index
+from src.incremental_attendance import IncrementalAttendance
+from src.write_behind import get_write_behind
+
+logger = logging.getLogger(__name__)
+
+# 증분 출석 상태 캐시 최대 개수 (워크스페이스 × 최근 출석 스레드)
+INCREMENTAL_CACHE_SIZE = 64
+
+# 증분 출석 상태: {(스프레드시트 ID, 시트 이름, 채널 ID, 스레드 TS, 열 인덱스): _IncrementalEntry}
+# 스케줄러와 라우트가 같은 스레드를 다시 처리할 때 바뀐 댓글만 파싱하도록 프로세스 전체에서 공유
+# (LRU, 매일 새 스레드가 생기므로 오래된 스레드의 상태는 잠금과 함께 제거)
+IncrementalKey = Tuple[str, str, str, str, int]
+_incremental_cache: 'OrderedDict[IncrementalKey, _IncrementalEntry]' = OrderedDict()
+_incremental_cache_lock = threading.Lock()
+
+
+class _IncrementalEntry:
+    """증분 출석 상태 하나와 그 잠금 (같은 상태의 실행만 순서대로, 다른 워크스페이스·스레드는 동시에)"""
+
+    __slots__ = ('lock', 'state', 'duplicate_names')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.state: Optional[IncrementalAttendance] = None
+        # 상태를 만들 때 받은 동명이인 설정 (딕셔너리든 색인이든 같은 객체인지로 변경 판단)
+        self.duplicate_names: Union[Dict, DuplicateNameIndex, None] = None
+
+
+def _incremental_entry(key: IncrementalKey) -> _IncrementalEntry:
+    """
+    증분 출석 상태 항목 (없으면 생성, 캐시가 차면 오래된 항목부터 제거)
+
+    실행 중인(잠금이 잡힌) 항목은 제거하지 않으므로, 잠금을 잡은 동안에는 항목이 바뀌지 않습니다.
+    """
+    with _incremental_cache_lock:
+        entry = _incremental_cache.get(key)
+        if entry is None:
+            entry = _incremental_cache[key] = _IncrementalEntry()
+        _incremental_cache.move_to_end(key)
+
+        excess = len(_incremental_cache) - INCREMENTAL_CACHE_SIZE
+        if excess > 0:
+            idle = [old_key for old_key, old in _incremental_cache.items()
+                    if old_key != key and not old.lock.locked()][:excess]
+            for old_key in idle:
+                del _incremental_cache[old_key]
+        return entry
 
 
 class AttendanceService:
@@ -26,7 +79,7 @@ class AttendanceService:
         Args:
             slack_handler: 슬랙 API 핸들러
             sheets_handler: 구글 시트 API 핸들러
-            parser: 출석 파서 (None이면 기본 파서 생성)
+            parser: 출석 파서 (None이면 기본 프로필 파서 생성, 워크스페이스 프로필은 호출 측에서 주입)
         """
         self.slack = slack_handler
         self.sheets = sheets_handler
@@ -40,7 +93,9 @@ class AttendanceService:
         name_column: int,
         start_row: int,
         mark_absent: bool = True,
-        duplicate_names: Dict = None
+        duplicate_names: Union[Dict, DuplicateNameIndex] = None,
+        binding_store: Optional[BindingStore] = None,
+        aliases: Optional[Dict[str, str]] = None
     ) -> Tuple[List[str], List[str], List[str], int, Dict]:
         """
         출석 집계 실행
@@ -52,7 +107,9 @@ class AttendanceService:
             name_column: 학생 이름 열 인덱스
             start_row: 학생 명단 시작 행
             mark_absent: 미출석자 X 표시 여부
-            duplicate_names: 동명이인 정보
+            duplicate_names: 동명이인 정보 (WorkspaceConfig.duplicate_name_index 권장)
+            binding_store: User ID → 시트 행 바인딩 저장소 (None이면 바인딩 미사용)
+            aliases: 명단 이름 별칭 (WorkspaceConfig.name_aliases)
 
         Returns:
             Tuple[
@@ -67,80 +124,270 @@ class AttendanceService:
             ValueError: 댓글 수집 실패, 학생 명단 읽기 실패 등
         """
         # 0. 채널에 자동 참여 시도
-        print(f"\n[출석체크] 채널 참여 확인 중...")
+        logger.info("\n[출석체크] 채널 참여 확인 중...")
         self.slack.join_channel(channel_id)
 
-        # 1. 슬랙 댓글 수집
-        replies = self.slack.get_replies_with_user_info(channel_id, thread_ts)
+        # 1. 슬랙 댓글 수집 (파서가 선언한 정책으로 사용자별 필요한 댓글만 사용자 정보 조회)
+        replies = self.slack.get_replies_with_user_info(
+            channel_id,
+            thread_ts,
+            reply_policy=self.parser.REPLY_POLICY,
+            reply_filter=self.parser.is_candidate_reply
+        )
 
         if not replies:
             raise ValueError('댓글을 가져올 수 없습니다.')
 
-        # 2. 출석 파싱
+        # 2. 학생 명단 읽기 (명단 색인: 영문 슬랙 이름 매칭용 로마자 색인 포함)
+        students = self.sheets.get_student_list(name_column, start_row)
+
+        if not students:
+            raise ValueError('학생 명단을 읽을 수 없습니다.')
+
+        # 3~5. 출석 파싱, 명단 매칭, 미출석자 처리
+        attendance_list, matched_names, unmatched_names, absent_names, updates = self.plan_attendance(
+            replies, students, column_index, mark_absent, duplicate_names, binding_store, aliases
+        )
+
+        # 6. 시트 업데이트
+        success_count = self.sheets.batch_update_attendance(updates)
+
+        # 7. 상세 정보 생성
+        summary = self.parser.get_attendance_summary(attendance_list)
+
+        return matched_names, absent_names, unmatched_names, success_count, summary
+
+    def plan_attendance(
+        self,
+        replies: List,
+        students: Dict[str, int],
+        column_index: int,
+        mark_absent: bool = True,
+        duplicate_names: Union[Dict, DuplicateNameIndex] = None,
+        binding_store: Optional[BindingStore] = None,
+        aliases: Optional[Dict[str, str]] = None
+    ) -> Tuple[List[AttendanceRecord], List[str], List[str], List[str], List[Dict]]:
+        """
+        댓글 파싱 → 명단 매칭 → 시트 업데이트 목록 생성 (시트에는 쓰지 않음)
+
+        Args:
+            replies: 사용자 정보가 붙은 댓글 (get_replies_with_user_info / enrich_replies)
+            students: get_student_list 결과
+            column_index, mark_absent, duplicate_names, binding_store, aliases: run_attendance_check와 같음
+
+        Returns:
+            Tuple[출석 레코드, 매칭된 이름, 매칭 실패 이름, 미출석 이름, 업데이트 리스트]
+
+        Raises:
+            ValueError: 출석한 학생이 없는 경우
+        """
+        roster = as_roster_index(students)
+
+        # 이전 실행에서 학습한 바인딩 (명단이 바뀐 행은 자동 폐기)
+        bindings = binding_store.get_valid_bindings(students) if binding_store else None
+
+        # 3. 출석 파싱 (명단을 넘겨 "홍길동/김철수 출석" 같은 여러 이름 댓글도 처리)
         attendance_list = self.parser.parse_attendance_replies(
             replies,
-            duplicate_names or {}
+            duplicate_names or {},
+            name_index=roster.name_index,
+            bindings=bindings,
+            roster=roster
         )
 
         if not attendance_list:
             raise ValueError('출석한 학생이 없습니다.')
 
-        # 3. 학생 명단 읽기
-        students = self.sheets.get_student_list(name_column, start_row)
-
-        if not students:
-            raise ValueError('학생 명단을 읽을 수 없습니다.')
-
         # 4. 출석 매칭
         matched_names, unmatched_names, updates = self._match_attendance(
             attendance_list,
-            students,
-            column_index
+            roster,
+            column_index,
+            aliases
         )
 
-        # 5. 미출석자 처리
-        absent_names = [name for name in students.keys() if name not in matched_names]
+        # 확실한 매칭은 바인딩으로 학습
+        if binding_store is not None:
+            learned = binding_store.learn(attendance_list, students)
+            binding_store.save()
+            if learned:
+                logger.info("✓ User ID 바인딩 학습: %s명", learned)
+
+        # 5. 미출석자 처리 (출석 이름은 집합으로 한 번만 변환해 명단 크기에 선형)
+        absent_names = roster.absent_names(matched_names)
 
         if mark_absent:
             absent_updates = self._create_absent_updates(
                 absent_names,
-                students,
+                roster,
                 column_index
             )
             updates.extend(absent_updates)
 
-        # 6. 시트 업데이트
-        success_count = self.sheets.batch_update_attendance(updates)
+        return attendance_list, matched_names, unmatched_names, absent_names, updates
 
-        # 7. 상세 정보 생성
-        summary = self.parser.get_attendance_summary(attendance_list)
+    def run_incremental_check(
+        self,
+        channel_id: str,
+        thread_ts: str,
+        column_index: int,
+        name_column: int,
+        start_row: int,
+        mark_absent: bool = True,
+        duplicate_names: Union[Dict, DuplicateNameIndex] = None,
+        binding_store: Optional[BindingStore] = None,
+        write_behind: bool = False,
+        aliases: Optional[Dict[str, str]] = None
+    ) -> Dict:
+        """
+        증분 출석 반영 (새 댓글·수정·삭제된 댓글만 다시 파싱하고 바뀐 셀만 정정)
 
-        return matched_names, absent_names, unmatched_names, success_count, summary
+        같은 스레드·열의 첫 실행(또는 명단·설정 변경 후)은 전체 동기화와 같은 결과를 기록하고,
+        이후 실행은 출석 여부가 바뀐 행만 O / X(mark_absent=False면 빈 셀)로 정정합니다.
+
+        Args:
+            run_attendance_check와 같음
+            write_behind: 정정 셀을 스프레드시트별 쓰기 버퍼에 넣고 바로 반환 (짧은 간격으로 반복 실행할 때)
+
+        Returns:
+            Dict: {
+                full_sync, corrections, success_count, buffered,
+                matched_names, absent_names, unmatched_names
+            }
+            write_behind면 success_count는 버퍼에 넣은 셀 수
+
+        Raises:
+            ValueError: 학생 명단 읽기 실패
+        """
+        self.slack.join_channel(channel_id)
+
+        students = self.sheets.get_student_list(name_column, start_row)
+        if not students:
+            raise ValueError('학생 명단을 읽을 수 없습니다.')
+
+        roster = as_roster_index(students)
+        # 온보딩·다른 실행이 바인딩을 바꿨을 수 있으므로 매 실행 현재 바인딩으로 상태 변경 여부 판단
+        bindings = binding_store.get_valid_bindings(roster) if binding_store else {}
+        messages = self.slack.get_thread_replies(channel_id, thread_ts)
+
+        key = (self.sheets.spreadsheet_id, self.sheets.sheet_name, channel_id, thread_ts, column_index)
+        entry = _incremental_entry(key)
+        with entry.lock:
+            state = self._incremental_state(entry, roster, column_index, mark_absent, duplicate_names, bindings,
+                                             aliases)
+            user_ids = state.changed_user_ids(messages)
+
+        # 바뀐 댓글 작성자 정보는 잠금 밖에서 조회 (users.info 호출 동안 같은 상태의 다른 실행을 막지 않음)
+        users = {user_id: self.slack.get_user_info(user_id) for user_id in user_ids}
+
+        with entry.lock:
+            state = self._incremental_state(entry, roster, column_index, mark_absent, duplicate_names, bindings,
+                                             aliases)
+            full_sync = not state.synced
+            # 그 사이 다른 실행이 상태를 바꿨으면 미리 조회하지 않은 사용자만 여기서 조회
+            corrections, new_records = state.sync(
+                messages, lambda user_id: users[user_id] if user_id in users else self.slack.get_user_info(user_id)
+            )
+
+        if not corrections:
+            success_count = 0
+        elif write_behind:
+            buffer = get_write_behind(self.sheets.credentials_path, self.sheets.spreadsheet_id,
+                                      self.sheets.sheet_name)
+            # 버퍼는 스프레드시트별로 공유되므로 이 워크스페이스의 시트를 지정
+            success_count = buffer.put_updates(corrections, sheet_name=self.sheets.sheet_name)
+        else:
+            success_count = self.sheets.batch_update_attendance(corrections)
+
+        # 새로 파싱된 댓글의 확실한 매칭만 바인딩으로 학습
+        if binding_store is not None and new_records:
+            learned = binding_store.learn(new_records, students)
+            binding_store.save()
+            if learned:
+                logger.info("✓ User ID 바인딩 학습: %s명", learned)
+                # 이 상태의 매칭 결과에서 배운 바인딩이므로 결과는 그대로 두고 바인딩만 맞춰 둠
+                # (다음 실행이 바인딩 변경으로 보고 전체 동기화하지 않도록)
+                with entry.lock:
+                    if entry.state is state:
+                        state.bindings = binding_store.get_valid_bindings(roster)
+
+        return {
+            'full_sync': full_sync,
+            'corrections': [
+                {'name': update['name'], 'row': update['row'],
+                 'status': getattr(update['status'], 'value', update['status'])}
+                for update in corrections
+            ],
+            'success_count': success_count,
+            'buffered': write_behind,
+            'matched_names': state.matched_names(),
+            'absent_names': state.absent_names(),
+            'unmatched_names': state.unmatched_names(),
+        }
+
+    def _incremental_state(
+        self,
+        entry: _IncrementalEntry,
+        roster,
+        column_index: int,
+        mark_absent: bool,
+        duplicate_names: Union[Dict, DuplicateNameIndex],
+        bindings: Dict[str, Tuple[str, int]],
+        aliases: Optional[Dict[str, str]] = None
+    ) -> IncrementalAttendance:
+        """
+        증분 출석 상태 (없거나 명단·파서·동명이인·바인딩·별칭·설정이 바뀌었으면 새로 생성, 상태별 잠금 안에서 호출)
+        """
+        state = entry.state
+        # 명단 색인은 명단 해시로, 동명이인 색인은 설정 수정 시각으로 캐시되므로 같은 객체면 변경 없음
+        if (state is None or state.students is not roster or state.mark_absent != mark_absent
+                or state.parser.profile is not self.parser.profile
+                or entry.duplicate_names is not duplicate_names
+                or state.bindings != bindings
+                or state.aliases != (aliases or {})):
+            state = IncrementalAttendance(
+                self.parser,
+                roster,
+                column_index,
+                duplicate_names=duplicate_names,
+                name_index=roster.name_index,
+                bindings=bindings,
+                mark_absent=mark_absent,
+                aliases=aliases
+            )
+            entry.state = state
+            entry.duplicate_names = duplicate_names
+        return state
 
     def _match_attendance(
         self,
-        attendance_list: List[Dict],
+        attendance_list: List[AttendanceRecord],
         students: Dict[str, int],
-        column_index: int
+        column_index: int,
+        aliases: Optional[Dict[str, str]] = None
     ) -> Tuple[List[str], List[str], List[Dict]]:
         """
         출석자와 학생 명단 매칭
 
+        명단에 정확히 없는 이름은 별칭·정규화 키("홍 길동", "john kim")로 명단 이름을 찾습니다.
+
         Args:
             attendance_list: 파싱된 출석 리스트
             students: {이름: 행번호} 딕셔너리
             column_index: 열 인덱스
+            aliases: 명단 이름 별칭 (compile_aliases 결과)
 
         Returns:
             Tuple[매칭된 이름, 매칭 실패 이름, 업데이트 리스트]
         """
+        roster = as_roster_index(students)
         matched_names = []
         unmatched_names = []
         updates = []
 
         for attendance in attendance_list:
-            name = attendance['name']
-            sheet_row = attendance.get('sheet_row')  # 동명이인인 경우 직접 지정된 행
+            name = attendance.name
+            sheet_row = attendance.sheet_row  # 동명이인인 경우 직접 지정된 행
 
             # 동명이인으로 직접 행 번호가 지정된 경우
             if sheet_row is not None:
@@ -151,8 +398,12 @@ class AttendanceService:
                     'status': AttendanceStatus.PRESENT
                 })
                 matched_names.append(name)
-            elif name in students:
-                row = students[name]
+                continue
+
+            resolved = roster.resolve(name, aliases)
+            if resolved is not None:
+                name = resolved
+                row = roster[name]
                 updates.append({
                     'name': name,
                     'row': row,
@@ -0,0 +1,173 @@
+"""출석 + 과제 동시 체크 서비스"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Union
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.slack_handler import SlackHandler
+from src.sheets_handler import SheetsHandler
+from src.parser import AttendanceParser, DuplicateNameIndex
+from src.assignment_parser import AssignmentParser
+from src.binding_store import BindingStore
+from src.roster_index import as_roster_index
+from src.services.attendance_service import AttendanceService
+
+logger = logging.getLogger(__name__)
+
+# 동시에 가져오는 작업 수 (출석 스레드, 과제 스레드, 출석 명단, 과제 명단)
+FETCH_WORKERS = 4
+
+
+class CombinedCheckService:
+    """
+    출석 스레드와 과제 스레드를 한 번에 처리하는 서비스
+
+    출석 체크와 과제 체크를 따로 실행하면 채널 참여, 사용자 정보 조회, 명단 읽기, batchUpdate를
+    각각 합니다. 이 서비스는 두 스레드 댓글과 명단을 동시에 가져오고, 사용자 정보 캐시를 공유하며,
+    두 시트 기록을 batchUpdate 한 번으로 보냅니다.
+    """
+
+    def __init__(
+        self,
+        slack_handler: SlackHandler,
+        sheets_handler: SheetsHandler,
+        attendance_parser: Optional[AttendanceParser] = None,
+        assignment_parser: Optional[AssignmentParser] = None
+    ):
+        """
+        Args:
+            slack_handler: 슬랙 API 핸들러 (두 채널을 모두 읽을 수 있는 봇)
+            sheets_handler: 출석 시트 핸들러 (과제 시트도 같은 스프레드시트)
+            attendance_parser: 출석 파서 (워크스페이스 프로필)
+            assignment_parser: 과제 파서 (None이면 기본 파서 생성)
+        """
+        self.slack = slack_handler
+        self.sheets = sheets_handler
+        self.attendance = AttendanceService(slack_handler, sheets_handler, parser=attendance_parser)
+        self.assignment_parser = assignment_parser or AssignmentParser()
+
+    def run_combined_check(
+        self,
+        channel_id: str,
+        thread_ts: str,
+        column_index: int,
+        assignment_channel_id: str,
+        assignment_thread_ts: str,
+        assignment_column_index: int,
+        assignment_sheet_name: str,
+        name_column: int,
+        start_row: int,
+        mark_absent: bool = True,
+        shared_roster: bool = False,
+        duplicate_names: Union[Dict, DuplicateNameIndex] = None,
+        binding_store: Optional[BindingStore] = None,
+        aliases: Optional[Dict[str, str]] = None
+    ) -> Dict:
+        """
+        출석 + 과제 동시 집계
+
+        Args:
+            channel_id, thread_ts, column_index: 출석 채널·스레드·열
+            assignment_channel_id, assignment_thread_ts, assignment_column_index: 과제 채널·스레드·열
+            assignment_sheet_name: 과제 시트 이름
+            name_column: 학생 이름 열 인덱스
+            start_row: 학생 명단 시작 행
+            mark_absent: 미출석자·미제출자 X 표시 여부
+            shared_roster: 과제 시트의 명단이 출석 시트와 같은 행이면 True (과제 시트 명단을 읽지 않음)
+            duplicate_names: 동명이인 정보
+            binding_store: User ID → 시트 행 바인딩 저장소
+            aliases: 명단 이름 별칭 (WorkspaceConfig.name_aliases)
+
+        Returns:
+            Dict: {
+                attendance: {matched_names, absent_names, unmatched_names, success_count, summary},
+                assignment: {submitted, not_submitted, success_count, parse_stats},
+                shared_roster: bool
+            }
+
+        Raises:
+            ValueError: 댓글 수집 실패, 학생 명단 읽기 실패, 출석한 학생 없음
+        """
+        # 0. 채널 참여 (같은 채널이면 한 번)
+        logger.info("\n[출석+과제] 채널 참여 확인 중...")
+        for channel in dict.fromkeys((channel_id, assignment_channel_id)):
+            self.slack.join_channel(channel)
+
+        assignment_sheets = SheetsHandler(self.sheets.credentials_path, self.sheets.spreadsheet_id,
+                                          assignment_sheet_name)
+        assignment_sheets.service = self.sheets.service
+
+        # 1. 두 스레드 댓글과 명단을 동시에 가져오기
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+            attendance_messages = pool.submit(self.slack.get_thread_replies, channel_id, thread_ts)
+            assignment_messages = pool.submit(self.slack.get_thread_replies, assignment_channel_id,
+                                              assignment_thread_ts)
+            students_future = pool.submit(self.sheets.get_student_list, name_column, start_row)
+            assignment_students_future = (
+                None if shared_roster
+                else pool.submit(assignment_sheets.get_student_list, name_column, start_row)
+            )
+
+            attendance_messages = attendance_messages.result()
+            assignment_messages = assignment_messages.result()
+            students = students_future.result()
+            assignment_students = students if shared_roster else assignment_students_future.result()
+
+        if not attendance_messages or not assignment_messages:
+            raise ValueError('댓글을 가져올 수 없습니다.')
+        if not students or not assignment_students:
+            raise ValueError('학생 명단을 읽을 수 없습니다.')
+
+        # 2. 사용자 정보 (두 스레드에 모두 댓글을 단 사용자는 한 번만 조회)
+        attendance_parser = self.attendance.parser
+        replies = self.slack.enrich_replies(attendance_messages, attendance_parser.REPLY_POLICY,
+                                            attendance_parser.is_candidate_reply)
+        assignment_replies = self.slack.enrich_replies(assignment_messages, self.assignment_parser.REPLY_POLICY,
+                                                       self.assignment_parser.is_candidate_reply)
+
+        # 3. 출석 파싱·매칭
+        attendance_list, matched_names, unmatched_names, absent_names, updates = self.attendance.plan_attendance(
+            replies, students, column_index, mark_absent, duplicate_names, binding_store, aliases
+        )
+
+        # 4. 과제 제출자 파싱·매칭 (명단 내용이 같으면 캐시된 같은 명단 색인)
+        roster = as_roster_index(students)
+        assignment_roster = as_roster_index(assignment_students)
+        submitted = assignment_roster.canonical(self.assignment_parser.parse_assignment_replies(
+            assignment_replies, name_index=assignment_roster.name_index
+        ), aliases)
+        submitted_list, not_submitted_list = assignment_roster.split(submitted)
+
+        # 5. 두 시트를 batchUpdate 한 번으로 기록
+        attendance_data, _ = self.sheets.attendance_batch_data(updates)
+        assignment_data = self.sheets.assignment_batch_data(
+            assignment_sheet_name, assignment_column_index, assignment_roster, submitted, mark_absent
+        )
+        counts = self.sheets.batch_update_combined({
+            'attendance': attendance_data,
+            'assignment': assignment_data,
+        })
+        logger.info("✓ 출석 %s명, 과제 %s명 기록", counts['attendance'], counts['assignment'])
+
+        return {
+            'attendance': {
+                'matched_names': matched_names,
+                'absent_names': absent_names,
+                'unmatched_names': unmatched_names,
+                'success_count': counts['attendance'],
+                'summary': attendance_parser.get_attendance_summary(attendance_list),
+            },
+            'assignment': {
+                'submitted': submitted_list,
+                'not_submitted': not_submitted_list,
+                'success_count': counts['assignment'],
+                'parse_stats': dict(self.assignment_parser.stats),
+            },
+            'shared_roster': assignment_roster is roster,
+        }
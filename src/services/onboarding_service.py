@@ -0,0 +1,261 @@
+"""채널 멤버 일괄 매칭(온보딩) 서비스"""
+
+import logging
+from typing import List, Dict, Optional, Tuple
+from difflib import SequenceMatcher
+import re
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.slack_handler import SlackHandler
+from src.sheets_handler import SheetsHandler
+from src.transliteration import TransliterationIndex
+from src.binding_store import BindingStore
+from src.roster_index import RosterIndex, as_roster_index, normalize_key
+
+logger = logging.getLogger(__name__)
+
+# 표시 이름에서 소속 정보 제거용 ("홍길동/컴공", "홍길동_컴공", "홍길동(1반)")
+_NAME_SUFFIX = re.compile(r'[/_(]')
+
+
+class RosterMatcher:
+    """명단 이름 매칭기 (정규화 이름 블로킹 색인 → 로마자 색인 → 유사도 매칭 순)"""
+
+    # 유사도 매칭 최소 비율과 신뢰도 가중치
+    FUZZY_MIN_RATIO = 0.6
+    FUZZY_WEIGHT = 0.8
+    ROMANIZED_CONFIDENCE = 0.9
+
+    def __init__(self, students: Dict[str, int]):
+        """
+        Args:
+            students: {이름: 행번호} 딕셔너리
+        """
+        self.students = students
+        self.name_index = (
+            students.name_index if isinstance(students, RosterIndex) else TransliterationIndex(students.keys())
+        )
+
+        # 정확 매칭용: {정규화 키: 이름}
+        self.exact: Dict[str, str] = {}
+        # 유사도 매칭 후보 블록: {첫 글자: [(정규화 키, 이름), ...]}
+        self.blocks: Dict[str, List[Tuple[str, str]]] = {}
+
+        for name in students:
+            key = normalize_key(name)
+            if not key:
+                continue
+            self.exact[key] = name
+            self.blocks.setdefault(key[0], []).append((key, name))
+
+    def match(self, user_info: Dict) -> Optional[Dict]:
+        """
+        슬랙 사용자 한 명을 명단과 매칭
+
+        Args:
+            user_info: 슬랙 사용자 정보 (display_name, real_name)
+
+        Returns:
+            Optional[Dict]: {'name', 'sheet_row', 'confidence', 'method'}, 매칭 실패 시 None
+        """
+        candidates = self._profile_candidates(user_info)
+
+        # 1. 정규화 이름 정확 매칭
+        for key in candidates:
+            name = self.exact.get(key)
+            if name:
+                return self._result(name, 1.0, 'exact')
+
+        # 2. 로마자 표기 매칭
+        name = self.name_index.lookup_profile(user_info)
+        if name:
+            return self._result(name, self.ROMANIZED_CONFIDENCE, 'romanized')
+
+        # 3. 같은 블록(첫 글자) 안에서 유사도 매칭
+        best_name = None
+        best_ratio = 0.0
+        for key in candidates:
+            for roster_key, roster_name in self.blocks.get(key[0], []):
+                if abs(len(roster_key) - len(key)) > 1:
+                    continue
+                matcher = SequenceMatcher(None, key, roster_key)
+                # 상한값(quick_ratio)으로 먼저 걸러 정확한 비율 계산 횟수를 줄임
+                if matcher.quick_ratio() <= best_ratio:
+                    continue
+                ratio = matcher.ratio()
+                if ratio > best_ratio:
+                    best_name, best_ratio = roster_name, ratio
+
+        if best_name and best_ratio >= self.FUZZY_MIN_RATIO:
+            return self._result(best_name, round(best_ratio * self.FUZZY_WEIGHT, 2), 'fuzzy')
+
+        return None
+
+    def _result(self, name: str, confidence: float, method: str) -> Dict:
+        return {
+            'name': name,
+            'sheet_row': self.students[name],
+            'confidence': confidence,
+            'method': method
+        }
+
+    @staticmethod
+    def _profile_candidates(user_info: Dict) -> List[str]:
+        """
+        프로필에서 비교할 이름 키 후보 생성
+
+        "홍길동/컴공" → ["홍길동"], "김우진 컴퓨터공학전공" → ["김우진컴퓨터공학전공", "김우진"]
+        """
+        candidates = []
+        for field in ('display_name', 'real_name'):
+            value = _NAME_SUFFIX.split(user_info.get(field) or '', 1)[0].strip()
+            if not value:
+                continue
+
+            for candidate in (normalize_key(value), normalize_key(value.split()[0])):
+                if candidate and candidate not in candidates:
+                    candidates.append(candidate)
+
+        return candidates
+
+
+class OnboardingService:
+    """채널 멤버 전체를 학생 명단과 한 번에 매칭해 바인딩을 제안하는 서비스"""
+
+    # 자동 바인딩 기본 최소 신뢰도
+    DEFAULT_MIN_CONFIDENCE = 0.9
+
+    def __init__(self, slack_handler: SlackHandler, sheets_handler: SheetsHandler):
+        """
+        Args:
+            slack_handler: 슬랙 API 핸들러
+            sheets_handler: 구글 시트 API 핸들러
+        """
+        self.slack = slack_handler
+        self.sheets = sheets_handler
+
+    def suggest_bindings(
+        self,
+        channel_id: str,
+        name_column: int,
+        start_row: int,
+        binding_store: Optional[BindingStore] = None
+    ) -> Dict:
+        """
+        채널 멤버 ↔ 학생 명단 바인딩 제안 표 생성
+
+        채널 멤버(conversations.members)와 전체 사용자 목록(users.list)을 페이지 단위로
+        한 번씩만 읽으므로 멤버 수천 명 규모에서도 API 호출 수가 몇 번에 그칩니다.
+
+        Args:
+            channel_id: 슬랙 채널 ID
+            name_column: 학생 이름 열 인덱스
+            start_row: 학생 명단 시작 행
+            binding_store: 기존 바인딩 저장소 (이미 바인딩된 멤버 표시용)
+
+        Returns:
+            Dict: {
+                suggestions: [{user_id, slack_name, name, sheet_row, confidence, method, conflict, bound}],
+                unmatched_members: [{user_id, slack_name}],
+                unclaimed_students: [이름],
+                total_members: int,
+                total_students: int
+            }
+
+        Raises:
+            ValueError: 채널 멤버 또는 학생 명단을 읽을 수 없는 경우
+        """
+        members = self.slack.get_channel_members(channel_id)
+        if not members:
+            raise ValueError('채널 멤버를 가져올 수 없습니다.')
+
+        directory = self.slack.get_all_users()
+
+        students = self.sheets.get_student_list(name_column, start_row)
+        if not students:
+            raise ValueError('학생 명단을 읽을 수 없습니다.')
+
+        # 매칭기(블로킹·로마자 색인)는 명단이 바뀔 때만 다시 생성
+        matcher = as_roster_index(students).derived('roster_matcher', RosterMatcher)
+
+        suggestions = []
+        unmatched_members = []
+        claims: Dict[str, int] = {}
+
+        for user_id in members:
+            user_info = directory.get(user_id)
+            if not user_info:
+                continue  # 봇, 삭제된 사용자
+
+            slack_name = user_info.get('display_name') or user_info.get('real_name', '')
+            result = matcher.match(user_info)
+
+            if not result:
+                unmatched_members.append({'user_id': user_id, 'slack_name': slack_name})
+                continue
+
+            current = binding_store.get(user_id) if binding_store else None
+            suggestions.append({
+                'user_id': user_id,
+                'slack_name': slack_name,
+                **result,
+                'conflict': False,
+                'bound': bool(current and current.get('sheet_row') == result['sheet_row'])
+            })
+            claims[result['name']] = claims.get(result['name'], 0) + 1
+
+        # 같은 명단 이름에 여러 멤버가 매칭되면 충돌로 표시 (관리자 확인 필요)
+        for suggestion in suggestions:
+            suggestion['conflict'] = claims[suggestion['name']] > 1
+
+        suggestions.sort(key=lambda x: x['sheet_row'])
+        unclaimed_students = [name for name in students if name not in claims]
+
+        logger.info("✓ 바인딩 제안: %s명 매칭, %s명 매칭 실패, %s명 미배정",
+                    len(suggestions), len(unmatched_members), len(unclaimed_students))
+
+        return {
+            'suggestions': suggestions,
+            'unmatched_members': unmatched_members,
+            'unclaimed_students': unclaimed_students,
+            'total_members': len(members),
+            'total_students': len(students)
+        }
+
+    def apply_bindings(
+        self,
+        binding_store: BindingStore,
+        suggestions: List[Dict],
+        min_confidence: float = DEFAULT_MIN_CONFIDENCE
+    ) -> int:
+        """
+        제안된 바인딩 중 신뢰도가 충분하고 충돌이 없는 항목을 저장
+
+        Args:
+            binding_store: 바인딩 저장소
+            suggestions: suggest_bindings()의 suggestions 또는 관리자가 확정한 목록
+            min_confidence: 최소 신뢰도 (confidence가 없는 항목은 확정된 것으로 간주)
+
+        Returns:
+            int: 새로 추가되거나 변경된 바인딩 수
+        """
+        applied = 0
+
+        for suggestion in suggestions:
+            if suggestion.get('conflict'):
+                continue
+            if suggestion.get('confidence', 1.0) < min_confidence:
+                continue
+            if not suggestion.get('user_id') or suggestion.get('sheet_row') is None:
+                continue
+
+            if binding_store.bind(suggestion['user_id'], suggestion['name'], int(suggestion['sheet_row'])):
+                applied += 1
+
+        binding_store.save()
+        return applied
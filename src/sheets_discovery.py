@@ -0,0 +1,129 @@
+"""
+Sheets API 디스커버리 문서 모듈
+build('sheets', 'v4')는 connect()마다 디스커버리 문서(JSON)를 읽고 파싱하며,
+서비스의 spreadsheets() / values() 리소스도 호출마다 메서드 문서까지 새로 만듭니다.
+이 모듈은 src/discovery/sheets.v4.json(배포 파일에 포함)을 프로세스당 한 번만 파싱하고,
+연결 풀 전송별 서비스와 서비스별 리소스를 캐시합니다.
+
+- 네트워크 없이 서비스 생성 (build_from_document)
+- 번들 문서가 없으면 googleapiclient 패키지에 포함된 문서 사용
+"""
+import json
+import logging
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from googleapiclient.discovery import build_from_document
+
+logger = logging.getLogger(__name__)
+
+# 배포 파일에 포함하는 디스커버리 문서 (PyInstaller spec의 src 데이터에 포함)
+BUNDLED_DISCOVERY_PATH = Path(__file__).parent / 'discovery' / 'sheets.v4.json'
+
+# 파싱된 디스커버리 문서 (프로세스당 한 번)
+_discovery_document: Optional[Dict] = None
+_discovery_lock = threading.Lock()
+
+# 연결 풀 전송별 서비스 (스레드 안전한 전송이므로 서비스를 공유)
+_services: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+# 서비스별 (spreadsheets, values) 리소스
+_resources: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+# 서비스·리소스 생성 시 googleapiclient가 공유 디스커버리 문서의 parameters를 채워 넣으므로
+# 생성(build_from_document, spreadsheets(), values())과 캐시 확인은 모두 이 잠금 안에서 한 번에 하나씩
+_resource_lock = threading.Lock()
+
+
+def _packaged_discovery_path() -> Path:
+    """googleapiclient 패키지에 포함된 Sheets 디스커버리 문서 경로"""
+    import googleapiclient
+    return Path(googleapiclient.__file__).parent / 'discovery_cache' / 'documents' / 'sheets.v4.json'
+
+
+def load_discovery_document() -> Dict:
+    """
+    Sheets v4 디스커버리 문서 (처음 호출할 때 파일을 읽어 파싱, 이후 재사용)
+
+    Returns:
+        Dict: 파싱된 디스커버리 문서
+
+    Raises:
+        FileNotFoundError: 번들 문서와 패키지 문서가 모두 없는 경우
+    """
+    global _discovery_document
+
+    if _discovery_document is not None:
+        return _discovery_document
+
+    with _discovery_lock:
+        if _discovery_document is None:
+            start = time.perf_counter()
+            path = BUNDLED_DISCOVERY_PATH if BUNDLED_DISCOVERY_PATH.exists() else _packaged_discovery_path()
+            with open(path, 'r', encoding='utf-8') as f:
+                _discovery_document = json.load(f)
+            logger.debug("Sheets 디스커버리 문서 로드: %s (rev %s, %.1fms)",
+                         path.name, _discovery_document.get('revision'), (time.perf_counter() - start) * 1000)
+
+    return _discovery_document
+
+
+def build_sheets_service(http=None, credentials=None):
+    """
+    캐시된 디스커버리 문서로 Sheets 서비스 생성 (네트워크 요청 없음)
+
+    http가 연결 풀 전송(PooledHttp)이면 전송별로 서비스 하나를 만들어 재사용합니다.
+
+    Args:
+        http: googleapiclient 전송 (PooledHttp 등, credentials와 함께 쓰지 않음)
+        credentials: google-auth 인증 정보 (http가 없을 때, httplib2 전송)
+
+    Returns:
+        googleapiclient Resource: Sheets 서비스
+    """
+    document = load_discovery_document()
+
+    if http is None:
+        with _resource_lock:
+            return build_from_document(document, credentials=credentials)
+
+    service = _services.get(http)
+    if service is None:
+        with _resource_lock:
+            service = _services.get(http)
+            if service is None:
+                service = _services[http] = build_from_document(document, http=http)
+    return service
+
+
+def service_resources(service) -> Tuple[object, object]:
+    """
+    서비스의 (spreadsheets(), spreadsheets().values()) 리소스 (서비스별로 한 번만 생성)
+
+    Args:
+        service: Sheets 서비스
+
+    Returns:
+        Tuple: (spreadsheets 리소스, values 리소스)
+    """
+    resources = _resources.get(service)
+    if resources is None:
+        with _resource_lock:
+            resources = _resources.get(service)
+            if resources is None:
+                spreadsheets = service.spreadsheets()
+                resources = _resources[service] = (spreadsheets, spreadsheets.values())
+    return resources
+
+
+def warm_up():
+    """디스커버리 문서와 리소스 생성 코드를 미리 준비 (시작 시 백그라운드 스레드에서 호출)"""
+    import httplib2
+    try:
+        start = time.perf_counter()
+        # 요청은 보내지 않으므로 인증 없는 전송으로 생성 (기본 인증 정보를 찾지 않도록)
+        service_resources(build_sheets_service(http=httplib2.Http()))
+        logger.debug("Sheets 서비스 준비 완료 (%.1fms)", (time.perf_counter() - start) * 1000)
+    except Exception as e:
+        logger.warning("⚠ Sheets 서비스 미리 준비 실패: %s", e)
@@ -0,0 +1,187 @@
+"""
+시트 셀 주소 모듈 (GridRange 쓰기)
+values.batchUpdate는 셀마다 "시트!K5" 같은 A1 범위를 서버가 다시 해석하고, 셀 수만큼 data 항목을 받습니다.
+이 모듈은 셀 쓰기 배치를 spreadsheets.batchUpdate의 updateCells 요청으로 바꿉니다.
+시트는 이름 대신 sheetId(스프레드시트별로 한 번 조회해 캐시)로, 셀은 0-based 행·열 인덱스로 지정하고
+같은 열에서 행이 이어지는 셀은 GridRange 하나로 묶습니다.
+
+- 배치 항목에 'cell': [시트 이름, 행, 열]이 있으면 A1 범위를 해석하지 않음 (cell_entry로 생성)
+- 'cell'이 없는 항목(이전 아웃박스 배치 등)은 A1 범위를 해석해 사용
+- 열 수 제한 없음 (A1 범위의 열 문자는 AA, AB, ... 로 생성)
+"""
+import logging
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.common import column_index_to_letter, column_letter_to_index
+
+logger = logging.getLogger(__name__)
+
+# 스프레드시트별 시트 ID: {스프레드시트 ID: {시트 이름: sheetId}}
+_sheet_ids: Dict[str, Dict[str, int]] = {}
+_sheet_ids_lock = threading.Lock()
+
+# 셀 하나의 A1 범위 ("시트!K5", "'시트 이름'!AB12")
+_CELL_A1 = re.compile(r"^(?:'((?:[^']|'')+)'|([^!]+))!([A-Za-z]{1,3})([0-9]+)$")
+
+# 셀 좌표: (시트 이름, 행, 열) (0-based)
+Cell = Tuple[str, int, int]
+
+
+def cell_a1(sheet_name: str, row: int, column: int) -> str:
+    """
+    셀 하나의 A1 범위 (예: "출석현황!AB5")
+
+    Args:
+        sheet_name (str): 시트 이름
+        row (int): 행 번호 (0-based)
+        column (int): 열 인덱스 (0-based)
+    """
+    return f"{sheet_name}!{column_index_to_letter(column)}{row + 1}"
+
+
+def cell_entry(sheet_name: str, row: int, column: int, value) -> Dict:
+    """
+    셀 쓰기 배치 항목 ({'range', 'values', 'cell'})
+
+    'range'는 쓰기 대기열·아웃박스·실패 기록에서 셀을 구분하는 키이고,
+    'cell'은 updateCells로 보낼 때 A1 범위를 다시 해석하지 않도록 붙여 두는 좌표입니다.
+    """
+    return {'range': cell_a1(sheet_name, row, column), 'values': [[value]], 'cell': [sheet_name, row, column]}
+
+
+def parse_cell_a1(cell_range: str) -> Optional[Cell]:
+    """
+    셀 하나의 A1 범위 해석 (셀 범위가 아니면 None)
+
+    Args:
+        cell_range (str): "시트!K5" 또는 "'시트 이름'!K5"
+
+    Returns:
+        Optional[Cell]: (시트 이름, 행, 열) (0-based)
+    """
+    match = _CELL_A1.match(cell_range)
+    if not match or match.group(4) == '0':
+        return None
+    sheet_name = match.group(1).replace("''", "'") if match.group(1) else match.group(2)
+    return sheet_name, int(match.group(4)) - 1, column_letter_to_index(match.group(3))
+
+
+def entry_cell(entry: Dict) -> Optional[Cell]:
+    """배치 항목의 셀 좌표 ('cell'이 없으면 A1 범위 해석)"""
+    cell = entry.get('cell')
+    if cell is not None:
+        return cell[0], cell[1], cell[2]
+    return parse_cell_a1(entry['range'])
+
+
+# ==================== 시트 ID ====================
+
+def remember_sheet_ids(spreadsheet_id: str, sheets: Iterable[Dict]):
+    """
+    spreadsheets.get 응답의 sheets 목록에서 시트 ID 기록
+
+    Args:
+        spreadsheet_id (str): 스프레드시트 ID
+        sheets (Iterable[Dict]): [{'properties': {'sheetId', 'title'}}, ...]
+    """
+    ids = {}
+    for sheet in sheets:
+        properties = sheet.get('properties', {})
+        if 'sheetId' in properties and 'title' in properties:
+            ids[properties['title']] = properties['sheetId']
+    if ids:
+        with _sheet_ids_lock:
+            _sheet_ids[spreadsheet_id] = ids
+
+
+def cached_sheet_ids(spreadsheet_id: str) -> Dict[str, int]:
+    """기록된 시트 ID ({시트 이름: sheetId}, 없으면 빈 딕셔너리)"""
+    with _sheet_ids_lock:
+        return _sheet_ids.get(spreadsheet_id, {})
+
+
+def forget_sheet_ids(spreadsheet_id: str):
+    """기록된 시트 ID 삭제 (시트 추가·이름 변경 후 다시 조회하도록)"""
+    with _sheet_ids_lock:
+        _sheet_ids.pop(spreadsheet_id, None)
+
+
+# ==================== updateCells 요청 ====================
+
+def _cell_data(value) -> Dict:
+    """셀 값 → CellData (빈 문자열은 값 없음 = 셀 비우기)"""
+    if isinstance(value, bool):
+        return {'userEnteredValue': {'boolValue': value}}
+    if isinstance(value, (int, float)):
+        return {'userEnteredValue': {'numberValue': value}}
+    if value is None or value == '':
+        return {}
+    value = str(value)
+    if value.startswith('='):
+        return {'userEnteredValue': {'formulaValue': value}}
+    return {'userEnteredValue': {'stringValue': value}}
+
+
+def update_cells_requests(entries: List[Dict], sheet_ids: Dict[str, int]) -> Optional[List[Dict]]:
+    """
+    셀 쓰기 배치 → spreadsheets.batchUpdate updateCells 요청
+
+    같은 셀이 여러 번 있으면 마지막 값만 쓰고, 같은 시트·열에서 행이 이어지는 셀은
+    GridRange 하나(행 여러 개)로 묶습니다.
+
+    Args:
+        entries (List[Dict]): [{'range', 'values', 'cell'(선택)}, ...] (셀 하나씩)
+        sheet_ids (Dict[str, int]): {시트 이름: sheetId}
+
+    Returns:
+        Optional[List[Dict]]: updateCells 요청 리스트
+            (셀 범위가 아닌 항목이나 ID를 모르는 시트가 있으면 None → values.batchUpdate로 보냄)
+    """
+    cells: Dict[Tuple[int, int, int], Dict] = {}
+    for entry in entries:
+        cell = entry_cell(entry)
+        if cell is None or cell[0] not in sheet_ids:
+            return None
+        sheet_name, row, column = cell
+        cells[(sheet_ids[sheet_name], column, row)] = _cell_data(entry['values'][0][0])
+
+    requests = []
+    run_start = None
+    rows: List[Dict] = []
+    previous = None
+    for key in sorted(cells):
+        sheet_id, column, row = key
+        if previous is None or previous != (sheet_id, column, row - 1):
+            if rows:
+                requests.append(_update_cells(previous[0], previous[1], run_start, rows))
+            run_start, rows = row, []
+        rows.append({'values': [cells[key]]})
+        previous = key
+    if rows:
+        requests.append(_update_cells(previous[0], previous[1], run_start, rows))
+    return requests
+
+
+def _update_cells(sheet_id: int, column: int, start_row: int, rows: List[Dict]) -> Dict:
+    """한 열에서 이어지는 행들의 updateCells 요청"""
+    return {
+        'updateCells': {
+            'range': {
+                'sheetId': sheet_id,
+                'startRowIndex': start_row,
+                'endRowIndex': start_row + len(rows),
+                'startColumnIndex': column,
+                'endColumnIndex': column + 1,
+            },
+            'rows': rows,
+            'fields': 'userEnteredValue',
+        }
+    }
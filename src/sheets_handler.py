@@ -2,13 +2,39 @@
 Google Sheets API 처리 모듈
 스프레드시트에서 학생 명단을 읽고 출석 체크를 업데이트합니다.
 """
+import logging
+import os
+import random
+import socket
+from collections import deque
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 from enum import Enum
+from pathlib import Path
+import sys
 import time
 
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.roster_index import RosterIndex, RosterFingerprint, get_cached_roster, cache_roster
+from src.sheets_transport import TRANSPORT_SESSION, TRANSPORT_HTTPLIB2, get_shared_http
+from src.sheets_discovery import build_sheets_service, service_resources
+from src.sheets_quota import READ, WRITE, credential_identity, quota_accountant
+from src.sheets_outbox import sheets_outbox
+from src.sheets_writer import write_queue
+from src.sheets_grid import (cell_a1, cell_entry, update_cells_requests,
+                             remember_sheet_ids, cached_sheet_ids, forget_sheet_ids)
+from src.utils.common import column_index_to_letter
+
+logger = logging.getLogger(__name__)
+
+# 셀 쓰기 방식: grid(spreadsheets.batchUpdate updateCells, sheetId + 행·열 인덱스) 또는 values(values.batchUpdate, A1 범위)
+WRITE_MODE_GRID = 'grid'
+WRITE_MODE_VALUES = 'values'
+
 
 class AttendanceStatus(Enum):
     """출석 상태"""
@@ -23,6 +49,35 @@ class SheetsHandler:
     # Google Sheets API 스코프
     SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
+    # 명단 읽기 단위 (행)와 읽기를 멈출 연속 빈 행 수
+    ROSTER_CHUNK_ROWS = 2000
+    ROSTER_BLANK_STOP = 100
+
+    # HTTP 전송 방식: session(AuthorizedSession 연결 풀, 스레드 공유) 또는 httplib2(기존)
+    TRANSPORT = os.environ.get('SHEETS_TRANSPORT', TRANSPORT_SESSION)
+
+    # 호출별 측정값 보관 개수 (metrics)
+    METRICS_SIZE = 200
+
+    # 응답 필드 마스크 (필요한 필드만 받아 응답 크기와 파싱 시간 절감)
+    FIELDS_VALUES = 'values'
+    FIELDS_SHEET_TITLES = 'properties.title,sheets.properties(sheetId,title)'
+    FIELDS_SHEET_IDS = 'sheets.properties(sheetId,title)'
+    FIELDS_UPDATED_CELLS = 'totalUpdatedCells'
+
+    # 셀 쓰기 방식 (grid면 시트 ID를 모르는 시트만 values.batchUpdate로 보냄)
+    WRITE_MODE = os.environ.get('SHEETS_WRITE_MODE', WRITE_MODE_GRID)
+
+    # 쓰기 할당량으로 세는 호출 (나머지는 읽기)
+    WRITE_CALLS = frozenset({'values.update', 'values.batchUpdate', 'spreadsheets.batchUpdate'})
+
+    # batchUpdate 실패 복구
+    # 일시적 오류(429, 5xx)는 지수 백오프로 재시도하고, 그 외 오류는 배치를 반으로 나눠 잘못된 범위만 골라냄
+    BATCH_RETRIES = 3
+    RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+    # 이분 분할로 보낼 최대 요청 수 (시트가 없는 등 전체가 실패할 때 요청이 셀 수만큼 늘지 않도록)
+    BISECT_MAX_REQUESTS = 64
+
     def __init__(self, credentials_path: str, spreadsheet_id: str, sheet_name: str = '출석현황'):
         """
         SheetsHandler 초기화
@@ -36,26 +91,43 @@ class SheetsHandler:
         self.spreadsheet_id = spreadsheet_id
         self.sheet_name = sheet_name
         self.service = None
+        # 요청별 측정값: {'call', 'target', 'bytes', 'parse_ms', 'total_ms', 'quota_wait_ms', 'attempt'}
+        self.metrics = deque(maxlen=self.METRICS_SIZE)
+        # 마지막 배치 쓰기에서 실패한 셀: [{'range', 'status', 'reason'}]
+        self.last_write_failures: List[Dict] = []
 
-    def connect(self) -> bool:
+    def connect(self, transport: Optional[str] = None) -> bool:
         """
         Google Sheets API 연결
 
+        기본 전송(session)은 인증 파일별로 공유하는 연결 풀을 사용하므로
+        같은 인증 파일을 쓰는 핸들러와 스케줄러 작업 스레드가 TCP/TLS 연결을 재사용합니다.
+        서비스는 번들 디스커버리 문서(프로세스당 한 번 파싱)로 만들고, 연결 풀별로 공유합니다.
+
+        Args:
+            transport (Optional[str]): 'session' 또는 'httplib2' (None이면 TRANSPORT)
+
         Returns:
             bool: 연결 성공 여부
         """
+        transport = transport or self.TRANSPORT
+
         try:
-            credentials = service_account.Credentials.from_service_account_file(
-                self.credentials_path,
-                scopes=self.SCOPES
-            )
-            self.service = build('sheets', 'v4', credentials=credentials)
+            if transport == TRANSPORT_HTTPLIB2:
+                credentials = service_account.Credentials.from_service_account_file(
+                    self.credentials_path,
+                    scopes=self.SCOPES
+                )
+                self.service = build_sheets_service(credentials=credentials)
+            else:
+                http = get_shared_http(self.credentials_path, tuple(self.SCOPES))
+                self.service = build_sheets_service(http=http)
             return True
         except FileNotFoundError:
-            print(f"✗ 인증 파일 없음: {self.credentials_path}")
+            logger.error("✗ 인증 파일 없음: %s", self.credentials_path)
             return False
         except Exception as e:
-            print(f"✗ Google Sheets 연결 실패: {e}")
+            logger.error("✗ Google Sheets 연결 실패: %s", e)
             return False
 
     def test_connection(self) -> bool:
@@ -69,83 +141,302 @@ class SheetsHandler:
             return False
 
         try:
-            # 스프레드시트 메타데이터 가져오기
-            sheet_metadata = self.service.spreadsheets().get(
-                spreadsheetId=self.spreadsheet_id
-            ).execute()
+            # 스프레드시트 메타데이터 가져오기 (제목과 시트 이름만)
+            sheet_metadata = self._execute(
+                self._spreadsheets().get(
+                    spreadsheetId=self.spreadsheet_id,
+                    fields=self.FIELDS_SHEET_TITLES
+                ),
+                'spreadsheets.get'
+            )
 
-            # 시트 목록 확인
+            # 시트 목록 확인 (시트 ID는 셀 쓰기용으로 기록)
             sheets = sheet_metadata.get('sheets', [])
+            remember_sheet_ids(self.spreadsheet_id, sheets)
             sheet_names = [s['properties']['title'] for s in sheets]
 
             if self.sheet_name not in sheet_names:
                 title = sheet_metadata.get('properties', {}).get('title', 'Unknown')
-                print(f"✗ 시트 없음: '{self.sheet_name}' (스프레드시트: {title})")
+                logger.error("✗ 시트 없음: '%s' (스프레드시트: %s)", self.sheet_name, title)
                 return False
 
             return True
 
         except HttpError as e:
-            print(f"✗ 스프레드시트 접근 실패")
-            print(f"   상세: {e}")
+            logger.error("✗ 스프레드시트 접근 실패")
+            logger.error("   상세: %s", e)
             return False
         except Exception as e:
-            print(f"✗ 연결 테스트 실패: {e}")
+            logger.error("✗ 연결 테스트 실패: %s", e)
             return False
 
-    def get_student_list(self, name_column: int, start_row: int) -> Dict[str, int]:
+    @staticmethod
+    def cell_range(sheet_name: str, row_number: int, column: int) -> str:
+        """
+        셀 하나의 A1 범위 (예: "출석현황!K5", "출석현황!AB5")
+
+        Args:
+            sheet_name (str): 시트 이름
+            row_number (int): 행 번호 (0-based)
+            column (int): 열 인덱스 (0-based)
+        """
+        return cell_a1(sheet_name, row_number, column)
+
+    def sheet_ids(self, refresh: bool = False) -> Dict[str, int]:
+        """
+        스프레드시트의 시트 ID ({시트 이름: sheetId}, 스프레드시트별로 한 번 조회해 프로세스 전체에서 공유)
+
+        test_connection()이 이미 조회했으면 API를 호출하지 않습니다.
+
+        Args:
+            refresh (bool): 기록을 버리고 다시 조회 (시트 추가·이름 변경 후)
+
+        Returns:
+            Dict[str, int]: 시트 ID (조회 실패 시 빈 딕셔너리)
+        """
+        if refresh:
+            forget_sheet_ids(self.spreadsheet_id)
+        ids = cached_sheet_ids(self.spreadsheet_id)
+        if ids or not self.service:
+            return ids
+
+        try:
+            result = self._execute(
+                self._spreadsheets().get(
+                    spreadsheetId=self.spreadsheet_id,
+                    fields=self.FIELDS_SHEET_IDS
+                ),
+                'spreadsheets.get',
+                '시트 ID'
+            )
+        except HttpError as e:
+            logger.warning("⚠ 시트 ID 조회 실패 (A1 범위로 쓰기): %s", e)
+            return {}
+
+        remember_sheet_ids(self.spreadsheet_id, result.get('sheets', []))
+        return cached_sheet_ids(self.spreadsheet_id)
+
+    def _spreadsheets(self):
+        """service.spreadsheets() 리소스 (생성 비용이 커서 서비스별로 한 번만 생성, 스레드 간 공유)"""
+        return service_resources(self.service)[0]
+
+    def _values(self):
+        """service.spreadsheets().values() 리소스"""
+        return service_resources(self.service)[1]
+
+    def _execute(self, request, call: str, target: str = '', num_retries: int = 0) -> Dict:
+        """
+        API 요청 실행 + 응답 크기·파싱 시간 측정 (self.metrics에 시도별로 기록)
+
+        보내기 전에 할당량 관리자(quota_accountant)에서 자리를 확보하므로
+        같은 서비스 계정의 분당 할당량이 차 있으면 자리가 날 때까지 기다립니다.
+        재시도도 여기서 직접 하고 시도마다 자리를 다시 확보합니다 (request.execute의 num_retries는
+        할당량 관리자를 거치지 않고 요청을 더 보내므로 쓰지 않음).
+
+        - 429: 첫 응답에서 바로 서비스 계정 대기(note_throttled)를 걸고, 다음 시도는 acquire에서 대기가 끝난 뒤 보냄
+        - 5xx, 연결 오류: 지수 백오프(최대 2^n초, 무작위) 후 재시도
+
+        Args:
+            request: googleapiclient HttpRequest
+            call (str): 호출 이름 (예: "values.get")
+            target (str): 범위 등 로그용 대상
+            num_retries (int): 일시적 오류(429, 5xx, 연결 오류) 재시도 횟수
+
+        Returns:
+            Dict: 응답 본문
+
+        Raises:
+            QuotaWaitTimeout: 할당량 대기 시간이 너무 긴 경우
+        """
+        project, account = credential_identity(str(self.credentials_path))
+        kind = WRITE if call in self.WRITE_CALLS else READ
+        postproc = request.postproc
+        metric: Dict = {}
+
+        def measured_postproc(resp, content):
+            metric['bytes'] = len(content or b'')
+            parse_start = time.perf_counter()
+            try:
+                return postproc(resp, content)
+            finally:
+                metric['parse_ms'] = (time.perf_counter() - parse_start) * 1000
+
+        request.postproc = measured_postproc
+        for attempt in range(num_retries + 1):
+            waited = quota_accountant.acquire(project, account, self.spreadsheet_id, kind)
+            metric = {'call': call, 'target': target, 'bytes': 0, 'parse_ms': 0.0, 'total_ms': 0.0,
+                      'quota_wait_ms': waited * 1000, 'attempt': attempt}
+            start = time.perf_counter()
+            try:
+                return request.execute()
+            except HttpError as e:
+                status = e.resp.status
+                if status == 429:
+                    quota_accountant.note_throttled(account)
+                if attempt == num_retries or status not in self.RETRYABLE_STATUSES:
+                    raise
+                reason = f"HTTP {status}"
+            except (ConnectionError, socket.timeout) as e:
+                if attempt == num_retries:
+                    raise
+                reason = type(e).__name__
+            finally:
+                metric['total_ms'] = (time.perf_counter() - start) * 1000
+                self.metrics.append(metric)
+                logger.debug("[Sheets] %s %s: %s bytes, 파싱 %.2fms, 전체 %.1fms",
+                             call, target, metric['bytes'], metric['parse_ms'], metric['total_ms'])
+
+            # 429는 acquire가 서비스 계정 대기 시간만큼 기다리므로 따로 쉬지 않음
+            delay = 0.0 if reason == 'HTTP 429' else random.random() * 2 ** attempt
+            logger.warning("⚠ Sheets %s %s 재시도 %s/%s (%s, %.1f초 후)",
+                           call, target, attempt + 1, num_retries, reason, delay)
+            time.sleep(delay)
+
+    def get_student_list(
+        self,
+        name_column: int,
+        start_row: int,
+        chunk_rows: Optional[int] = None,
+        blank_stop: Optional[int] = None
+    ) -> Dict[str, int]:
         """
         스프레드시트에서 학생 명단 읽기
 
+        명단 열을 chunk_rows행씩 나눠 읽고, 빈 행이 blank_stop행 이어지면 멈춥니다.
+        명단 열 내용의 해시가 이전과 같으면 캐시된 명단 색인(로마자 색인 등 파생 구조 포함)을
+        그대로 반환하고, 달라졌을 때만 새로 만듭니다.
+
         Args:
             name_column (int): 이름 열 인덱스 (0-based)
             start_row (int): 시작 행 인덱스 (0-based)
+            chunk_rows (Optional[int]): 한 번에 읽을 행 수 (기본 ROSTER_CHUNK_ROWS)
+            blank_stop (Optional[int]): 읽기를 멈출 연속 빈 행 수 (기본 ROSTER_BLANK_STOP)
 
         Returns:
-            Dict[str, int]: {학생이름: 행번호} 매핑 딕셔너리
+            Dict[str, int]: {학생이름: 행번호} 매핑 (RosterIndex, 실패 시 빈 딕셔너리)
         """
         if not self.service:
             return {}
 
         try:
-            # A1 notation으로 변환
-            col_letter = chr(65 + name_column)  # 0 -> A, 1 -> B, ...
-            start_row_num = start_row + 1  # 0-based -> 1-based
-            range_name = f"{self.sheet_name}!{col_letter}{start_row_num}:{col_letter}"
-
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=range_name
-            ).execute()
+            fingerprint = RosterFingerprint(start_row)
 
-            values = result.get('values', [])
+            # {이름: 행번호} 매핑 (같은 이름은 마지막 행), 행 → 이름은 동명이인의 앞쪽 행까지 모두 보관
+            student_rows = list(self.iter_student_rows(name_column, start_row, chunk_rows, blank_stop, fingerprint))
+            student_dict = dict(student_rows)
 
-            if not values:
-                print(f"✗ 학생 명단 없음")
+            if not student_dict:
+                logger.error("✗ 학생 명단 없음")
                 return {}
 
-            # {이름: 행번호} 매핑
-            student_dict = {}
-            for i, row in enumerate(values):
-                if row and row[0]:  # 빈 셀이 아닌 경우
-                    name = row[0].strip()
-                    if name:
-                        row_number = start_row + i  # 0-based 행 번호
-                        student_dict[name] = row_number
+            # 명단이 바뀌지 않았으면 이전에 만든 색인 재사용
+            roster = get_cached_roster(fingerprint.hexdigest())
+            if roster is not None:
+                logger.info("✓ 학생 명단: %s명 (변경 없음)", len(roster))
+                return roster
 
-            print(f"✓ 학생 명단: {len(student_dict)}명")
+            logger.info("✓ 학생 명단: %s명", len(student_dict))
 
-            return student_dict
+            names_by_row = {row: name for name, row in student_rows}
+            return cache_roster(RosterIndex(student_dict, fingerprint.hexdigest(), names_by_row))
 
         except HttpError as e:
-            print(f"✗ 학생 명단 읽기 실패")
-            print(f"   범위: {range_name}")
-            print(f"   상세: {e}")
+            logger.error("✗ 학생 명단 읽기 실패")
+            logger.error("   시트: %s, 열: %s", self.sheet_name, column_index_to_letter(name_column))
+            logger.error("   상세: %s", e)
             return {}
         except Exception as e:
-            print(f"✗ 오류: {e}")
+            logger.error("✗ 오류: %s", e)
             return {}
 
+    def iter_student_rows(
+        self,
+        name_column: int,
+        start_row: int,
+        chunk_rows: Optional[int] = None,
+        blank_stop: Optional[int] = None,
+        fingerprint: Optional[RosterFingerprint] = None
+    ) -> Iterator[Tuple[str, int]]:
+        """
+        명단 열을 행 구간 단위로 나눠 읽으며 (이름, 행번호) 반환
+
+        한 번에 한 구간의 응답만 메모리에 두므로 수만 행 시트에서도 메모리 사용이 일정합니다.
+        시트 API는 구간 끝의 빈 행을 응답에서 생략하므로, 응답이 구간보다 짧으면 나머지를 빈 행으로 셉니다.
+        열 하나만 읽으므로 열 단위(COLUMNS)·서식 없는 값(UNFORMATTED_VALUE)으로 요청합니다.
+
+        Args:
+            name_column (int): 이름 열 인덱스 (0-based)
+            start_row (int): 시작 행 인덱스 (0-based)
+            chunk_rows (Optional[int]): 한 번에 읽을 행 수 (기본 ROSTER_CHUNK_ROWS)
+            blank_stop (Optional[int]): 읽기를 멈출 연속 빈 행 수 (기본 ROSTER_BLANK_STOP)
+            fingerprint (Optional[RosterFingerprint]): 읽은 셀을 누적할 명단 해시
+
+        Yields:
+            Tuple[str, int]: (학생이름, 0-based 행번호)
+
+        Raises:
+            HttpError: 첫 구간 읽기 실패
+        """
+        chunk_rows = chunk_rows or self.ROSTER_CHUNK_ROWS
+        blank_stop = blank_stop or self.ROSTER_BLANK_STOP
+        col_letter = column_index_to_letter(name_column)  # 0 -> A, 1 -> B, ..., 26 -> AA
+
+        chunk_start = start_row
+        blank_run = 0
+
+        while blank_run < blank_stop:
+            # A1 notation (1-based, 닫힌 구간)
+            range_name = f"{self.sheet_name}!{col_letter}{chunk_start + 1}:{col_letter}{chunk_start + chunk_rows}"
+
+            try:
+                result = self._execute(
+                    self._values().get(
+                        spreadsheetId=self.spreadsheet_id,
+                        range=range_name,
+                        majorDimension='COLUMNS',
+                        valueRenderOption='UNFORMATTED_VALUE',
+                        fields=self.FIELDS_VALUES
+                    ),
+                    'values.get',
+                    range_name,
+                    num_retries=self.BATCH_RETRIES
+                )
+            except HttpError as e:
+                # 시트 행 수를 넘는 구간은 400 "exceeds grid limits"로 응답 → 명단 끝으로 처리
+                # 그 외 오류(429, 5xx 등)는 명단이 잘린 채 캐시되지 않도록 그대로 전달
+                if chunk_start == start_row or not self._exceeds_grid_limits(e):
+                    raise
+                logger.debug("명단 읽기 종료 (%s): %s", range_name, e)
+                return
+
+            # 열 단위 응답: [[1행, 2행, ...]] (서식 없는 값은 숫자일 수 있으므로 문자열로 변환)
+            columns = result.get('values', [])
+            values = columns[0] if columns else []
+
+            for offset, value in enumerate(values):
+                cell = str(value).strip()
+                if fingerprint is not None:
+                    fingerprint.add(cell)
+
+                if not cell:
+                    blank_run += 1
+                    if blank_run >= blank_stop:
+                        return
+                    continue
+
+                blank_run = 0
+                yield cell, chunk_start + offset
+
+            blank_run += chunk_rows - len(values)
+            if fingerprint is not None:
+                fingerprint.add_blanks(chunk_rows - len(values))
+            chunk_start += chunk_rows
+
+    @staticmethod
+    def _exceeds_grid_limits(error: HttpError) -> bool:
+        """시트 크기를 벗어난 범위 요청 오류 여부 (400 "... exceeds grid limits ...")"""
+        return error.resp.status == 400 and 'exceeds grid limits' in str(error)
+
     def update_attendance(self, row_number: int, column: int, status: AttendanceStatus = AttendanceStatus.PRESENT) -> bool:
         """
         특정 셀의 출석 체크 업데이트
@@ -163,9 +454,7 @@ class SheetsHandler:
 
         try:
             # A1 notation으로 변환
-            col_letter = chr(65 + column)  # 0 -> A, 1 -> B, ...
-            row_num = row_number + 1  # 0-based -> 1-based
-            cell_range = f"{self.sheet_name}!{col_letter}{row_num}"
+            cell_range = cell_a1(self.sheet_name, row_number, column)
 
             # 출석 상태 문자 (O, X, △)
             status_value = status.value if isinstance(status, AttendanceStatus) else status
@@ -174,20 +463,25 @@ class SheetsHandler:
                 'values': [[status_value]]
             }
 
-            self.service.spreadsheets().values().update(
-                spreadsheetId=self.spreadsheet_id,
-                range=cell_range,
-                valueInputOption='USER_ENTERED',
-                body=body
-            ).execute()
+            self._execute(
+                self._values().update(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=cell_range,
+                    valueInputOption='USER_ENTERED',
+                    body=body,
+                    fields='updatedCells'
+                ),
+                'values.update',
+                cell_range
+            )
 
             return True
 
         except HttpError as e:
-            print(f"✗ 셀 업데이트 실패 ({cell_range}): {e}")
+            logger.error("✗ 셀 업데이트 실패 (%s): %s", cell_range, e)
             return False
         except Exception as e:
-            print(f"✗ 오류 발생: {e}")
+            logger.error("✗ 오류 발생: %s", e)
             return False
 
     def batch_update_attendance(self, updates: List[Dict]) -> int:
@@ -205,74 +499,38 @@ class SheetsHandler:
             return 0
 
         try:
-            # batchUpdate API를 위한 데이터 준비
-            batch_data = []
-
-            for update in updates:
-                name = update.get('name')
-                row = update.get('row')
-                column = update.get('column')
-                status = update.get('status', AttendanceStatus.PRESENT)
-
-                if row is None or column is None:
-                    continue
+            batch_data, names_by_range = self.attendance_batch_data(updates)
 
-                # A1 notation으로 변환
-                col_letter = chr(65 + column)  # 0 -> A, 1 -> B, ...
-                row_num = row + 1  # 0-based -> 1-based
-                cell_range = f"{self.sheet_name}!{col_letter}{row_num}"
-
-                # 출석 상태 문자 (O, X, △)
-                status_value = status.value if isinstance(status, AttendanceStatus) else status
-
-                batch_data.append({
-                    'range': cell_range,
-                    'values': [[status_value]]
-                })
+            if not batch_data:
+                return 0
 
-            # 한 번의 API 호출로 모든 셀 업데이트
-            if batch_data:
-                body = {
-                    'data': batch_data,
-                    'valueInputOption': 'USER_ENTERED'
-                }
+            # 한 번의 API 호출로 모든 셀 업데이트 (실패하면 재시도·분할로 잘못된 셀만 제외)
+            updated_cells = self._write_batch(batch_data, self.sheet_name)
 
-                result = self.service.spreadsheets().values().batchUpdate(
-                    spreadsheetId=self.spreadsheet_id,
-                    body=body
-                ).execute()
+            logger.info("✓ 출석 체크 완료: %s명", updated_cells)
+            if self.last_write_failures:
+                logger.warning("   실패: %s",
+                               ', '.join(str(names_by_range.get(failure['range'], failure['range']))
+                                         for failure in self.last_write_failures))
 
-                # 업데이트된 셀 개수
-                updated_cells = result.get('totalUpdatedCells', 0)
-                print(f"✓ 출석 체크 완료: {updated_cells}명")
+            return updated_cells
 
-                return updated_cells
-            else:
-                return 0
-
-        except HttpError as e:
-            print(f"✗ 출석 업데이트 실패")
-            print(f"   에러 코드: {e.resp.status}")
-            print(f"   상세: {e.error_details if hasattr(e, 'error_details') else str(e)}")
-            # 에러 발생 시 개별 업데이트로 폴백
-            print(f"   재시도 중...")
-            return self._fallback_individual_update(updates)
         except Exception as e:
-            print(f"✗ 출석 업데이트 오류: {e}")
+            logger.error("✗ 출석 업데이트 오류: %s", e)
             return 0
 
-    def _fallback_individual_update(self, updates: List[Dict]) -> int:
+    def attendance_batch_data(self, updates: List[Dict]) -> Tuple[List[Dict], Dict[str, str]]:
         """
-        배치 업데이트 실패 시 개별 업데이트로 폴백
+        출석 업데이트 리스트를 batchUpdate data로 변환
 
         Args:
-            updates (List[Dict]): 업데이트 정보 리스트
+            updates (List[Dict]): batch_update_attendance 업데이트 리스트
 
         Returns:
-            int: 성공한 업데이트 수
+            Tuple[List[Dict], Dict[str, str]]: (batchUpdate data, {범위: 학생 이름})
         """
-        success_count = 0
-        failed_names = []
+        batch_data = []
+        names_by_range = {}
 
         for update in updates:
             name = update.get('name')
@@ -283,19 +541,164 @@ class SheetsHandler:
             if row is None or column is None:
                 continue
 
-            if self.update_attendance(row, column, status):
-                success_count += 1
-            else:
-                failed_names.append(name)
+            # 출석 상태 문자 (O, X, △)
+            status_value = status.value if isinstance(status, AttendanceStatus) else status
+
+            entry = cell_entry(self.sheet_name, row, column, status_value)
+            batch_data.append(entry)
+            names_by_range[entry['range']] = name
+
+        return batch_data, names_by_range
+
+    def _write_batch(self, batch_data: List[Dict], target: str, outbox_id: Optional[str] = None) -> int:
+        """
+        셀 쓰기 배치를 아웃박스에 저장한 뒤 보내기
 
-            # API Rate Limiting 방지
-            time.sleep(0.2)
+        보내는 도중 프로세스가 죽거나 연결이 끊겨도 배치가 아웃박스에 남아 다음 시작(또는 주기 재전송) 때
+        다시 보내집니다. 일시적 오류로 실패한 셀만 미완료로 남기고 나머지는 완료로 표시합니다.
+        전송은 스프레드시트별 쓰기 대기열을 거치므로 같은 시트에 동시에 들어온 쓰기(수동 실행, 스케줄러,
+        시트를 공유하는 다른 워크스페이스)는 들어온 순서대로 합쳐져 한 번의 batchUpdate로 나갑니다.
+
+        Args:
+            batch_data (List[Dict]): [{'range': A1 범위, 'values': [[값]], 'cell': [시트, 행, 열]}, ...]
+                ('cell'은 선택, cell_entry로 생성)
+            target (str): 로그용 대상 (시트 이름)
+            outbox_id (str): 이미 저장된 배치를 재전송할 때 배치 ID
+
+        Returns:
+            int: 업데이트된 셀 수
+        """
+        self.last_write_failures = []
+        if not batch_data:
+            return 0
 
-        print(f"✓ 출석 체크 완료: {success_count}명")
-        if failed_names:
-            print(f"   실패: {', '.join(failed_names)}")
+        if outbox_id is None:
+            outbox_id = sheets_outbox.enqueue(self.credentials_path, self.spreadsheet_id, target, batch_data)
+
+        try:
+            updated_cells, self.last_write_failures = write_queue(self.spreadsheet_id).submit(
+                self, batch_data, target
+            )
+        except Exception as e:
+            sheets_outbox.fail(outbox_id, str(e))
+            raise
+
+        retry_ranges = {failure['range'] for failure in self.last_write_failures
+                        if failure['status'] in self.RETRYABLE_STATUSES}
+        sheets_outbox.complete(outbox_id, [entry for entry in batch_data if entry['range'] in retry_ranges])
+        return updated_cells
+
+    def write_sender(self) -> 'SheetsHandler':
+        """
+        쓰기 대기열이 인증 파일별로 보관하는 전송용 핸들러 (같은 인증 파일·서비스, 측정값과 실패 기록은 따로)
+
+        대기열이 다른 호출자의 쓰기까지 보내므로, 처음 쓰기를 요청한 핸들러의 상태를 건드리지 않도록 따로 만듭니다.
+        """
+        sender = SheetsHandler(self.credentials_path, self.spreadsheet_id, self.sheet_name)
+        sender.service = self.service
+        return sender
+
+    def _send_batch(self, batch_data: List[Dict], target: str) -> int:
+        """
+        셀 쓰기 (실패 시 재시도 후 이분 분할, 쓰기 대기열이 호출)
 
-        return success_count
+        WRITE_MODE가 grid이면 spreadsheets.batchUpdate updateCells(sheetId + 행·열 인덱스, 이어지는 행은
+        GridRange 하나)로 보내고, 시트 ID를 모르는 시트가 있는 배치는 values.batchUpdate(A1 범위)로 보냅니다.
+
+        - 일시적 오류(429, 5xx): _execute에서 BATCH_RETRIES회 재시도 (시도마다 할당량 확보),
+          그래도 실패하면 나눠 보내도 소용없으므로 해당 배치 전체를 실패로 기록
+        - 그 외 오류(잘못된 범위, 보호된 셀 등): 배치를 반으로 나눠 다시 보내 정상 셀은 큰 요청으로 쓰고
+          실패하는 셀만 골라냄 (잘못된 셀 k개 기준 요청 약 2k·log2(n)개, BISECT_MAX_REQUESTS로 제한)
+
+        실패한 셀은 self.last_write_failures에 기록됩니다.
+
+        Args:
+            batch_data (List[Dict]): [{'range': A1 범위, 'values': [[값]]}, ...]
+            target (str): 로그용 대상 (시트 이름)
+
+        Returns:
+            int: 업데이트된 셀 수
+        """
+        updated_cells = 0
+        requests_left = self.BISECT_MAX_REQUESTS
+        pending = [batch_data]  # 앞쪽 절반부터 처리하는 스택
+        sheet_ids = self._write_sheet_ids(batch_data)
+
+        while pending:
+            chunk = pending.pop()
+            try:
+                updated_cells += self._send_chunk(chunk, target, sheet_ids)
+
+            except HttpError as e:
+                status = e.resp.status
+                reason = getattr(e, 'reason', '') or str(e)
+
+                if len(chunk) == 1 or status in self.RETRYABLE_STATUSES or requests_left < 2:
+                    logger.error("✗ 셀 쓰기 실패 (%s %s셀): %s %s", target, len(chunk), status, reason)
+                    self.last_write_failures.extend(
+                        {'range': entry['range'], 'status': status, 'reason': reason} for entry in chunk
+                    )
+                    continue
+
+                logger.log(logging.WARNING if chunk is batch_data else logging.DEBUG,
+                           "⚠ 배치 쓰기 실패 (%s %s셀, %s), 나눠서 재시도: %s", target, len(chunk), status, reason)
+                requests_left -= 2
+                middle = len(chunk) // 2
+                pending.append(chunk[middle:])
+                pending.append(chunk[:middle])
+
+        return updated_cells
+
+    def _write_sheet_ids(self, batch_data: List[Dict]) -> Dict[str, int]:
+        """
+        updateCells로 보낼 때 쓸 시트 ID (WRITE_MODE가 values면 빈 딕셔너리)
+
+        배치에 기록되지 않은 시트가 있으면 (시트 추가·이름 변경) 한 번 다시 조회합니다.
+        """
+        if self.WRITE_MODE != WRITE_MODE_GRID:
+            return {}
+
+        sheet_ids = self.sheet_ids()
+        titles = {entry['cell'][0] for entry in batch_data if 'cell' in entry}
+        if sheet_ids and not titles <= sheet_ids.keys():
+            sheet_ids = self.sheet_ids(refresh=True)
+        return sheet_ids
+
+    def _send_chunk(self, chunk: List[Dict], target: str, sheet_ids: Dict[str, int]) -> int:
+        """
+        셀 쓰기 요청 하나 보내기 (실패는 HttpError로 전달)
+
+        Returns:
+            int: 업데이트된 셀 수
+        """
+        requests = update_cells_requests(chunk, sheet_ids) if sheet_ids else None
+
+        if requests is not None:
+            # 요청 하나가 모두 적용되거나 모두 실패하므로 보낸 셀 수가 곧 업데이트된 셀 수
+            self._execute(
+                self._spreadsheets().batchUpdate(
+                    spreadsheetId=self.spreadsheet_id,
+                    body={'requests': requests},
+                    fields='spreadsheetId'
+                ),
+                'spreadsheets.batchUpdate',
+                f"{target} {len(chunk)}셀",
+                num_retries=self.BATCH_RETRIES
+            )
+            return sum(len(request['updateCells']['rows']) for request in requests)
+
+        result = self._execute(
+            self._values().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={'data': [{'range': entry['range'], 'values': entry['values']} for entry in chunk],
+                      'valueInputOption': 'USER_ENTERED'},
+                fields=self.FIELDS_UPDATED_CELLS
+            ),
+            'values.batchUpdate',
+            f"{target} {len(chunk)}셀",
+            num_retries=self.BATCH_RETRIES
+        )
+        return result.get('totalUpdatedCells', 0)
 
     def update_assignment(self, sheet_name: str, row_number: int, column: int, value: str = "O") -> bool:
         """
@@ -315,36 +718,49 @@ class SheetsHandler:
 
         try:
             # A1 notation으로 변환
-            col_letter = chr(65 + column) if column < 26 else chr(65 + column // 26 - 1) + chr(65 + column % 26)
-            row_num = row_number + 1  # 0-based -> 1-based
-            cell_range = f"{sheet_name}!{col_letter}{row_num}"
+            cell_range = cell_a1(sheet_name, row_number, column)
 
             body = {
                 'values': [[value]]
             }
 
-            self.service.spreadsheets().values().update(
-                spreadsheetId=self.spreadsheet_id,
-                range=cell_range,
-                valueInputOption='USER_ENTERED',
-                body=body
-            ).execute()
+            self._execute(
+                self._values().update(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=cell_range,
+                    valueInputOption='USER_ENTERED',
+                    body=body,
+                    fields='updatedCells'
+                ),
+                'values.update',
+                cell_range
+            )
 
             return True
 
         except HttpError as e:
-            print(f"✗ 과제 셀 업데이트 실패 ({cell_range}): {e}")
+            logger.error("✗ 과제 셀 업데이트 실패 (%s): %s", cell_range, e)
             return False
         except Exception as e:
-            print(f"✗ 오류 발생: {e}")
+            logger.error("✗ 오류 발생: %s", e)
             return False
 
-    def read_range(self, range_name: str) -> List[List[str]]:
+    def read_range(
+        self,
+        range_name: str,
+        major_dimension: str = 'ROWS',
+        value_render_option: str = 'FORMATTED_VALUE'
+    ) -> List[List[str]]:
         """
         지정된 범위의 값을 읽어오기
 
+        헤더 행 읽기용이므로 기본값은 화면에 보이는 값(FORMATTED_VALUE, 날짜 헤더 "11/6" 등)입니다.
+        열 하나를 읽을 때는 major_dimension='COLUMNS'로 요청하면 응답이 [[1행, 2행, ...]] 하나로 옵니다.
+
         Args:
             range_name (str): A1 notation 범위 (예: "Sheet1!A1:Z1")
+            major_dimension (str): 'ROWS' 또는 'COLUMNS'
+            value_render_option (str): 'FORMATTED_VALUE', 'UNFORMATTED_VALUE', 'FORMULA'
 
         Returns:
             List[List[str]]: 셀 값들의 2차원 리스트
@@ -354,25 +770,32 @@ class SheetsHandler:
                 return []
 
         try:
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=range_name
-            ).execute()
+            result = self._execute(
+                self._values().get(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=range_name,
+                    majorDimension=major_dimension,
+                    valueRenderOption=value_render_option,
+                    fields=self.FIELDS_VALUES
+                ),
+                'values.get',
+                range_name
+            )
 
             values = result.get('values', [])
             return values
 
         except HttpError as e:
-            print(f"✗ 범위 읽기 실패 ({range_name})")
-            print(f"   에러 코드: {e.resp.status}")
-            print(f"   상세: {e.error_details if hasattr(e, 'error_details') else str(e)}")
+            logger.error("✗ 범위 읽기 실패 (%s)", range_name)
+            logger.error("   에러 코드: %s", e.resp.status)
+            logger.error("   상세: %s", e.error_details if hasattr(e, 'error_details') else str(e))
             return []
         except Exception as e:
-            print(f"✗ 범위 읽기 오류: {e}")
+            logger.error("✗ 범위 읽기 오류: %s", e)
             return []
 
     def batch_update_assignment(self, sheet_name: str, column: int, students: Dict[str, int],
-                                submitted: List[str], mark_absent: bool = True) -> int:
+                                submitted: Iterable[str], mark_absent: bool = True) -> int:
         """
         과제실습 모니터링 시트에 O/X 표시 (진짜 배치 처리)
 
@@ -380,7 +803,7 @@ class SheetsHandler:
             sheet_name (str): 시트 이름 (예: "과제실습 모니터링")
             column (int): 기록할 열 인덱스 (0-based)
             students (Dict[str, int]): 학생 명단 딕셔너리 {이름: 행번호}
-            submitted (List[str]): 제출자 이름 리스트
+            submitted (Iterable[str]): 제출자 이름 (리스트면 집합으로 변환해 조회)
             mark_absent (bool): 미제출자 X 표시 여부
 
         Returns:
@@ -390,61 +813,83 @@ class SheetsHandler:
             return 0
 
         try:
-            # batchUpdate API를 위한 데이터 준비
-            batch_data = []
+            batch_data = self.assignment_batch_data(sheet_name, column, students, submitted, mark_absent)
 
-            for student_name, row in students.items():
-                if student_name in submitted:
-                    value = "O"
-                else:
-                    if mark_absent:
-                        value = "X"
-                    else:
-                        continue  # 미제출자 표시 안함
-
-                # A1 notation으로 변환
-                col_letter = chr(65 + column) if column < 26 else chr(65 + column // 26 - 1) + chr(65 + column % 26)
-                row_num = row + 1  # 0-based -> 1-based
-                cell_range = f"{sheet_name}!{col_letter}{row_num}"
-
-                batch_data.append({
-                    'range': cell_range,
-                    'values': [[value]]
-                })
-
-            # 한 번의 API 호출로 모든 셀 업데이트
-            if batch_data:
-                body = {
-                    'data': batch_data,
-                    'valueInputOption': 'USER_ENTERED'
-                }
-
-                result = self.service.spreadsheets().values().batchUpdate(
-                    spreadsheetId=self.spreadsheet_id,
-                    body=body
-                ).execute()
+            if not batch_data:
+                return 0
 
-                # 업데이트된 셀 개수
-                updated_cells = result.get('totalUpdatedCells', 0)
-                print(f"✓ 과제 체크 완료: {updated_cells}명")
+            # 한 번의 API 호출로 모든 셀 업데이트 (실패하면 재시도·분할로 잘못된 셀만 제외)
+            updated_cells = self._write_batch(batch_data, sheet_name)
 
-                return updated_cells
-            else:
-                return 0
+            logger.info("✓ 과제 체크 완료: %s명", updated_cells)
+            if self.last_write_failures:
+                logger.warning("   실패: %s", ', '.join(failure['range'] for failure in self.last_write_failures))
+
+            return updated_cells
 
-        except HttpError as e:
-            print(f"✗ 과제 업데이트 실패")
-            print(f"   시트: {sheet_name}, 열: {chr(65 + column) if column < 26 else '??'}")
-            print(f"   에러 코드: {e.resp.status}")
-            print(f"   상세: {e.error_details if hasattr(e, 'error_details') else str(e)}")
-            return 0
         except Exception as e:
-            print(f"✗ 과제 업데이트 오류: {e}")
+            logger.error("✗ 과제 업데이트 오류: %s", e)
             return 0
 
+    @staticmethod
+    def assignment_batch_data(sheet_name: str, column: int, students: Dict[str, int],
+                              submitted: Iterable[str], mark_absent: bool = True) -> List[Dict]:
+        """
+        과제 제출 여부를 batchUpdate data로 변환 (제출 O, 미제출 X 또는 생략)
+
+        Args:
+            batch_update_assignment와 같음
+
+        Returns:
+            List[Dict]: batchUpdate data
+        """
+        if not isinstance(submitted, (set, frozenset)):
+            submitted = set(submitted)
+
+        batch_data = []
+
+        for student_name, row in students.items():
+            if student_name in submitted:
+                value = "O"
+            else:
+                if mark_absent:
+                    value = "X"
+                else:
+                    continue  # 미제출자 표시 안함
+
+            batch_data.append(cell_entry(sheet_name, row, column, value))
+
+        return batch_data
+
+    def batch_update_combined(self, parts: Dict[str, List[Dict]]) -> Dict[str, int]:
+        """
+        여러 시트의 batchUpdate data를 한 번의 batchUpdate로 쓰기 (출석 + 과제 동시 실행)
+
+        Args:
+            parts (Dict[str, List[Dict]]): {구분 이름: batchUpdate data}
+
+        Returns:
+            Dict[str, int]: {구분 이름: 업데이트된 셀 수} (실패한 셀 제외)
+        """
+        batch_data = [entry for data in parts.values() for entry in data]
+        if not self.service or not batch_data:
+            return {label: 0 for label in parts}
+
+        try:
+            self._write_batch(batch_data, f"{self.sheet_name} 외 {len(parts) - 1}개 시트")
+        except Exception as e:
+            logger.error("✗ 시트 업데이트 오류: %s", e)
+            return {label: 0 for label in parts}
+
+        failed = {failure['range'] for failure in self.last_write_failures}
+        if failed:
+            logger.warning("   실패: %s", ', '.join(sorted(failed)))
+        return {label: sum(1 for entry in data if entry['range'] not in failed) for label, data in parts.items()}
+
 
 # 테스트 코드
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     from config.settings import (
         GOOGLE_SHEETS_CREDENTIALS_PATH,
         SPREADSHEET_ID,
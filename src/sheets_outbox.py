@@ -0,0 +1,292 @@
+"""
+Sheets 쓰기 아웃박스 모듈
+출석 파싱 후 batchUpdate를 보내기 전에 프로세스가 죽거나 네트워크가 끊기면 그 실행 결과가 사라집니다.
+이 모듈은 보낼 셀 묶음(배치)을 먼저 로컬 SQLite(WAL)에 저장하고, 보내기에 성공하면 완료로 표시합니다.
+완료되지 않은 배치는 앱 시작 시와 주기적으로 다시 보냅니다.
+
+- 배치는 셀에 값을 덮어쓰는(O/X) 쓰기뿐이므로 같은 배치를 다시 보내도 결과가 같음 (멱등)
+- 같은 셀의 새 배치를 저장하면 이전 미완료 배치에서 그 셀을 빼서, 재전송이 새 값을 덮어쓰지 않음
+- 저장은 WAL + synchronous=NORMAL로 배치당 1ms 안팎 (SHEETS_OUTBOX_FILE로 경로 지정, off면 사용 안 함)
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+logger = logging.getLogger(__name__)
+
+# 아웃박스 파일 (off면 사용 안 함)
+OUTBOX_FILE = os.environ.get('SHEETS_OUTBOX_FILE', str(project_root / 'sheets_outbox.db'))
+# 완료된 배치 보관 기간 (초)
+DONE_RETENTION_SECONDS = 7 * 24 * 3600
+# 미완료 배치 재전송 주기 (분, 스케줄러 작업)
+REPLAY_INTERVAL_MINUTES = 5
+# 주기 재전송은 이 시간(초) 넘게 갱신되지 않은 배치만 (지금 보내는 중인 배치 제외)
+REPLAY_MIN_AGE_SECONDS = 60
+
+# 배치 상태
+PENDING = 'pending'
+DONE = 'done'
+SUPERSEDED = 'superseded'   # 모든 셀이 이후 배치로 대체됨
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    id TEXT PRIMARY KEY,
+    credentials_path TEXT NOT NULL,
+    spreadsheet_id TEXT NOT NULL,
+    target TEXT NOT NULL,
+    data TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS batches_pending ON batches (status, spreadsheet_id, created);
+"""
+
+
+@contextmanager
+def _logged_errors(action: str):
+    """기록 실패는 로그만 남김 (배치는 미완료로 남아 재전송될 뿐 시트 쓰기에는 영향 없음)"""
+    try:
+        yield
+    except sqlite3.Error as e:
+        logger.warning("⚠ Sheets 아웃박스 %s 실패: %s", action, e)
+
+
+class OutboxBatch:
+    """아웃박스에 저장된 배치 하나"""
+
+    __slots__ = ('id', 'credentials_path', 'spreadsheet_id', 'target', 'data', 'attempts')
+
+    def __init__(self, id: str, credentials_path: str, spreadsheet_id: str, target: str,
+                 data: List[Dict], attempts: int):
+        self.id = id
+        self.credentials_path = credentials_path
+        self.spreadsheet_id = spreadsheet_id
+        self.target = target
+        self.data = data
+        self.attempts = attempts
+
+
+class SheetsOutbox:
+    """SQLite(WAL) 쓰기 아웃박스 (연결 하나를 스레드들이 잠금으로 공유)"""
+
+    def __init__(self, path: str = OUTBOX_FILE):
+        """
+        Args:
+            path: SQLite 파일 경로 (':memory:' 가능, 'off'면 비활성)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = path == 'off'
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """처음 사용할 때 파일 열기 (열 수 없으면 아웃박스 없이 동작)"""
+        if self._conn is None and not self._disabled:
+            try:
+                conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('PRAGMA synchronous=NORMAL')
+                conn.executescript(SCHEMA)
+                self._conn = conn
+            except sqlite3.Error as e:
+                logger.warning("⚠ Sheets 아웃박스를 열 수 없어 사용하지 않습니다 (%s): %s", self.path, e)
+                self._disabled = True
+        return self._conn
+
+    @property
+    def enabled(self) -> bool:
+        return self._connection() is not None
+
+    def enqueue(self, credentials_path: str, spreadsheet_id: str, target: str, data: List[Dict]) -> Optional[str]:
+        """
+        보낼 배치 저장 (같은 스프레드시트의 이전 미완료 배치에서 겹치는 셀 제거)
+
+        Args:
+            credentials_path: 인증 파일 경로 (재전송 시 연결용)
+            spreadsheet_id: 스프레드시트 ID
+            target: 로그용 대상 (시트 이름)
+            data: values.batchUpdate data ([{'range', 'values'}, ...])
+
+        Returns:
+            Optional[str]: 배치 ID (아웃박스를 쓰지 않으면 None)
+        """
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+
+            batch_id = uuid.uuid4().hex
+            now = time.time()
+            ranges = {entry['range'] for entry in data}
+
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                older = conn.execute(
+                    'SELECT id, data FROM batches WHERE status = ? AND spreadsheet_id = ?',
+                    (PENDING, spreadsheet_id)
+                ).fetchall()
+                for older_id, older_data in older:
+                    entries = json.loads(older_data)
+                    remaining = [entry for entry in entries if entry['range'] not in ranges]
+                    if len(remaining) == len(entries):
+                        continue
+                    if remaining:
+                        conn.execute('UPDATE batches SET data = ?, updated = ? WHERE id = ?',
+                                     (json.dumps(remaining, ensure_ascii=False), now, older_id))
+                    else:
+                        conn.execute('UPDATE batches SET status = ?, updated = ? WHERE id = ?',
+                                     (SUPERSEDED, now, older_id))
+
+                conn.execute(
+                    'INSERT INTO batches (id, credentials_path, spreadsheet_id, target, data, status, created, updated) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (batch_id, str(credentials_path), spreadsheet_id, target,
+                     json.dumps(data, ensure_ascii=False), PENDING, now, now)
+                )
+                conn.execute('COMMIT')
+            except sqlite3.Error as e:
+                conn.execute('ROLLBACK')
+                logger.warning("⚠ Sheets 아웃박스 저장 실패 (아웃박스 없이 전송): %s", e)
+                return None
+            return batch_id
+
+    def complete(self, batch_id: Optional[str], retry: Optional[List[Dict]] = None):
+        """
+        전송 결과 기록
+
+        Args:
+            batch_id: 배치 ID (None이면 무시)
+            retry: 다시 보내야 하는 셀 (일시적 오류로 실패, 없으면 완료)
+        """
+        if batch_id is None:
+            return
+        with self._lock, _logged_errors('완료 기록'):
+            conn = self._connection()
+            if retry:
+                # 보내는 사이 새 배치로 대체된 셀은 다시 보내지 않음
+                row = conn.execute('SELECT data FROM batches WHERE id = ?', (batch_id,)).fetchone()
+                current = {entry['range'] for entry in json.loads(row[0])} if row else set()
+                retry = [entry for entry in retry if entry['range'] in current]
+            if retry:
+                conn.execute(
+                    'UPDATE batches SET data = ?, attempts = attempts + 1, last_error = ?, updated = ? '
+                    'WHERE id = ? AND status = ?',
+                    (json.dumps(retry, ensure_ascii=False), '일시적 오류', time.time(), batch_id, PENDING)
+                )
+            else:
+                conn.execute('UPDATE batches SET status = ?, attempts = attempts + 1, updated = ? '
+                             'WHERE id = ? AND status = ?', (DONE, time.time(), batch_id, PENDING))
+
+    def fail(self, batch_id: Optional[str], error: str):
+        """전송 실패 기록 (배치는 미완료로 남아 재전송 대상)"""
+        if batch_id is None:
+            return
+        with self._lock, _logged_errors('실패 기록'):
+            self._connection().execute(
+                'UPDATE batches SET attempts = attempts + 1, last_error = ?, updated = ? WHERE id = ?',
+                (error[:500], time.time(), batch_id)
+            )
+
+    def pending(self, min_age: float = 0) -> List[OutboxBatch]:
+        """
+        미완료 배치 (저장 순서)
+
+        Args:
+            min_age: 마지막 갱신 후 이 시간(초)이 지난 배치만
+        """
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return []
+            rows = conn.execute(
+                'SELECT id, credentials_path, spreadsheet_id, target, data, attempts FROM batches '
+                'WHERE status = ? AND updated <= ? ORDER BY created', (PENDING, time.time() - min_age)
+            ).fetchall()
+        return [OutboxBatch(row[0], row[1], row[2], row[3], json.loads(row[4]), row[5]) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 배치 수"""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return {}
+            return dict(conn.execute('SELECT status, COUNT(*) FROM batches GROUP BY status').fetchall())
+
+    def purge(self, retention_seconds: float = DONE_RETENTION_SECONDS) -> int:
+        """보관 기간이 지난 완료·대체 배치 삭제"""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return 0
+            cursor = conn.execute('DELETE FROM batches WHERE status != ? AND updated < ?',
+                                  (PENDING, time.time() - retention_seconds))
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def replay_pending(outbox: Optional[SheetsOutbox] = None, min_age: float = REPLAY_MIN_AGE_SECONDS) -> Dict[str, int]:
+    """
+    미완료 배치 재전송 (앱 시작 시 min_age=0, 스케줄러 주기 작업)
+
+    스프레드시트별로 핸들러를 하나씩 연결해 저장 순서대로 보냅니다.
+    연결에 실패한 스프레드시트의 배치는 다음 재전송까지 남겨 둡니다.
+
+    Args:
+        outbox: 아웃박스 (None이면 공유 아웃박스)
+        min_age: 마지막 갱신 후 이 시간(초)이 지난 배치만 (다른 스레드가 보내는 중인 배치 제외)
+
+    Returns:
+        Dict[str, int]: {'batches': 재전송한 배치 수, 'cells': 업데이트된 셀 수, 'skipped': 남겨 둔 배치 수}
+    """
+    from src.sheets_handler import SheetsHandler
+
+    outbox = outbox or sheets_outbox
+    result = {'batches': 0, 'cells': 0, 'skipped': 0}
+    handlers: Dict[tuple, Optional[SheetsHandler]] = {}
+
+    for batch in outbox.pending(min_age):
+        key = (batch.credentials_path, batch.spreadsheet_id)
+        if key not in handlers:
+            handler = SheetsHandler(batch.credentials_path, batch.spreadsheet_id)
+            handlers[key] = handler if handler.connect() else None
+        handler = handlers[key]
+        if handler is None:
+            result['skipped'] += 1
+            continue
+
+        try:
+            result['cells'] += handler._write_batch(batch.data, f"{batch.target} (재전송)", outbox_id=batch.id)
+            result['batches'] += 1
+        except Exception as e:
+            logger.warning("⚠ 아웃박스 재전송 실패 (%s): %s", batch.target, e)
+            result['skipped'] += 1
+
+    if result['batches'] or result['skipped']:
+        logger.info("✓ Sheets 아웃박스 재전송: 배치 %s개, %s셀 (보류 %s개)",
+                    result['batches'], result['cells'], result['skipped'])
+    outbox.purge()
+    return result
+
+
+# 프로세스 전체에서 공유하는 아웃박스
+sheets_outbox = SheetsOutbox()
@@ -0,0 +1,206 @@
+"""
+Sheets API 할당량 관리 모듈
+여러 워크스페이스가 같은 서비스 계정을 쓰면 같은 분에 실행된 출석 체크 작업들이
+분당 할당량(프로젝트별, 서비스 계정별)을 넘겨 429 오류를 받습니다.
+이 모듈은 읽기/쓰기 요청을 프로젝트·서비스 계정·스프레드시트별 60초 구간으로 세고,
+할당량을 넘을 요청은 자리가 날 때까지 기다리게 합니다.
+
+- SheetsHandler._execute()가 요청마다 acquire() 호출 (스케줄러 작업과 웹 요청이 공유)
+- 429를 받으면 해당 서비스 계정은 잠시 요청을 멈춤
+- 남은 요청 수는 GET /api/sheets/quota로 조회
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 요청 종류
+READ = 'read'
+WRITE = 'write'
+
+# 할당량 구간 (초)
+WINDOW_SECONDS = 60
+
+# 분당 할당량 (Sheets API 기본값: 프로젝트별 300, 프로젝트 내 사용자(서비스 계정)별 60)
+# 스프레드시트별 공식 할당량은 없어 서비스 계정과 같게 두고, 한 시트가 계정 할당량을 독차지하지 않게 조절할 때 사용
+DEFAULT_LIMITS: Dict[Tuple[str, str], int] = {
+    ('project', READ): 300,
+    ('project', WRITE): 300,
+    ('account', READ): int(os.environ.get('SHEETS_READ_QUOTA', 60)),
+    ('account', WRITE): int(os.environ.get('SHEETS_WRITE_QUOTA', 60)),
+    ('spreadsheet', READ): int(os.environ.get('SHEETS_READ_QUOTA', 60)),
+    ('spreadsheet', WRITE): int(os.environ.get('SHEETS_WRITE_QUOTA', 60)),
+}
+
+# 할당량 대기 최대 시간 (초, 넘으면 QuotaWaitTimeout)
+MAX_WAIT_SECONDS = 120
+# 429를 받은 서비스 계정의 요청 중지 시간 (초)
+THROTTLE_COOLDOWN_SECONDS = 10
+
+
+class QuotaWaitTimeout(Exception):
+    """할당량이 날 때까지 MAX_WAIT_SECONDS 넘게 기다려야 하는 경우"""
+
+
+@lru_cache(maxsize=None)
+def credential_identity(credentials_path: str) -> Tuple[str, str]:
+    """
+    인증 파일의 (프로젝트 ID, 서비스 계정 이메일) (파일별로 한 번만 읽음)
+
+    Args:
+        credentials_path: 서비스 계정 JSON 키 파일 경로
+
+    Returns:
+        Tuple[str, str]: (프로젝트 ID, 서비스 계정 이메일), 읽을 수 없으면 (경로, 경로)
+    """
+    try:
+        with open(credentials_path, 'r', encoding='utf-8') as f:
+            info = json.load(f)
+        return info.get('project_id') or credentials_path, info.get('client_email') or credentials_path
+    except (OSError, ValueError):
+        return credentials_path, credentials_path
+
+
+class _Window:
+    """60초 구간 요청 기록 (요청 시각 큐)"""
+
+    __slots__ = ('limit', 'times')
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.times: Deque[float] = deque()
+
+    def used(self, now: float, window: float) -> int:
+        """구간 안 요청 수 (지난 요청은 버림)"""
+        times = self.times
+        while times and times[0] <= now - window:
+            times.popleft()
+        return len(times)
+
+    def wait(self, now: float, window: float) -> float:
+        """요청 하나를 더 보내려면 기다려야 하는 시간 (초)"""
+        if self.used(now, window) < self.limit:
+            return 0.0
+        return self.times[len(self.times) - self.limit] + window - now
+
+
+class QuotaAccountant:
+    """프로젝트·서비스 계정·스프레드시트별 분당 읽기/쓰기 요청 관리"""
+
+    def __init__(
+        self,
+        limits: Optional[Dict[Tuple[str, str], int]] = None,
+        window: float = WINDOW_SECONDS,
+        max_wait: float = MAX_WAIT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Args:
+            limits: {(범위, 요청 종류): 분당 요청 수} (범위: project, account, spreadsheet)
+            window: 할당량 구간 (초)
+            max_wait: 요청 하나당 최대 대기 시간 (초)
+            clock: 시각 함수 (단조 증가)
+            sleep: 대기 함수
+        """
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self.window = window
+        self.max_wait = max_wait
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        # {(범위, 키, 요청 종류): _Window}
+        self._windows: Dict[Tuple[str, str, str], _Window] = {}
+        # 429 후 요청 중지 종료 시각: {서비스 계정: 시각}
+        self._cooldowns: Dict[str, float] = {}
+        self.stats = {'requests': 0, 'delayed': 0, 'waited_seconds': 0.0, 'throttled': 0}
+
+    def _window(self, scope: str, key: str, kind: str) -> _Window:
+        window = self._windows.get((scope, key, kind))
+        if window is None:
+            window = self._windows[(scope, key, kind)] = _Window(self.limits[(scope, kind)])
+        return window
+
+    def acquire(self, project: str, account: str, spreadsheet_id: str, kind: str) -> float:
+        """
+        요청 하나를 보낼 자리 확보 (할당량이 차 있으면 자리가 날 때까지 대기)
+
+        Args:
+            project: 프로젝트 ID
+            account: 서비스 계정 이메일
+            spreadsheet_id: 스프레드시트 ID
+            kind: READ 또는 WRITE
+
+        Returns:
+            float: 기다린 시간 (초)
+
+        Raises:
+            QuotaWaitTimeout: max_wait 넘게 기다려야 하는 경우
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                windows = (
+                    self._window('project', project, kind),
+                    self._window('account', account, kind),
+                    self._window('spreadsheet', spreadsheet_id, kind),
+                )
+                wait = max(self._cooldowns.get(account, now) - now,
+                           *(window.wait(now, self.window) for window in windows))
+
+                if wait <= 0:
+                    for window in windows:
+                        window.times.append(now)
+                    self.stats['requests'] += 1
+                    if waited:
+                        self.stats['delayed'] += 1
+                        self.stats['waited_seconds'] += waited
+                    return waited
+
+            if waited + wait > self.max_wait:
+                raise QuotaWaitTimeout(
+                    f"Sheets {kind} 할당량 대기 시간 초과 ({account}, {spreadsheet_id}, {waited + wait:.1f}초)"
+                )
+            if not waited:
+                logger.info("⏳ Sheets %s 할당량 대기 %.1f초 (%s)", kind, wait, spreadsheet_id)
+            self._sleep(wait)
+            waited += wait
+
+    def note_throttled(self, account: str):
+        """429 응답 기록 (해당 서비스 계정은 THROTTLE_COOLDOWN_SECONDS 동안 새 요청을 보내지 않음)"""
+        with self._lock:
+            self._cooldowns[account] = self._clock() + THROTTLE_COOLDOWN_SECONDS
+            self.stats['throttled'] += 1
+        logger.warning("⚠ Sheets 할당량 초과 응답(429): %s, %s초 대기", account, THROTTLE_COOLDOWN_SECONDS)
+
+    def headroom(self) -> Dict:
+        """
+        현재 구간의 범위별 사용량과 남은 요청 수
+
+        Returns:
+            Dict: {'window_seconds', 'stats', 'project': [...], 'account': [...], 'spreadsheet': [...]}
+                각 항목: {'key', 'kind', 'used', 'limit', 'headroom'}
+        """
+        with self._lock:
+            now = self._clock()
+            result = {'window_seconds': self.window, 'stats': dict(self.stats),
+                      'project': [], 'account': [], 'spreadsheet': []}
+            for (scope, key, kind), window in sorted(self._windows.items()):
+                used = window.used(now, self.window)
+                entry = {'key': key, 'kind': kind, 'used': used, 'limit': window.limit,
+                         'headroom': max(window.limit - used, 0)}
+                if scope == 'account':
+                    entry['cooldown_seconds'] = round(max(self._cooldowns.get(key, now) - now, 0.0), 1)
+                result[scope].append(entry)
+            return result
+
+
+# 프로세스 전체에서 공유하는 할당량 관리자 (스케줄러 작업, 웹 요청)
+quota_accountant = QuotaAccountant()
@@ -0,0 +1,124 @@
+"""
+Google Sheets API HTTP 전송 모듈
+googleapiclient 기본 전송(httplib2)은 연결 풀이 없고 스레드 안전하지 않아
+스케줄러 작업마다 서비스를 새로 만들어야 합니다.
+이 모듈은 google-auth의 AuthorizedSession(requests, 연결 풀)으로 같은 인터페이스를 구현해
+인증 파일별로 하나의 세션을 모든 스레드가 공유하게 합니다.
+
+- SheetsHandler.connect()가 기본으로 사용 (SHEETS_TRANSPORT=httplib2로 기존 전송 사용 가능)
+- 토큰 갱신은 AuthorizedSession이 요청 시 처리
+"""
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+from google.auth.transport.requests import AuthorizedSession
+from google.oauth2 import service_account
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# 전송 방식 이름
+TRANSPORT_SESSION = 'session'     # AuthorizedSession + 연결 풀 (스레드 공유)
+TRANSPORT_HTTPLIB2 = 'httplib2'   # googleapiclient 기본 전송 (연결마다 생성)
+
+# 연결 풀 크기 (스케줄러 작업 스레드 + 웹 요청 스레드)
+POOL_SIZE = 10
+# 요청 타임아웃 (초)
+REQUEST_TIMEOUT = 60
+
+# 인증 파일별 공유 전송: {(인증 파일 경로, 스코프): PooledHttp}
+_shared_http: Dict[Tuple[str, Tuple[str, ...]], 'PooledHttp'] = {}
+_shared_http_lock = threading.Lock()
+
+
+class _Response(dict):
+    """httplib2.Response 호환 응답 헤더 (소문자 키 딕셔너리 + status/reason 속성)"""
+
+    def __init__(self, response):
+        super().__init__((key.lower(), value) for key, value in response.headers.items())
+        self.status = response.status_code
+        self.reason = response.reason
+        self.version = 11
+        self['status'] = str(response.status_code)
+
+
+class PooledHttp:
+    """
+    googleapiclient가 사용하는 http.request() 인터페이스를 AuthorizedSession으로 구현
+
+    requests 세션의 연결 풀(HTTPAdapter)은 스레드 안전하므로 여러 스레드가
+    같은 PooledHttp(와 이를 쓰는 서비스 객체)를 동시에 사용할 수 있습니다.
+    """
+
+    def __init__(self, credentials, pool_size: int = POOL_SIZE, timeout: float = REQUEST_TIMEOUT):
+        """
+        Args:
+            credentials: google-auth 인증 정보
+            pool_size: 호스트당 최대 연결 수
+            timeout: 요청 타임아웃 (초)
+        """
+        self.credentials = credentials
+        self.timeout = timeout
+        self.session = AuthorizedSession(credentials)
+
+        # 재시도는 googleapiclient(num_retries)가 담당하므로 어댑터는 재시도하지 않음
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(self, uri, method='GET', body=None, headers=None, redirections=None, connection_type=None):
+        """
+        httplib2.Http.request 호환 요청
+
+        Returns:
+            Tuple[_Response, bytes]: (응답 헤더, 응답 본문)
+        """
+        response = self.session.request(method, uri, data=body, headers=headers, timeout=self.timeout)
+        return _Response(response), response.content
+
+    def close(self):
+        """연결 풀 닫기"""
+        self.session.close()
+
+
+def get_shared_http(credentials_path: str, scopes: Tuple[str, ...], pool_size: int = POOL_SIZE) -> PooledHttp:
+    """
+    인증 파일별로 공유하는 연결 풀 전송 (처음 요청할 때 인증 파일을 읽어 생성)
+
+    Args:
+        credentials_path: 서비스 계정 JSON 키 파일 경로
+        scopes: API 스코프
+        pool_size: 호스트당 최대 연결 수
+
+    Returns:
+        PooledHttp: 공유 전송
+
+    Raises:
+        FileNotFoundError: 인증 파일이 없는 경우
+    """
+    key = (str(credentials_path), tuple(scopes))
+
+    with _shared_http_lock:
+        http = _shared_http.get(key)
+        if http is None:
+            credentials = service_account.Credentials.from_service_account_file(
+                credentials_path,
+                scopes=list(scopes)
+            )
+            http = _shared_http[key] = PooledHttp(credentials, pool_size=pool_size)
+            logger.debug("Sheets 연결 풀 생성: %s (최대 %s개)", credentials_path, pool_size)
+
+    return http
+
+
+def close_shared_http(credentials_path: Optional[str] = None):
+    """
+    공유 전송 닫기 (인증 파일 교체 시 해당 파일만, None이면 전체)
+
+    Args:
+        credentials_path: 인증 파일 경로
+    """
+    with _shared_http_lock:
+        for key in [key for key in _shared_http if credentials_path is None or key[0] == str(credentials_path)]:
+            _shared_http.pop(key).close()
@@ -0,0 +1,179 @@
+"""
+스프레드시트별 쓰기 직렬화 모듈
+수동 출석 체크(/api/run-attendance)와 스케줄러 출석 집계, 같은 스프레드시트를 쓰는 여러 워크스페이스가
+동시에 batchUpdate를 보내면 요청 순서가 뒤섞여 나중에 계산한 값이 먼저 쓴 값에 덮이는 일이 생깁니다.
+이 모듈은 스프레드시트마다 한 번에 한 쓰기만 보내고, 그동안 들어온 쓰기들은 모아서
+다음 batchUpdate 한 번으로 보냅니다 (그룹 커밋).
+
+- 별도 스레드 없음: 대기열이 비어 있을 때 들어온 호출자가 쓰기 담당이 되어 보냄
+- 쓰기 담당은 최대 MAX_LEADER_ROUNDS번만 보내고, 남은 쓰기가 있으면 가장 먼저 기다린 호출자에게 넘김
+  (계속 쓰기가 들어와도 한 호출자가 끝없이 붙잡히지 않음)
+- 같은 셀은 나중에 들어온 쓰기 값으로 합침 (들어온 순서 = 시트에 반영되는 순서)
+- 인증 파일이 다른 쓰기는 같은 순서 안에서 인증 파일별로 따로 보냄
+- 보낼 때는 호출자의 핸들러가 아니라 대기열이 인증 파일별로 가진 전송용 핸들러를 사용
+"""
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 쓰기 담당 한 명이 연달아 보내는 최대 횟수 (대기열을 비우는 횟수)
+MAX_LEADER_ROUNDS = 4
+
+# 스프레드시트별 쓰기 대기열: {스프레드시트 ID: SpreadsheetWriteQueue}
+_queues: Dict[str, 'SpreadsheetWriteQueue'] = {}
+_queues_lock = threading.Lock()
+
+
+class _WriteRequest:
+    """대기 중인 쓰기 하나 (호출자는 wake가 설정될 때까지 대기, lead면 쓰기 담당을 넘겨받은 것)"""
+
+    __slots__ = ('handler', 'data', 'target', 'wake', 'lead', 'updated', 'failures', 'error')
+
+    def __init__(self, handler, data: List[Dict], target: str):
+        self.handler = handler
+        self.data = data
+        self.target = target
+        self.wake = threading.Event()
+        self.lead = False
+        self.updated = 0
+        self.failures: List[Dict] = []
+        self.error: Optional[BaseException] = None
+
+
+class SpreadsheetWriteQueue:
+    """스프레드시트 하나의 단일 쓰기 대기열"""
+
+    def __init__(self, spreadsheet_id: str):
+        self.spreadsheet_id = spreadsheet_id
+        self._lock = threading.Lock()
+        self._queue: List[_WriteRequest] = []
+        self._writing = False
+        # 인증 파일별 전송용 핸들러 (쓰기 담당만 사용하므로 잠금 없음)
+        self._senders: Dict[str, object] = {}
+        self.stats = {'requests': 0, 'batches': 0, 'merged': 0, 'handoffs': 0}
+
+    def submit(self, handler, data: List[Dict], target: str) -> Tuple[int, List[Dict]]:
+        """
+        쓰기 제출 후 시트에 반영될 때까지 대기
+
+        Args:
+            handler: 쓰기를 요청한 SheetsHandler (인증 파일별 전송용 핸들러를 처음 만들 때만 사용)
+            data: values.batchUpdate data ([{'range', 'values'}, ...])
+            target: 로그용 대상
+
+        Returns:
+            Tuple[int, List[Dict]]: (업데이트된 셀 수, 실패한 셀 [{'range', 'status', 'reason'}])
+
+        Raises:
+            Exception: 전송 중 오류 (연결 끊김, 할당량 대기 초과 등)
+        """
+        request = _WriteRequest(handler, data, target)
+
+        with self._lock:
+            self._queue.append(request)
+            self.stats['requests'] += 1
+            leader = not self._writing
+            self._writing = True
+
+        if leader:
+            self._drain()
+        request.wake.wait()
+        # 앞선 쓰기 담당이 넘겨준 경우 (자기 쓰기는 아직 대기열에 있음)
+        if request.lead:
+            request.lead = False
+            request.wake.clear()
+            self._drain()
+            request.wake.wait()
+
+        if request.error is not None:
+            raise request.error
+        return request.updated, request.failures
+
+    def _drain(self):
+        """
+        대기열을 모아서 보내기 (쓰기 담당 호출자의 스레드에서 실행)
+
+        MAX_LEADER_ROUNDS번 보낸 뒤에도 쓰기가 남아 있으면 가장 먼저 들어온 대기 호출자를 쓰기 담당으로 깨움
+        """
+        for _ in range(MAX_LEADER_ROUNDS):
+            with self._lock:
+                requests, self._queue = self._queue, []
+                if not requests:
+                    self._writing = False
+                    return
+
+            # 인증 파일별로 묶되 들어온 순서 유지
+            groups: Dict[str, List[_WriteRequest]] = {}
+            for request in requests:
+                groups.setdefault(str(request.handler.credentials_path), []).append(request)
+            for group in groups.values():
+                self._write_group(group)
+
+        with self._lock:
+            if not self._queue:
+                self._writing = False
+                return
+            successor = self._queue[0]
+            self.stats['handoffs'] += 1
+        successor.lead = True
+        successor.wake.set()
+
+    def _sender(self, handler):
+        """인증 파일별 전송용 핸들러 (없거나 연결이 없으면 요청한 핸들러로 새로 만듦)"""
+        key = str(handler.credentials_path)
+        sender = self._senders.get(key)
+        if sender is None or sender.service is None:
+            sender = self._senders[key] = handler.write_sender()
+        return sender
+
+    def _write_group(self, requests: List[_WriteRequest]):
+        """같은 인증 파일의 쓰기들을 한 번의 batchUpdate로 합쳐 보내고 결과 나눠 주기"""
+        merged: Dict[str, Dict] = {}
+        owners: Dict[str, _WriteRequest] = {}
+        for request in requests:
+            for entry in request.data:
+                merged[entry['range']] = entry
+                owners[entry['range']] = request
+
+        handler = self._sender(requests[0].handler)
+        target = requests[0].target if len(requests) == 1 else f"{requests[0].target} 외 {len(requests) - 1}건"
+        if len(requests) > 1:
+            logger.debug("[쓰기 대기열] %s건 합쳐서 전송: %s셀", len(requests), len(merged))
+
+        try:
+            handler.last_write_failures = []
+            handler._send_batch(list(merged.values()), target)
+            failures = list(handler.last_write_failures)
+        except Exception as e:
+            for request in requests:
+                request.error = e
+                request.wake.set()
+            return
+
+        failed = {}
+        for failure in failures:
+            failed[failure['range']] = failure
+            owner = owners.get(failure['range'])
+            if owner is not None:
+                owner.failures.append(failure)
+
+        # 나중 쓰기로 대체된 셀은 대체한 쓰기의 결과로 셈
+        for cell_range, owner in owners.items():
+            if cell_range not in failed:
+                owner.updated += 1
+
+        self.stats['batches'] += 1
+        self.stats['merged'] += len(requests) - 1
+        for request in requests:
+            request.wake.set()
+
+
+def write_queue(spreadsheet_id: str) -> SpreadsheetWriteQueue:
+    """스프레드시트별 공유 쓰기 대기열 (없으면 생성)"""
+    with _queues_lock:
+        queue = _queues.get(spreadsheet_id)
+        if queue is None:
+            queue = _queues[spreadsheet_id] = SpreadsheetWriteQueue(spreadsheet_id)
+        return queue
@@ -2,12 +2,29 @@
 Slack API 처리 모듈
 출석체크 스레드의 댓글을 수집하고 사용자 정보를 가져옵니다.
 """
+import logging
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Callable
+from pathlib import Path
+import sys
 import time
 import re
 
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.records import Reply
+
+logger = logging.getLogger(__name__)
+
+
+# 댓글 선택 정책 (파서가 REPLY_POLICY로 선언)
+REPLY_POLICY_ALL = 'all'            # 모든 댓글 사용
+REPLY_POLICY_FIRST = 'first'        # 사용자별 첫 댓글만 사용
+REPLY_POLICY_DISTINCT = 'distinct'  # 사용자별로 같은 내용의 댓글은 한 번만 사용
+
 
 class SlackHandler:
     """Slack API를 처리하는 클래스"""
@@ -53,12 +70,12 @@ class SlackHandler:
         """
         try:
             response = self.client.auth_test()
-            print(f"✓ Slack 연결 성공!")
-            print(f"  - Bot 이름: {response['user']}")
-            print(f"  - 팀: {response['team']}")
+            logger.info("✓ Slack 연결 성공!")
+            logger.info("  - Bot 이름: %s", response['user'])
+            logger.info("  - 팀: %s", response['team'])
             return True
         except SlackApiError as e:
-            print(f"✗ Slack 연결 실패: {e.response['error']}")
+            logger.error("✗ Slack 연결 실패: %s", e.response['error'])
             return False
 
     def get_thread_replies(self, channel_id: str, thread_ts: str) -> List[Dict]:
@@ -73,9 +90,9 @@ class SlackHandler:
             List[Dict]: 댓글 리스트 (원본 메시지 제외)
         """
         try:
-            print(f"\n[Slack] 스레드 댓글 수집 중...")
-            print(f"  - Channel: {channel_id}")
-            print(f"  - Thread TS: {thread_ts}")
+            logger.info("\n[Slack] 스레드 댓글 수집 중...")
+            logger.info("  - Channel: %s", channel_id)
+            logger.info("  - Thread TS: %s", thread_ts)
 
             response = self.client.conversations_replies(
                 channel=channel_id,
@@ -91,21 +108,21 @@ class SlackHandler:
             # 첫 번째 메시지는 원본 메시지이므로 제외
             replies = messages[1:] if len(messages) > 1 else []
 
-            print(f"✓ 댓글 수집 완료: {len(replies)}개")
+            logger.info("✓ 댓글 수집 완료: %s개", len(replies))
 
             return replies
 
         except SlackApiError as e:
             error_msg = e.response.get('error', 'unknown')
             error_detail = e.response.get('needed', '')
-            print(f"✗ 댓글 가져오기 실패: {error_msg}")
+            logger.error("✗ 댓글 가져오기 실패: %s", error_msg)
             if error_detail:
-                print(f"  필요한 권한: {error_detail}")
+                logger.info("  필요한 권한: %s", error_detail)
             if error_msg == 'thread_not_found':
-                print(f"  → Thread TS가 해당 채널에 존재하지 않습니다.")
-                print(f"  → Bot이 채널에 초대되어 있는지 확인하세요.")
-                print(f"  → 스레드가 삭제되었거나 URL이 댓글 URL일 수 있습니다.")
-            print(f"  전체 응답: {e.response}")
+                logger.info("  → Thread TS가 해당 채널에 존재하지 않습니다.")
+                logger.info("  → Bot이 채널에 초대되어 있는지 확인하세요.")
+                logger.info("  → 스레드가 삭제되었거나 URL이 댓글 URL일 수 있습니다.")
+            logger.info("  전체 응답: %s", e.response)
             return []
 
     def get_user_info(self, user_id: str) -> Optional[Dict]:
@@ -145,50 +162,189 @@ class SlackHandler:
             return user_info
 
         except SlackApiError as e:
-            print(f"✗ 사용자 정보 가져오기 실패 ({user_id}): {e.response['error']}")
+            logger.error("✗ 사용자 정보 가져오기 실패 (%s): %s", user_id, e.response['error'])
             return None
 
-    def get_replies_with_user_info(self, channel_id: str, thread_ts: str) -> List[Dict]:
+    def get_channel_members(self, channel_id: str) -> List[str]:
+        """
+        채널 멤버 User ID 목록 가져오기 (conversations.members, 페이지 단위)
+
+        Args:
+            channel_id (str): 채널 ID
+
+        Returns:
+            List[str]: 멤버 User ID 리스트 (실패 시 빈 리스트)
+        """
+        members = []
+        cursor = None
+
+        try:
+            while True:
+                response = self.client.conversations_members(
+                    channel=channel_id,
+                    limit=1000,
+                    cursor=cursor
+                )
+
+                members.extend(response.get('members', []))
+
+                cursor = response.get('response_metadata', {}).get('next_cursor')
+                if not cursor:
+                    break
+
+            logger.info("✓ 채널 멤버 수집 완료: %s명", len(members))
+            return members
+
+        except SlackApiError as e:
+            logger.error("✗ 채널 멤버 가져오기 실패: %s", e.response['error'])
+            return []
+
+    def get_all_users(self) -> Dict[str, Dict]:
+        """
+        워크스페이스 전체 사용자 정보를 한 번에 가져오기 (users.list, 페이지 단위)
+
+        사용자별 users.info 호출 대신 사용하며, 결과는 사용자 정보 캐시에도 저장됩니다.
+        삭제된 사용자와 봇은 제외합니다.
+
+        Returns:
+            Dict[str, Dict]: {User ID: 사용자 정보}
+        """
+        users = {}
+        cursor = None
+
+        try:
+            while True:
+                response = self.client.users_list(limit=1000, cursor=cursor)
+
+                for user in response.get('members', []):
+                    if user.get('deleted') or user.get('is_bot') or user.get('id') == 'USLACKBOT':
+                        continue
+
+                    user_info = {
+                        'id': user['id'],
+                        'name': user.get('name', ''),
+                        'real_name': user.get('real_name', ''),
+                        'display_name': user.get('profile', {}).get('display_name', ''),
+                    }
+                    users[user['id']] = user_info
+                    self.user_cache[user['id']] = user_info
+
+                cursor = response.get('response_metadata', {}).get('next_cursor')
+                if not cursor:
+                    break
+
+            logger.info("✓ 사용자 목록 수집 완료: %s명", len(users))
+            return users
+
+        except SlackApiError as e:
+            logger.error("✗ 사용자 목록 가져오기 실패: %s", e.response['error'])
+            return users
+
+    @staticmethod
+    def select_replies(
+        replies: List[Dict],
+        reply_policy: str = REPLY_POLICY_ALL,
+        reply_filter: Optional[Callable[[str], bool]] = None
+    ) -> List[Dict]:
+        """
+        사용자 정보 수집 전에 파싱에 필요한 댓글만 선택 (원래 순서 유지, 한 번 순회)
+
+        Args:
+            replies (List[Dict]): 원본 댓글 리스트
+            reply_policy (str): 댓글 선택 정책 (REPLY_POLICY_*)
+            reply_filter (Callable): 파싱 대상 댓글인지 판별하는 함수 (None이면 모두 대상)
+
+        Returns:
+            List[Dict]: 선택된 댓글 리스트 (Bot 메시지 제외)
+        """
+        selected = []
+        seen = set()
+
+        for reply in replies:
+            # Bot 메시지 제외
+            if reply.get('bot_id'):
+                continue
+
+            text = reply.get('text', '')
+            if reply_filter is not None and not reply_filter(text):
+                continue
+
+            user_id = reply.get('user')
+            if user_id and reply_policy != REPLY_POLICY_ALL:
+                key = user_id if reply_policy == REPLY_POLICY_FIRST else (user_id, text)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+            selected.append(reply)
+
+        return selected
+
+    def get_replies_with_user_info(
+        self,
+        channel_id: str,
+        thread_ts: str,
+        reply_policy: str = REPLY_POLICY_ALL,
+        reply_filter: Optional[Callable[[str], bool]] = None
+    ) -> List[Reply]:
         """
         스레드 댓글과 사용자 정보를 함께 가져오기
 
         Args:
             channel_id (str): 채널 ID
             thread_ts (str): 스레드 타임스탬프
+            reply_policy (str): 댓글 선택 정책 (파서의 REPLY_POLICY)
+            reply_filter (Callable): 파싱 대상 댓글 판별 함수 (파서의 is_candidate_reply)
 
         Returns:
-            List[Dict]: 댓글 + 사용자 정보 리스트
+            List[Reply]: 댓글 + 사용자 정보 리스트 (user_info는 캐시된 딕셔너리를 공유)
         """
         replies = self.get_thread_replies(channel_id, thread_ts)
 
         if not replies:
             return []
 
-        print(f"\n[Slack] 사용자 정보 수집 중...")
+        return self.enrich_replies(replies, reply_policy, reply_filter)
+
+    def enrich_replies(
+        self,
+        replies: List[Dict],
+        reply_policy: str = REPLY_POLICY_ALL,
+        reply_filter: Optional[Callable[[str], bool]] = None
+    ) -> List[Reply]:
+        """
+        이미 가져온 원본 댓글에 사용자 정보 붙이기 (사용자 정보 캐시 공유)
+
+        같은 핸들러로 여러 스레드를 처리하면 두 스레드에 모두 댓글을 단 사용자는 한 번만 조회합니다.
+
+        Args:
+            replies (List[Dict]): get_thread_replies 결과
+            reply_policy (str): 댓글 선택 정책 (파서의 REPLY_POLICY)
+            reply_filter (Callable): 파싱 대상 댓글 판별 함수 (파서의 is_candidate_reply)
+
+        Returns:
+            List[Reply]: 댓글 + 사용자 정보 리스트
+        """
+        # 사용자별로 필요한 댓글만 남긴 뒤 사용자 정보 수집
+        selected_replies = self.select_replies(replies, reply_policy, reply_filter)
+
+        logger.info("\n[Slack] 사용자 정보 수집 중... (댓글 %s개 중 %s개 처리)", len(replies), len(selected_replies))
 
         enriched_replies = []
 
-        for reply in replies:
+        for reply in selected_replies:
             user_id = reply.get('user')
             text = reply.get('text', '')
             ts = reply.get('ts', '')
-
-            # Bot 메시지 제외
-            if reply.get('bot_id'):
-                continue
+            edited_ts = (reply.get('edited') or {}).get('ts', '')
 
             user_info = None
             if user_id:
                 user_info = self.get_user_info(user_id)
 
-            enriched_replies.append({
-                'user_id': user_id,
-                'user_info': user_info,
-                'text': text,
-                'timestamp': ts,
-            })
+            enriched_replies.append(Reply(text, user_id, user_info, ts, edited_ts))
 
-        print(f"✓ 사용자 정보 수집 완료: {len(enriched_replies)}개")
+        logger.info("✓ 사용자 정보 수집 완료: %s개", len(enriched_replies))
 
         return enriched_replies
 
@@ -209,12 +365,12 @@ class SlackHandler:
             keywords = ["출석 스레드", "출석체크", "출석"]
 
         try:
-            print(f"\n[Slack] 최신 출석체크 스레드 검색 중...")
-            print(f"  - 검색 키워드: {', '.join(keywords)}")
+            logger.info("\n[Slack] 최신 출석체크 스레드 검색 중...")
+            logger.info("  - 검색 키워드: %s", ', '.join(keywords))
             if bot_only:
-                print(f"  - 봇 메시지만 검색")
+                logger.info("  - 봇 메시지만 검색")
             else:
-                print(f"  - 봇 메시지 포함: {include_bot}")
+                logger.info("  - 봇 메시지 포함: %s", include_bot)
 
             # 최근 메시지 가져오기 (최대 100개)
             response = self.client.conversations_history(
@@ -242,9 +398,9 @@ class SlackHandler:
                 # 키워드 검색
                 for keyword in keywords:
                     if keyword.lower() in text:
-                        print(f"✓ 출석체크 스레드 발견!")
-                        print(f"  - 메시지: {message.get('text', '')[:100]}...")
-                        print(f"  - 작성자: {'봇' if message.get('bot_id') else '사용자'}")
+                        logger.info("✓ 출석체크 스레드 발견!")
+                        logger.info("  - 메시지: %s...", message.get('text', '')[:100])
+                        logger.info("  - 작성자: %s", '봇' if message.get('bot_id') else '사용자')
 
                         return {
                             'ts': message.get('ts'),
@@ -253,11 +409,11 @@ class SlackHandler:
                             'bot_id': message.get('bot_id'),
                         }
 
-            print("✗ 출석체크 스레드를 찾을 수 없습니다.")
+            logger.error("✗ 출석체크 스레드를 찾을 수 없습니다.")
             return None
 
         except SlackApiError as e:
-            print(f"✗ 메시지 검색 실패: {e.response['error']}")
+            logger.error("✗ 메시지 검색 실패: %s", e.response['error'])
             return None
 
     def get_user_id_by_email(self, email: str) -> Optional[str]:
@@ -275,14 +431,14 @@ class SlackHandler:
 
             if response['ok']:
                 user_id = response['user']['id']
-                print(f"✓ 이메일로 User ID 찾기 성공: {email} → {user_id}")
+                logger.info("✓ 이메일로 User ID 찾기 성공: %s → %s", email, user_id)
                 return user_id
             else:
-                print(f"✗ 이메일로 User ID 찾기 실패: {email}")
+                logger.error("✗ 이메일로 User ID 찾기 실패: %s", email)
                 return None
 
         except SlackApiError as e:
-            print(f"✗ 이메일로 User ID 찾기 실패: {e.response['error']}")
+            logger.error("✗ 이메일로 User ID 찾기 실패: %s", e.response['error'])
             return None
 
     def send_dm(self, user_id_or_email: str, message: str) -> bool:
@@ -301,18 +457,18 @@ class SlackHandler:
 
             # 이메일 형식이면 User ID로 변환
             if '@' in user_id_or_email:
-                print(f"[DM] 이메일 주소 감지: {user_id_or_email}")
+                logger.info("[DM] 이메일 주소 감지: %s", user_id_or_email)
                 user_id = self.get_user_id_by_email(user_id_or_email)
                 if not user_id:
-                    print(f"✗ DM 전송 실패: 이메일로 사용자를 찾을 수 없습니다 ({user_id_or_email})")
+                    logger.error("✗ DM 전송 실패: 이메일로 사용자를 찾을 수 없습니다 (%s)", user_id_or_email)
                     return False
 
             # 봇 자신인지 확인
             if user_id.startswith('B'):
-                print(f"✗ DM 전송 실패: 봇에게는 DM을 보낼 수 없습니다 (User ID: {user_id})")
+                logger.error("✗ DM 전송 실패: 봇에게는 DM을 보낼 수 없습니다 (User ID: %s)", user_id)
                 return False
 
-            print(f"[DM] User ID로 DM 전송 시도: {user_id}")
+            logger.info("[DM] User ID로 DM 전송 시도: %s", user_id)
 
             # DM 채널 열기
             response = self.client.conversations_open(users=[user_id])
@@ -329,14 +485,14 @@ class SlackHandler:
             )
 
             if response['ok']:
-                print(f"✓ DM 전송 성공")
+                logger.info("✓ DM 전송 성공")
                 return True
             else:
-                print(f"✗ DM 전송 실패")
+                logger.error("✗ DM 전송 실패")
                 return False
 
         except SlackApiError as e:
-            print(f"✗ DM 전송 실패: {e.response['error']}")
+            logger.error("✗ DM 전송 실패: %s", e.response['error'])
             return False
 
     def post_thread_reply(self, channel_id: str, thread_ts: str, message: str) -> bool:
@@ -362,14 +518,14 @@ class SlackHandler:
             )
 
             if response['ok']:
-                print(f"✓ 스레드 댓글 작성 성공")
+                logger.info("✓ 스레드 댓글 작성 성공")
                 return True
             else:
-                print(f"✗ 스레드 댓글 작성 실패")
+                logger.error("✗ 스레드 댓글 작성 실패")
                 return False
 
         except SlackApiError as e:
-            print(f"✗ 스레드 댓글 작성 실패: {e.response['error']}")
+            logger.error("✗ 스레드 댓글 작성 실패: %s", e.response['error'])
             return False
 
     def post_message(self, channel_id: str, message: str) -> Optional[Dict]:
@@ -393,18 +549,18 @@ class SlackHandler:
             )
 
             if response['ok']:
-                print(f"✓ 메시지 전송 성공")
+                logger.info("✓ 메시지 전송 성공")
                 return {
                     'ts': response['ts'],
                     'text': message,
                     'channel': channel_id
                 }
             else:
-                print(f"✗ 메시지 전송 실패")
+                logger.error("✗ 메시지 전송 실패")
                 return None
 
         except SlackApiError as e:
-            print(f"✗ 메시지 전송 실패: {e.response['error']}")
+            logger.error("✗ 메시지 전송 실패: %s", e.response['error'])
             return None
 
     def join_channel(self, channel_id: str) -> bool:
@@ -421,10 +577,10 @@ class SlackHandler:
             response = self.client.conversations_join(channel=channel_id)
 
             if response['ok']:
-                print(f"✓ 채널 참여 성공: {channel_id}")
+                logger.info("✓ 채널 참여 성공: %s", channel_id)
                 return True
             else:
-                print(f"✗ 채널 참여 실패")
+                logger.error("✗ 채널 참여 실패")
                 return False
 
         except SlackApiError as e:
@@ -432,32 +588,33 @@ class SlackHandler:
 
             # 이미 채널에 있는 경우
             if error == 'already_in_channel':
-                print(f"✓ 이미 채널에 참여 중: {channel_id}")
+                logger.info("✓ 이미 채널에 참여 중: %s", channel_id)
                 return True
 
             # 프라이빗 채널이거나 존재하지 않는 경우
             elif error == 'channel_not_found':
-                print(f"✗ 채널 참여 실패: 프라이빗 채널이거나 존재하지 않는 채널입니다")
-                print(f"  → 프라이빗 채널은 수동으로 봇을 초대해야 합니다")
+                logger.error("✗ 채널 참여 실패: 프라이빗 채널이거나 존재하지 않는 채널입니다")
+                logger.error("  → 프라이빗 채널은 수동으로 봇을 초대해야 합니다")
                 return False
 
             # 아카이브된 채널
             elif error == 'is_archived':
-                print(f"✗ 채널 참여 실패: 아카이브된 채널입니다")
+                logger.error("✗ 채널 참여 실패: 아카이브된 채널입니다")
                 return False
 
             # 권한 부족
             elif error == 'missing_scope':
-                print(f"✗ 채널 참여 실패: 'channels:join' 권한이 필요합니다")
-                print(f"  → Slack App 설정에서 'channels:join' scope를 추가하세요")
+                logger.error("✗ 채널 참여 실패: 'channels:join' 권한이 필요합니다")
+                logger.error("  → Slack App 설정에서 'channels:join' scope를 추가하세요")
                 return False
 
-            print(f"✗ 채널 참여 실패: {error}")
+            logger.error("✗ 채널 참여 실패: %s", error)
             return False
 
 
 # 테스트 코드
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     from config.settings import SLACK_BOT_TOKEN, SLACK_CHANNEL_ID, SLACK_THREAD_TS
 
     if not SLACK_BOT_TOKEN:
@@ -475,6 +632,6 @@ if __name__ == '__main__':
                 replies = handler.get_replies_with_user_info(SLACK_CHANNEL_ID, SLACK_THREAD_TS)
                 print(f"\n가져온 댓글 샘플 (최대 3개):")
                 for i, reply in enumerate(replies[:3], 1):
-                    user_info = reply['user_info']
+                    user_info = reply.user_info
                     name = user_info.get('real_name', '알 수 없음') if user_info else '알 수 없음'
-                    print(f"  {i}. {name}: {reply['text'][:50]}...")
+                    print(f"  {i}. {name}: {reply.text[:50]}...")
@@ -0,0 +1,318 @@
+"""
+이름 로마자 표기 인덱스 모듈
+학생 명단의 한글 이름을 자주 쓰이는 로마자 표기로 변환해 두고,
+슬랙 표시 이름이 영문("Gildong Hong")인 경우 명단 이름("홍길동")을 찾습니다.
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+
+# 한글 음절 분해 상수 (유니코드 조합형)
+HANGUL_BASE = 0xAC00
+HANGUL_END = 0xD7A3
+MEDIAL_COUNT = 21
+FINAL_COUNT = 28
+
+# 국어의 로마자 표기법 (음절 단위, 이름 표기 관례에 따라 초성 ㄹ은 r)
+INITIALS = [
+    'g', 'kk', 'n', 'd', 'tt', 'r', 'm', 'b', 'pp', 's',
+    'ss', '', 'j', 'jj', 'ch', 'k', 't', 'p', 'h',
+]
+MEDIALS = [
+    'a', 'ae', 'ya', 'yae', 'eo', 'e', 'yeo', 'ye', 'o', 'wa',
+    'wae', 'oe', 'yo', 'u', 'wo', 'we', 'wi', 'yu', 'eu', 'ui', 'i',
+]
+FINALS = [
+    '', 'k', 'k', 'k', 'n', 'n', 'n', 't', 'l', 'k',
+    'm', 'l', 'l', 'l', 'p', 'l', 'm', 'p', 'p', 't',
+    't', 'ng', 't', 't', 'k', 't', 'p', 't',
+]
+
+# 두 글자 성씨
+COMPOUND_SURNAMES = {'남궁', '제갈', '선우', '황보', '독고', '사공', '서문', '동방', '어금'}
+
+# 표기법과 다르게 굳어진 성씨 표기 (규칙 변환 결과는 자동으로 함께 등록됨)
+SURNAME_VARIANTS = {
+    '김': ['kim', 'gim'],
+    '이': ['lee', 'yi', 'rhee', 'rhie', 'ri', 'li'],
+    '박': ['park', 'pak', 'bak'],
+    '최': ['choi', 'choe', 'chey'],
+    '정': ['jung', 'jeong', 'chung', 'cheong'],
+    '강': ['kang', 'gang'],
+    '조': ['cho', 'jo'],
+    '윤': ['yoon', 'yun', 'youn'],
+    '장': ['jang', 'chang'],
+    '임': ['lim', 'im', 'rim', 'yim'],
+    '한': ['han'],
+    '오': ['oh', 'o'],
+    '서': ['seo', 'suh', 'so'],
+    '신': ['shin', 'sin'],
+    '권': ['kwon', 'gwon'],
+    '황': ['hwang'],
+    '안': ['ahn', 'an'],
+    '송': ['song'],
+    '류': ['ryu', 'yoo', 'yu', 'ryoo', 'lyu'],
+    '유': ['yoo', 'yu', 'you'],
+    '홍': ['hong'],
+    '전': ['jeon', 'jun', 'chun', 'jeun'],
+    '고': ['ko', 'go', 'koh'],
+    '문': ['moon', 'mun'],
+    '양': ['yang', 'ryang'],
+    '손': ['son', 'sohn'],
+    '배': ['bae', 'pae'],
+    '백': ['baek', 'paik', 'baik', 'paek'],
+    '허': ['heo', 'huh', 'hur'],
+    '노': ['noh', 'no', 'roh', 'ro'],
+    '남': ['nam'],
+    '심': ['shim', 'sim'],
+    '하': ['ha'],
+    '곽': ['kwak', 'gwak'],
+    '성': ['sung', 'seong'],
+    '차': ['cha'],
+    '주': ['joo', 'ju', 'choo'],
+    '우': ['woo', 'u'],
+    '구': ['koo', 'gu', 'ku'],
+    '나': ['na', 'ra'],
+    '민': ['min'],
+    '진': ['jin', 'chin'],
+    '지': ['ji', 'chi'],
+    '엄': ['eom', 'um', 'uhm'],
+    '채': ['chae'],
+    '원': ['won'],
+    '천': ['cheon', 'chun'],
+    '방': ['bang'],
+    '공': ['kong', 'gong'],
+    '현': ['hyun', 'hyeon'],
+    '함': ['ham'],
+    '변': ['byun', 'byeon', 'pyun'],
+    '염': ['yeom', 'yum'],
+    '여': ['yeo', 'yuh'],
+    '추': ['choo', 'chu'],
+    '도': ['do', 'doh'],
+    '석': ['seok', 'suk'],
+    '선': ['sun', 'seon'],
+    '설': ['seol', 'sul'],
+    '길': ['gil', 'kil'],
+    '연': ['yeon', 'yun'],
+    '표': ['pyo'],
+    '명': ['myung', 'myeong'],
+    '기': ['ki', 'gi'],
+    '금': ['keum', 'geum'],
+    '육': ['yuk', 'yook'],
+    '국': ['kook', 'guk'],
+    '남궁': ['namgoong', 'namkung', 'namgung'],
+    '제갈': ['jegal'],
+    '선우': ['sunwoo', 'seonu'],
+    '황보': ['hwangbo'],
+}
+
+# 비교 키 정규화 규칙 (표기 흔들림을 같은 키로 모음)
+# 순서가 중요합니다: 다중 문자 규칙을 먼저 적용합니다.
+_FOLD_RULES = [
+    ('sh', 's'),
+    ('ch', 'j'),
+    ('ee', 'i'),
+    ('oo', 'u'),
+    ('eo', 'u'),
+    ('eu', 'u'),
+    ('ou', 'u'),
+    ('ui', 'i'),
+    ('k', 'g'),
+    ('t', 'd'),
+    ('p', 'b'),
+    ('r', 'l'),
+]
+_NON_ALPHA = re.compile(r'[^a-z]')
+_NAME_SUFFIX = re.compile(r'[/_(]')
+_REPEATED = re.compile(r'(.)\1+')
+
+
+def is_hangul(text: str) -> bool:
+    """
+    텍스트가 한글 음절로만 이루어져 있는지 확인
+
+    Args:
+        text (str): 확인할 텍스트
+
+    Returns:
+        bool: 한글 음절로만 구성되면 True
+    """
+    return bool(text) and all(HANGUL_BASE <= ord(ch) <= HANGUL_END for ch in text)
+
+
+def romanize(text: str) -> str:
+    """
+    한글 음절을 국어의 로마자 표기법으로 변환 (음절 단위, 음운 변화 미적용)
+
+    Args:
+        text (str): 한글 텍스트 (예: "길동")
+
+    Returns:
+        str: 로마자 표기 (예: "gildong"), 한글이 아닌 문자는 그대로 유지
+    """
+    result = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_END:
+            offset = code - HANGUL_BASE
+            initial = offset // (MEDIAL_COUNT * FINAL_COUNT)
+            medial = (offset % (MEDIAL_COUNT * FINAL_COUNT)) // FINAL_COUNT
+            final = offset % FINAL_COUNT
+            result.append(INITIALS[initial] + MEDIALS[medial] + FINALS[final])
+        else:
+            result.append(ch)
+    return ''.join(result)
+
+
+def fold_key(text: str) -> str:
+    """
+    로마자 이름을 비교용 키로 정규화
+
+    대소문자, 공백/하이픈, 흔한 표기 흔들림(eo/u, oo/u, k/g, r/l 등)을 하나로 모읍니다.
+
+    Args:
+        text (str): 로마자 이름 (예: "Gil-dong Hong")
+
+    Returns:
+        str: 비교 키 (예: "gildonghong")
+    """
+    key = _NON_ALPHA.sub('', text.lower())
+    for src, dst in _FOLD_RULES:
+        key = key.replace(src, dst)
+    return _REPEATED.sub(r'\1', key)
+
+
+def split_korean_name(name: str) -> List[str]:
+    """
+    한글 이름을 [성, 이름]으로 분리
+
+    Args:
+        name (str): 한글 이름 (예: "홍길동", "남궁민수")
+
+    Returns:
+        List[str]: [성, 이름] (분리할 수 없으면 [이름])
+    """
+    if len(name) >= 4 and name[:2] in COMPOUND_SURNAMES:
+        return [name[:2], name[2:]]
+    if len(name) >= 2:
+        return [name[:1], name[1:]]
+    return [name]
+
+
+def romanized_keys(name: str) -> Set[str]:
+    """
+    한글 이름 하나에 대해 흔히 쓰이는 로마자 표기의 비교 키 집합 생성 (성-이름, 이름-성 양쪽 순서)
+
+    Args:
+        name (str): 한글 이름 (예: "홍길동")
+
+    Returns:
+        Set[str]: 비교 키 집합 (예: {"hongildong", "gildonghong"})
+    """
+    parts = split_korean_name(name)
+    if len(parts) < 2:
+        key = fold_key(romanize(name))
+        return {key} if key else set()
+
+    surname, given = parts
+    given_roman = romanize(given)
+    surname_romans = {romanize(surname)}
+    surname_romans.update(SURNAME_VARIANTS.get(surname, []))
+
+    keys = set()
+    for surname_roman in surname_romans:
+        keys.add(fold_key(surname_roman + given_roman))
+        keys.add(fold_key(given_roman + surname_roman))
+    return keys
+
+
+class TransliterationIndex:
+    """명단 이름의 로마자 표기 → 명단 이름 역색인 (명단당 한 번 생성, O(1) 조회)"""
+
+    def __init__(self, names: Iterable[str]):
+        """
+        Args:
+            names: 학생 명단 이름들 (예: students.keys())
+        """
+        self._index: Dict[str, Optional[str]] = {}
+
+        for name in names:
+            if is_hangul(name):
+                keys = romanized_keys(name)
+            else:
+                # 명단에 영문 이름이 있는 경우: 단어 순서만 양방향으로 등록
+                words = name.split()
+                keys = {fold_key(name), fold_key(' '.join(reversed(words)))}
+
+            for key in keys:
+                if not key:
+                    continue
+                existing = self._index.get(key, name)
+                # 서로 다른 명단 이름이 같은 키를 가지면 모호하므로 매칭하지 않음
+                self._index[key] = name if existing == name else None
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def lookup(self, display_name: str) -> Optional[str]:
+        """
+        로마자 표시 이름으로 명단 이름 찾기
+
+        Args:
+            display_name (str): 슬랙 표시 이름 (예: "Gildong Hong", "hong gil-dong")
+
+        Returns:
+            Optional[str]: 명단의 한글 이름, 없거나 모호하면 None
+        """
+        if not display_name:
+            return None
+
+        key = fold_key(display_name)
+        if not key:
+            return None
+
+        return self._index.get(key)
+
+    def lookup_profile(self, user_info: Optional[Dict]) -> Optional[str]:
+        """
+        슬랙 프로필(display_name → real_name 순)로 명단 이름 찾기
+
+        "Gildong Hong/컴공"처럼 뒤에 붙은 소속 정보는 제외하고 비교합니다.
+
+        Args:
+            user_info (Optional[Dict]): 슬랙 사용자 정보
+
+        Returns:
+            Optional[str]: 명단의 한글 이름, 없거나 모호하면 None
+        """
+        if not user_info:
+            return None
+
+        for field in ('display_name', 'real_name'):
+            value = user_info.get(field) or ''
+            name = self.lookup(_NAME_SUFFIX.split(value, 1)[0])
+            if name:
+                return name
+
+        return None
+
+
+# 테스트 코드
+if __name__ == '__main__':
+    index = TransliterationIndex(['홍길동', '김철수', '이영희', '남궁민수', '정성훈', '정승훈'])
+
+    test_cases = [
+        'Gildong Hong',
+        'Hong Gil-dong',
+        'Kil Dong Hong',
+        'Cheolsu Kim',
+        'Younghee Lee',
+        'Minsu Namgoong',
+        'Sunghoon Jung',
+        'John Smith',
+    ]
+
+    print("=== 로마자 표기 매칭 테스트 ===")
+    print(f"  색인 키 수: {len(index)}")
+    for display_name in test_cases:
+        print(f"  {display_name} → {index.lookup(display_name)}")
@@ -3,6 +3,8 @@
 from .workspace_helper import validate_workspace_name, safe_path_join
 from .error_handler import safe_error_response
 from .common import (
+    setup_logger,
+    parse_module_levels,
     parse_slack_thread_link,
     column_letter_to_index,
     column_index_to_letter,
@@ -13,6 +15,8 @@ __all__ = [
     'validate_workspace_name',
     'safe_path_join',
     'safe_error_response',
+    'setup_logger',
+    'parse_module_levels',
     'parse_slack_thread_link',
     'column_letter_to_index',
     'column_index_to_letter',
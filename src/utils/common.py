@@ -4,18 +4,48 @@
 """
 import logging
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 
 
-def setup_logger(log_file: Path = None, console_level=logging.INFO):
+# src 패키지 모듈 로거의 상위 로거 이름 (각 모듈은 logging.getLogger(__name__) 사용)
+PACKAGE_LOGGER = 'src'
+
+
+def parse_module_levels(spec: str) -> Dict[str, str]:
+    """
+    모듈별 로그 레벨 문자열 파싱
+
+    Args:
+        spec (str): "parser=DEBUG,slack_handler=WARNING" 형태 (환경 변수 LOG_LEVELS 등)
+
+    Returns:
+        Dict[str, str]: {모듈 이름: 레벨 이름}
+    """
+    levels = {}
+    for item in (spec or '').split(','):
+        if '=' not in item:
+            continue
+        module, level = item.split('=', 1)
+        if module.strip() and level.strip():
+            levels[module.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logger(log_file: Path = None, console_level=logging.INFO,
+                 module_levels: Optional[Dict[str, Union[int, str]]] = None):
     """
     로거 설정
 
+    'attendance' 로거와 src 패키지 모듈 로거(src.parser, src.slack_handler 등)에 같은 핸들러를 연결합니다.
+    댓글/셀 단위 로그는 DEBUG 레벨이라 기본 설정에서는 포맷팅 없이 건너뜁니다.
+
     Args:
         log_file (Path): 로그 파일 경로
         console_level: 콘솔 로그 레벨
+        module_levels (Dict): 모듈별 로그 레벨 (예: {'parser': 'DEBUG'}), 'src.' 접두사 생략 가능
 
     Returns:
         logging.Logger: 설정된 로거
@@ -26,8 +56,8 @@ def setup_logger(log_file: Path = None, console_level=logging.INFO):
     # 기존 핸들러 제거
     logger.handlers.clear()
 
-    # 콘솔 핸들러
-    console_handler = logging.StreamHandler()
+    # 콘솔 핸들러 (기존 print와 같이 stdout으로 출력)
+    console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(console_level)
     console_formatter = logging.Formatter(
         '%(message)s'
@@ -40,12 +70,26 @@ def setup_logger(log_file: Path = None, console_level=logging.INFO):
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
-            '%(asctime)s [%(levelname)s] %(message)s',
+            '%(asctime)s [%(levelname)s] %(name)s: %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
         logger.addHandler(file_handler)
 
+    # src 패키지 모듈 로거: 같은 핸들러 사용, 기본 레벨 INFO (DEBUG 로그는 인자 포맷팅 전에 걸러짐)
+    package_logger = logging.getLogger(PACKAGE_LOGGER)
+    package_logger.handlers = list(logger.handlers)
+    package_logger.setLevel(logging.INFO)
+    package_logger.propagate = False
+
+    # 모듈별 레벨 (예: parser만 DEBUG로 댓글 단위 로그 확인)
+    for module, level in (module_levels or {}).items():
+        name = module if module.startswith(PACKAGE_LOGGER + '.') else f'{PACKAGE_LOGGER}.{module}'
+        module_logger = logging.getLogger(name)
+        module_logger.setLevel(level)
+        # 콘솔 레벨보다 낮게 지정한 모듈 로그도 콘솔에 보이도록
+        console_handler.setLevel(min(console_handler.level, module_logger.level))
+
     return logger
 
 
@@ -154,12 +198,17 @@ def parse_slack_thread_link(link_or_ts: str) -> Optional[str]:
     return None
 
 
+# 시트 최대 열 (Google Sheets 18,278열 = ZZZ)
+MAX_COLUMN_LETTERS = 3
+MAX_COLUMNS = 26 + 26 ** 2 + 26 ** 3
+
+
 def column_letter_to_index(letter: str) -> Optional[int]:
     """
-    열 문자를 인덱스로 변환 (A -> 0, B -> 1, ..., Z -> 25)
+    열 문자를 인덱스로 변환 (A -> 0, ..., Z -> 25, AA -> 26, ..., ZZZ -> 18277)
 
     Args:
-        letter (str): 열 문자 (A-Z, 대소문자 구분 없음)
+        letter (str): 열 문자 (A-ZZZ, 대소문자 구분 없음)
 
     Returns:
         Optional[int]: 열 인덱스 (0-based), 잘못된 입력 시 None
@@ -169,16 +218,19 @@ def column_letter_to_index(letter: str) -> Optional[int]:
 
     letter = letter.strip().upper()
 
-    # 단일 문자 검증 (A-Z)
-    if len(letter) == 1 and 'A' <= letter <= 'Z':
-        return ord(letter) - ord('A')
+    # 1~3자리 알파벳 검증 (A-ZZZ)
+    if not 1 <= len(letter) <= MAX_COLUMN_LETTERS or not all('A' <= char <= 'Z' for char in letter):
+        return None
 
-    return None
+    index = 0
+    for char in letter:
+        index = index * 26 + (ord(char) - ord('A') + 1)
+    return index - 1
 
 
 def column_index_to_letter(index: int) -> Optional[str]:
     """
-    열 인덱스를 문자로 변환 (0 -> A, 1 -> B, ..., 25 -> Z)
+    열 인덱스를 문자로 변환 (0 -> A, ..., 25 -> Z, 26 -> AA, ..., 18277 -> ZZZ)
 
     Args:
         index (int): 열 인덱스 (0-based)
@@ -186,10 +238,15 @@ def column_index_to_letter(index: int) -> Optional[str]:
     Returns:
         Optional[str]: 열 문자, 범위 벗어나면 None
     """
-    if not isinstance(index, int) or index < 0 or index > 25:
+    if not isinstance(index, int) or index < 0 or index >= MAX_COLUMNS:
         return None
 
-    return chr(ord('A') + index)
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
 
 
 def get_next_column(current_column: str, start_column: str, end_column: str) -> str:
@@ -265,3 +322,5 @@ if __name__ == '__main__':
     print(f"  A -> {column_letter_to_index('A')}")  # 0
     print(f"  10 -> {column_index_to_letter(10)}")  # K
     print(f"  7 -> {column_index_to_letter(7)}")   # H
+    print(f"  AB -> {column_letter_to_index('AB')}")  # 27
+    print(f"  27 -> {column_index_to_letter(27)}")  # AB
@@ -2,9 +2,26 @@
 워크스페이스 관리자
 여러 슬랙 워크스페이스 설정을 관리하는 모듈
 """
+import logging
 import json
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.parser import DuplicateNameIndex
+from src.parser_profile import ParserProfile, compile_profile
+from src.roster_index import compile_aliases
+from src.utils.common import column_letter_to_index
+
+logger = logging.getLogger(__name__)
+
+# 컴파일된 동명이인 색인 캐시: {config.json 경로: (수정 시각, 색인)}
+# WorkspaceConfig는 요청마다 새로 만들어지므로 모듈 단위로 공유합니다.
+_duplicate_index_cache: Dict[str, Tuple[int, DuplicateNameIndex]] = {}
 
 
 class WorkspaceConfig:
@@ -34,6 +51,9 @@ class WorkspaceConfig:
         if not self.config_file.exists():
             raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {self.config_file}")
 
+        # 읽기 직전의 수정 시각 (컴파일된 설정 캐시 키)
+        self._config_mtime = self.config_file.stat().st_mtime_ns
+
         with open(self.config_file, 'r', encoding='utf-8') as f:
             return json.load(f)
 
@@ -50,13 +70,13 @@ class WorkspaceConfig:
         if 'auto_schedule' not in self._config:
             self._config['auto_schedule'] = {}
             changed = True
-            print(f"✓ [{self.display_name}] auto_schedule 필드 추가됨")
+            logger.info("✓ [%s] auto_schedule 필드 추가됨", self.display_name)
 
         # 2. duplicate_names가 없으면 빈 딕셔너리로 초기화
         if 'duplicate_names' not in self._config:
             self._config['duplicate_names'] = {}
             changed = True
-            print(f"✓ [{self.display_name}] duplicate_names 필드 추가됨")
+            logger.info("✓ [%s] duplicate_names 필드 추가됨", self.display_name)
 
         return changed
 
@@ -133,11 +153,9 @@ class WorkspaceConfig:
         """이름 열 인덱스 (0-based)"""
         col = self._config['name_column']
 
-        # 문자열 (A, B 등)이면 숫자로 변환
-        if isinstance(col, str):
-            col = col.strip().upper()
-            if len(col) == 1 and 'A' <= col <= 'Z':
-                return ord(col) - ord('A')
+        # 문자열 (A, B, AB 등)이면 숫자로 변환
+        if isinstance(col, str) and column_letter_to_index(col) is not None:
+            return column_letter_to_index(col)
 
         # 이미 숫자면 그대로 반환
         return int(col)
@@ -151,10 +169,8 @@ class WorkspaceConfig:
         """과제 시트 이름 열 (기본값: name_column과 동일)"""
         col = self._config.get('assignment_name_column', self._config['name_column'])
 
-        if isinstance(col, str):
-            col = col.strip().upper()
-            if len(col) == 1 and 'A' <= col <= 'Z':
-                return ord(col) - ord('A')
+        if isinstance(col, str) and column_letter_to_index(col) is not None:
+            return column_letter_to_index(col)
 
         return int(col)
 
@@ -182,6 +198,46 @@ class WorkspaceConfig:
         """동명이인 관리 설정"""
         return self._config.get('duplicate_names', {})
 
+    @property
+    def duplicate_name_index(self) -> DuplicateNameIndex:
+        """
+        컴파일된 동명이인 색인 (config.json 수정 시각 기준으로 캐시)
+
+        설정이 바뀌지 않았으면 여러 실행에서 같은 색인을 재사용합니다.
+        """
+        cache_key = str(self.config_file)
+        cached = _duplicate_index_cache.get(cache_key)
+
+        if cached and cached[0] == self._config_mtime:
+            return cached[1]
+
+        index = DuplicateNameIndex(self.duplicate_names or {})
+        _duplicate_index_cache[cache_key] = (self._config_mtime, index)
+        return index
+
+    @property
+    def name_aliases(self) -> Dict[str, str]:
+        """
+        명단 이름 별칭 (config.json의 name_aliases: {별칭: 명단 이름}, 조회용으로 컴파일)
+
+        댓글·슬랙 이름이 명단 이름과 다르게 쓰이는 학생용 (예: {"Gildong": "홍길동"})
+        """
+        return compile_aliases(self._config.get('name_aliases'))
+
+    @property
+    def parser_profile(self) -> ParserProfile:
+        """
+        컴파일된 출석 파서 프로필 (config.json의 parser_profile, 없으면 기본 "이름/출석" 형식)
+
+        프로필 내용의 해시로 캐시되므로 스케줄러와 라우트가 같은 컴파일 결과를 공유합니다.
+        설정이 잘못되었으면 기본 프로필을 사용합니다.
+        """
+        try:
+            return compile_profile(self._config.get('parser_profile'))
+        except ValueError as e:
+            logger.error("✗ [%s] parser_profile 설정 오류, 기본 프로필 사용: %s", self.name, e)
+            return compile_profile()
+
     def save_schedule(self, schedule: Dict) -> bool:
         """
         스케줄 설정 저장
@@ -200,7 +256,7 @@ class WorkspaceConfig:
 
             return True
         except Exception as e:
-            print(f"✗ 스케줄 저장 실패: {e}")
+            logger.error("✗ 스케줄 저장 실패: %s", e)
             return False
 
     def save_last_thread_info(self, thread_ts: str, date: str, column: str) -> bool:
@@ -230,7 +286,7 @@ class WorkspaceConfig:
 
             return True
         except Exception as e:
-            print(f"✗ 스레드 정보 저장 실패: {e}")
+            logger.error("✗ 스레드 정보 저장 실패: %s", e)
             return False
 
     def get_last_thread_info(self) -> Optional[Dict]:
@@ -276,7 +332,7 @@ class WorkspaceManager:
                     if workspace.is_valid():
                         workspaces.append(workspace)
                 except Exception as e:
-                    print(f"⚠️ 워크스페이스 로드 실패 ({item.name}): {e}")
+                    logger.warning("⚠️ 워크스페이스 로드 실패 (%s): %s", item.name, e)
 
         # 이름순으로 정렬
         workspaces.sort(key=lambda x: x.display_name)
@@ -295,7 +351,7 @@ class WorkspaceManager:
             if workspace.is_valid():
                 return workspace
         except Exception as e:
-            print(f"⚠️ 워크스페이스 로드 실패 ({name}): {e}")
+            logger.warning("⚠️ 워크스페이스 로드 실패 (%s): %s", name, e)
 
         return None
 
@@ -312,6 +368,7 @@ class WorkspaceManager:
 
 # 테스트 코드
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     manager = WorkspaceManager()
 
     print("📁 사용 가능한 워크스페이스:")
@@ -0,0 +1,310 @@
+"""
+출석 셀 쓰기 지연(write-behind) 버퍼 모듈
+실시간·증분 출석 반영에서 셀을 바뀔 때마다 바로 쓰면 Sheets API 요청이 셀 수만큼 늘어납니다.
+이 버퍼는 셀 쓰기를 즉시 받아 (시트, 열)별로 모아 두고(같은 셀은 마지막 값만 남김)
+셀 수 또는 시간 기준을 넘으면 한 번의 batchUpdate로 씁니다.
+
+- 스프레드시트별 버퍼 하나 (get_write_behind, 스케줄러와 라우트가 공유), 셀은 (시트, 열, 행)으로 구분
+- 같은 스프레드시트를 쓰는 워크스페이스마다 시트가 다르므로 put/put_updates는 시트 이름을 받음
+- 읽기는 대기 중 → 쓰는 중 순으로 조회해 방금 넣은 값이 바로 보임 (read-your-writes)
+  쓰기가 끝난 셀은 시트에 반영되었으므로 보관하지 않음 (버퍼 메모리는 아직 쓰지 않은 셀 수만큼)
+- 일시적 오류(429, 5xx)로 실패한 셀은 다시 대기열에 넣고, 잘못된 범위 등은 failures에 기록
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.sheets_handler import SheetsHandler, AttendanceStatus
+from src.sheets_grid import cell_entry
+
+logger = logging.getLogger(__name__)
+
+# 이 셀 수 이상 모이면 바로 쓰기
+FLUSH_CELLS = 200
+# 첫 셀이 들어온 뒤 이 시간(초)이 지나면 쓰기
+FLUSH_SECONDS = 2.0
+# 보관할 최근 실패 셀 수
+FAILURES_SIZE = 200
+
+# 스프레드시트별 버퍼: {(인증 파일 경로, 스프레드시트 ID): WriteBehindBuffer}
+_buffers: Dict[Tuple[str, str], 'WriteBehindBuffer'] = {}
+_buffers_lock = threading.Lock()
+
+# (시트 이름, 열 인덱스) → {행: 값}
+Cells = Dict[Tuple[str, int], Dict[int, str]]
+
+
+class WriteBehindBuffer:
+    """스프레드시트 하나의 셀 쓰기를 모아 batchUpdate로 쓰는 버퍼 (백그라운드 스레드)"""
+
+    def __init__(
+        self,
+        credentials_path: str,
+        spreadsheet_id: str,
+        sheet_name: str = '출석현황',
+        flush_cells: int = FLUSH_CELLS,
+        flush_seconds: float = FLUSH_SECONDS,
+        handler: Optional[SheetsHandler] = None
+    ):
+        """
+        Args:
+            credentials_path: 서비스 계정 JSON 키 파일 경로
+            spreadsheet_id: 스프레드시트 ID
+            sheet_name: 기본 시트 이름 (put에서 시트를 지정하지 않을 때)
+            flush_cells: 이 셀 수 이상 모이면 쓰기
+            flush_seconds: 첫 셀이 들어온 뒤 이 시간(초)이 지나면 쓰기
+            handler: 쓰기에 사용할 핸들러 (None이면 버퍼 전용 핸들러 생성)
+        """
+        self.spreadsheet_id = spreadsheet_id
+        self.sheet_name = sheet_name
+        self.flush_cells = flush_cells
+        self.flush_seconds = flush_seconds
+        self.handler = handler or SheetsHandler(credentials_path, spreadsheet_id, sheet_name)
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        # 쓰기는 한 번에 하나 (쓰는 중 셀과 기록 완료 셀 순서 보장)
+        self._flush_lock = threading.Lock()
+
+        self._pending: Cells = {}
+        self._pending_count = 0
+        self._pending_since: Optional[float] = None
+        # 지금 쓰는 중인 셀 (쓰기가 끝나면 비움)
+        self._inflight: Cells = {}
+        self._closed = False
+
+        self.failures: Deque[Dict] = deque(maxlen=FAILURES_SIZE)
+        self.stats = {'puts': 0, 'coalesced': 0, 'flushes': 0, 'cells_written': 0, 'requeued': 0}
+
+        self._thread = threading.Thread(target=self._run, name=f'write-behind-{spreadsheet_id[:8]}', daemon=True)
+        self._thread.start()
+
+    # ==================== 쓰기 ====================
+
+    def put(self, row: int, column: int, value, sheet_name: Optional[str] = None):
+        """
+        셀 쓰기 등록 (즉시 반환, 같은 셀의 이전 대기 값은 덮어씀)
+
+        Args:
+            row: 행 번호 (0-based)
+            column: 열 인덱스 (0-based)
+            value: 기록할 값 (AttendanceStatus 또는 문자열, 빈 문자열이면 셀 비우기)
+            sheet_name: 시트 이름 (None이면 기본 시트)
+        """
+        value = value.value if isinstance(value, AttendanceStatus) else value
+        key = (sheet_name or self.sheet_name, column)
+
+        with self._changed:
+            if self._closed:
+                raise RuntimeError('닫힌 쓰기 버퍼입니다.')
+            cells = self._pending.setdefault(key, {})
+            if row in cells:
+                self.stats['coalesced'] += 1
+            else:
+                self._pending_count += 1
+            cells[row] = value
+            self.stats['puts'] += 1
+
+            if self._pending_since is None:
+                self._pending_since = time.monotonic()
+            if self._pending_count == 1 or self._pending_count >= self.flush_cells:
+                self._changed.notify()
+
+    def put_updates(self, updates: Iterable[Dict], sheet_name: Optional[str] = None) -> int:
+        """
+        batch_update_attendance 형식 업데이트 리스트 등록
+
+        Args:
+            updates: [{'row', 'column', 'status'}, ...]
+            sheet_name: 시트 이름 (None이면 기본 시트)
+
+        Returns:
+            int: 등록한 셀 수
+        """
+        count = 0
+        for update in updates:
+            row = update.get('row')
+            column = update.get('column')
+            if row is None or column is None:
+                continue
+            self.put(row, column, update.get('status', AttendanceStatus.PRESENT), sheet_name)
+            count += 1
+        return count
+
+    # ==================== 읽기 (read-your-writes) ====================
+
+    def get(self, row: int, column: int, sheet_name: Optional[str] = None) -> Optional[str]:
+        """
+        버퍼가 아직 쓰지 않은 셀 값 (대기 중 → 쓰는 중 순, 없으면 None: 시트 값을 읽을 것)
+
+        Args:
+            row: 행 번호 (0-based)
+            column: 열 인덱스 (0-based)
+            sheet_name: 시트 이름 (None이면 기본 시트)
+        """
+        key = (sheet_name or self.sheet_name, column)
+        with self._lock:
+            for cells in (self._pending, self._inflight):
+                column_cells = cells.get(key)
+                if column_cells is not None and row in column_cells:
+                    return column_cells[row]
+        return None
+
+    def column_snapshot(self, column: int, sheet_name: Optional[str] = None,
+                        base: Optional[Dict[int, str]] = None) -> Dict[int, str]:
+        """
+        열의 로컬 스냅샷 (시트에서 읽은 값 위에 아직 쓰지 않은 버퍼 값을 덮어씀)
+
+        Args:
+            column: 열 인덱스 (0-based)
+            sheet_name: 시트 이름 (None이면 기본 시트)
+            base: 시트에서 읽은 {행: 값} (없으면 버퍼 값만)
+
+        Returns:
+            Dict[int, str]: {행: 값}
+        """
+        key = (sheet_name or self.sheet_name, column)
+        snapshot = dict(base or {})
+        with self._lock:
+            for cells in (self._inflight, self._pending):
+                snapshot.update(cells.get(key, {}))
+        return snapshot
+
+    @property
+    def pending_count(self) -> int:
+        """쓰기 대기 중인 셀 수"""
+        return self._pending_count
+
+    # ==================== 쓰기 실행 ====================
+
+    def flush(self) -> int:
+        """
+        대기 중인 셀을 한 번의 batchUpdate로 쓰기 (호출한 스레드에서 실행)
+
+        Returns:
+            int: 업데이트된 셀 수
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._inflight = batch
+                self._pending_count = 0
+                self._pending_since = None
+
+            if not batch:
+                return 0
+
+            batch_data = []
+            cells_by_range = {}
+            for (sheet_name, column), cells in batch.items():
+                for row in cells:
+                    entry = cell_entry(sheet_name, row, column, cells[row])
+                    cells_by_range[entry['range']] = (sheet_name, column, row)
+                    batch_data.append(entry)
+
+            try:
+                if not self.handler.service and not self.handler.connect():
+                    raise ConnectionError('구글 시트 연결 실패')
+                updated_cells = self.handler._write_batch(batch_data, f"{self.sheet_name} (지연 쓰기)")
+                failures = self.handler.last_write_failures
+            except Exception as e:
+                logger.error("✗ 지연 쓰기 실패 (%s셀), 다시 대기: %s", len(batch_data), e)
+                self._finish(batch, cells_by_range, requeue_all=True)
+                return 0
+
+            self._finish(batch, cells_by_range, failures)
+            self.stats['flushes'] += 1
+            self.stats['cells_written'] += updated_cells
+            logger.debug("[지연 쓰기] %s셀 기록, 실패 %s셀", updated_cells, len(failures))
+            return updated_cells
+
+    def _finish(self, batch: Cells, cells_by_range: Dict[str, Tuple[str, int, int]],
+                failures: List[Dict] = (), requeue_all: bool = False):
+        """
+        쓰기 결과 반영
+
+        일시적 오류(또는 requeue_all)로 실패한 셀은 그 사이 같은 셀에 새 값이 들어오지 않았으면
+        다시 대기열에 넣습니다. 쓰는 중 셀은 같은 잠금 안에서 비우므로 읽기에서 값이 사라지는 틈이 없습니다.
+        """
+        retry = set(cells_by_range) if requeue_all else set()
+        for failure in failures:
+            if failure.get('status') in SheetsHandler.RETRYABLE_STATUSES:
+                retry.add(failure['range'])
+            else:
+                self.failures.append(failure)
+
+        with self._changed:
+            for cell_range in retry:
+                sheet_name, column, row = cells_by_range[cell_range]
+                pending = self._pending.setdefault((sheet_name, column), {})
+                if row not in pending:
+                    pending[row] = batch[(sheet_name, column)][row]
+                    self._pending_count += 1
+                    self.stats['requeued'] += 1
+
+            if self._pending_count and self._pending_since is None:
+                self._pending_since = time.monotonic()
+            self._inflight = {}
+
+    def _run(self):
+        """백그라운드 쓰기 스레드 (셀 수 또는 시간 기준)"""
+        while True:
+            with self._changed:
+                while not self._closed:
+                    if self._pending_count >= self.flush_cells:
+                        break
+                    if self._pending_since is not None:
+                        remaining = self._pending_since + self.flush_seconds - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._changed.wait(remaining)
+                    else:
+                        self._changed.wait()
+                if self._closed:
+                    return
+            self.flush()
+
+    def close(self):
+        """남은 셀을 쓰고 백그라운드 스레드 종료"""
+        with self._changed:
+            self._closed = True
+            self._changed.notify()
+        self._thread.join(timeout=5)
+        self.flush()
+
+
+def get_write_behind(credentials_path: str, spreadsheet_id: str, sheet_name: str = '출석현황') -> WriteBehindBuffer:
+    """
+    스프레드시트별 공유 쓰기 버퍼 (없으면 생성)
+
+    Args:
+        credentials_path: 서비스 계정 JSON 키 파일 경로
+        spreadsheet_id: 스프레드시트 ID
+        sheet_name: 기본 시트 이름
+
+    Returns:
+        WriteBehindBuffer: 공유 버퍼
+    """
+    key = (str(credentials_path), spreadsheet_id)
+    with _buffers_lock:
+        buffer = _buffers.get(key)
+        if buffer is None:
+            buffer = _buffers[key] = WriteBehindBuffer(credentials_path, spreadsheet_id, sheet_name)
+        return buffer
+
+
+def close_all():
+    """모든 쓰기 버퍼의 남은 셀 쓰기 (앱 종료 시)"""
+    with _buffers_lock:
+        buffers = list(_buffers.values())
+        _buffers.clear()
+    for buffer in buffers:
+        buffer.close()
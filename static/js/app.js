@@ -2298,11 +2298,11 @@ const validationRules = {
         message: 'Channel ID는 C로 시작해야 합니다.'
     },
     'column-input': {
-        validate: (value) => /^[A-Z]{1,2}$/i.test(value),
+        validate: (value) => /^[A-Z]{1,3}$/i.test(value),
         message: '올바른 열 이름을 입력하세요 (예: H, K, AB)'
     },
     'assignment-column': {
-        validate: (value) => /^[A-Z]{1,2}$/i.test(value),
+        validate: (value) => /^[A-Z]{1,3}$/i.test(value),
         message: '올바른 열 이름을 입력하세요 (예: D, E, AA)'
     }
 };